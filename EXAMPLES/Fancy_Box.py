@@ -1,5 +1,6 @@
 from topway import LM19264
 from topway.font import Aclonica_size12 as font12
+from topway.text import text_width
 
 
 lcd = LM19264(
@@ -22,9 +23,8 @@ start_y = 0
 hor_l_to_r = 0
 vert_t_to_b = 270
 
-# Iterate over each character in the formatted string and call the font's `get_ch()` function to get a tuple
-# that contains the character's width
-empty_width = sum([r[2] + 1 for r in [font12.get_ch(c) for c in text]]) + 4
+# Measure how far the text moves the cursor (glyph widths plus the 1px spacing after each character)
+empty_width = text_width(font12, text) + 4
 print(f'[DEBUG] empty characters pixel width: {empty_width}')
 
 # (x, y, angle_deg, length)
@@ -43,7 +43,8 @@ block_size = 1
 loop = 0
 while True:
     random_bytes = draw_block_pattern(driver=lcd, block_size=block_size)
-    lcd.display()
+    # The pattern is drawn with raw `pixel()` calls, which the driver doesn't track, so send the whole frame.
+    lcd.display(full=True)
 
     if loop >= 5:
         loop = 0
@@ -1,4 +1,4 @@
-from topway import LM19264
+from topway import LM19264, Canvas
 from topway.font import Aclonica_size12 as font12
 from topway.font import Aclonica_size24 as font24
 from topway.font import Aclonica_size36 as font36
@@ -262,7 +262,9 @@ lcd.initialize()
 
 width = 192
 height = 64
-bitmap = [[0 for _ in range(width)] for _ in range(height)]
+# A packed canvas (1536 bytes) instead of a 64×192 list of lists; the driver methods draw on it in place and
+# `pack_bitmap()` just hands back its buffer.
+bitmap = Canvas()
 
 # Set up an initial "waiting for Wi-Fi" message, then clear once the offset has been updated.
 # But first, an adorable icon is displayed along with the text, uwu.
@@ -291,7 +293,8 @@ last_written_wday = ''
 # 720 5-second increments is 1 hour
 while True:
     if UPDATED_OFFSET:
-        bitmap = [[0 for _ in range(width)] for _ in range(height)]
+        # Reuse the same buffer every frame instead of allocating a new bitmap.
+        bitmap.clear()
 
         # Get the current local time based on UTC offset
         year, month, day, hour, minute, sec, wday, _ = get_local_time(utc_offset_seconds=UTC_OFFSET_SEC)
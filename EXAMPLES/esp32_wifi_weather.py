@@ -1,16 +1,20 @@
-from topway import LM19264
+from topway import LM19264, Canvas
+from topway.icons import IconAtlas
+from topway.sprites import SpriteCache
+from topway.fonts import FontRegistry
+from topway.text import text_width
 # from topway.fonts import FONT_5x7
-# from topway.font import CourierNew_size12 as font12
-from topway.font import Aclonica_size12 as font12
-from topway.font import Aclonica_size24 as font24
-from topway.font import Aclonica_size36 as font36
-import json
 import ntptime
 import time
 import os
 import urequests
 from wifi_manager import WifiManager
 
+# Fonts are imported the first time they're drawn with rather than at startup, which leaves more memory for the
+# Wi-Fi connection, and wrapped with a flat glyph index so drawing a character is a table lookup instead of a binary
+# search. Pass `budget=` to unload fonts that haven't been used recently when memory is tight.
+FONTS = FontRegistry(indexed=True)
+
 # Tested on:
 # - MicroPython v1.26.1; LOLIN_S2_MINI
 
@@ -49,9 +53,11 @@ MONTHS = ["January", "February", "March", "April", "May", "June", "July", "Augus
 # https://openweathermap.org/weather-conditions
 #
 # I downloaded SVGs and converted them to PNGs (in Python using `cairosvg`) and then resized them to 32px and converted
-# those to bitmap arrays (in Python using `Pillow` and `numpy`) then stored the bitmap arrays in .json files. I copied
-# the .json files do the ESP32 filesystem under `/weather/64` (I created directories for multiple sizes); for example,
-# the icon `forecast-weather-sun-sunny-hot-summer` is stored in `/weather/64/forecast-weather-sun-sunny-hot-summer.json`.
+# those to bitmap arrays (in Python using `Pillow` and `numpy`) then stored the bitmap arrays in .json files. The .json
+# files are packed into a single run-length compressed atlas with `tools/build_atlas.py --rle` (`weather/64.atlas`,
+# about 180 bytes per icon instead of 512, plus a small index), so an icon can be read straight into a buffer without
+# opening a file per icon. Copy the atlas to the ESP32 filesystem as `/weather/64.atlas` (build one atlas per icon
+# size); icons are looked up by name, for example `forecast-weather-sun-sunny-hot-summer`.
 ICON_MAP = {
     "01": {  # clear sky
         "d": "forecast-weather-sun-sunny-hot-summer",
@@ -338,7 +344,9 @@ lcd.initialize()
 
 width = 192
 height = 64
-bitmap = [[0 for _ in range(width)] for _ in range(height)]
+# A packed canvas (1536 bytes) instead of a 64×192 list of lists; the driver methods draw on it in place and
+# `pack_bitmap()` just hands back its buffer.
+bitmap = Canvas()
 
 # Set up an initial "waiting for Wi-Fi" message, then clear once the offset has been updated.
 # But first, an adorable icon is displayed along with the text, uwu.
@@ -346,8 +354,8 @@ img = [[0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0,
 
 bitmap = lcd.overlay_bitmap(base_bitmap=bitmap, overlay_bitmap=img, x=0, y=0, mode="or")
 
-bitmap = lcd.draw_text(bitmap=bitmap, text="WAITING", x=95, y=15, font_map=font12)
-bitmap = lcd.draw_text(bitmap=bitmap, text="FOR WIFI", x=95, y=35, font_map=font12)
+bitmap = lcd.draw_text(bitmap=bitmap, text="WAITING", x=95, y=15, font_map=FONTS.get("Aclonica", 12))
+bitmap = lcd.draw_text(bitmap=bitmap, text="FOR WIFI", x=95, y=35, font_map=FONTS.get("Aclonica", 12))
 
 packed = lcd.pack_bitmap(bitmap=bitmap)
 
@@ -360,8 +368,10 @@ WifiManager.setup_network()
 # If we cleared the base display after Wi-Fi is connected, the initial state is false.
 did_clear = False
 
-# Only read from the filesystem if the icon changes
-last_icon = ''
+# The atlas stays open, and the last few icons (512 bytes each) are kept in memory, so switching between day and
+# night or rain and clouds doesn't read from the filesystem again.
+icons = SpriteCache(budget=4096, loader=IconAtlas("/weather/64.atlas").load)
+icon = None
 humidity = ''
 
 # Only update the weather every 5 minutes to save on API calls.
@@ -369,7 +379,8 @@ wx_update_counter = 0
 wx_initial_load = False
 while True:
     if UPDATED_OFFSET:
-        bitmap = [[0 for _ in range(width)] for _ in range(height)]
+        # Reuse the same buffer every frame instead of allocating a new bitmap.
+        bitmap.clear()
 
         # Only update the weather every 5 minutes to save on API calls.
         wx_update_counter += 1
@@ -385,33 +396,32 @@ while True:
             display_icon, temp, humidity = get_weather_data(city=WX_CITY, units=WX_UNITS)
             wx_update_counter = 0
 
-            # Load the icon bitmap from the filesystem and display it, but only if it's different from the previous
-            # iteration and a valid value was returned.
-            if display_icon != last_icon and display_icon is not None:
-                print(f"[INFO] updating weather icon: {display_icon}")
-                with open(f"/weather/64/{display_icon}.json", 'r') as f:
-                    icon_bitmap = json.loads(f.read())
-                last_icon = display_icon
+            # Get the icon from the cache, which only reads it from the filesystem the first time it's needed, but
+            # only if a valid value was returned.
+            if display_icon is not None:
+                icon = icons.get(display_icon)
+                print(f"[DEBUG] icon cache: {icons.hits} hits, {icons.misses} misses, {icons.evictions} evictions")
 
-        bitmap = lcd.overlay_bitmap(base_bitmap=bitmap, overlay_bitmap=icon_bitmap, x=0, y=0, mode="or")
+        if icon is not None:
+            icon_buffer, icon_width, icon_height = icon
+            bitmap.blit(icon_buffer, icon_width, icon_height, x=0, y=0)
 
         # Assign the formatted string to a variable, so we call it multiple times without going through the
         # extra steps of string formatting.
         temp_formatted = f"{temp:.1f}"
         # Write the temp to the display
-        bitmap = lcd.draw_text(bitmap=bitmap, text=temp_formatted, x=67, y=0, font_map=font24)
+        bitmap = lcd.draw_text(bitmap=bitmap, text=temp_formatted, x=67, y=0, font_map=FONTS.get("Aclonica", 24))
 
-        # Iterate over each character in the formatted string and call the font's `get_ch()` function to get a tuple
-        # that contains the character's width
-        temp_chars_width = sum([r[2] for r in [font24.get_ch(c) for c in temp_formatted]])
+        # Sum the character widths from the font's width table (no spacing, the degree symbol gets its own buffer)
+        temp_chars_width = text_width(FONTS.get("Aclonica", 24), temp_formatted, spacing=0)
         print(f'[DEBUG] temperature characters pixel width: {temp_chars_width}')
 
         # Take the temperature's X start point and add the character width plus a buffer
         deg_cursor_pos = 67 + temp_chars_width + 4
 
         # Not all font maps contain the degree symbols
-        # bitmap = lcd.draw_text(bitmap=bitmap, text=chr(248), x=deg_cursor_pos, y=0, font_map=font12)
-        # bitmap = lcd.draw_text(bitmap=bitmap, text="°", x=deg_cursor_pos, y=0, font_map=font12)
+        # bitmap = lcd.draw_text(bitmap=bitmap, text=chr(248), x=deg_cursor_pos, y=0, font_map=FONTS.get("Aclonica", 12))
+        # bitmap = lcd.draw_text(bitmap=bitmap, text="°", x=deg_cursor_pos, y=0, font_map=FONTS.get("Aclonica", 12))
 
         unit = "?"  # default unit to ? for the weather API "standard" unit -- I didn't research to what it was.
         if WX_UNITS == "metric":
@@ -419,18 +429,17 @@ while True:
         elif WX_UNITS == "imperial":
             unit = "F"
         # Align the unit right below the degree symbol.
-        bitmap = lcd.draw_text(bitmap=bitmap, text=unit, x=deg_cursor_pos, y=9, font_map=font12)
+        bitmap = lcd.draw_text(bitmap=bitmap, text=unit, x=deg_cursor_pos, y=9, font_map=FONTS.get("Aclonica", 12))
 
         # Now for humidity
         humidity_formatted = f"{humidity}%"
 
-        # Iterate over each character in the formatted string and call the font's `get_ch()` function to get a tuple
-        # that contains the character's width
-        humidity_chars_width = sum([r[2] for r in [font24.get_ch(c) for c in humidity_formatted]])
+        # Sum the character widths from the font's width table
+        humidity_chars_width = text_width(FONTS.get("Aclonica", 24), humidity_formatted, spacing=0)
         print(f'[DEBUG] humidity characters pixel width: {humidity_chars_width}')
 
         # Set the start position with the display with minus the character width and buffer
-        bitmap = lcd.draw_text(bitmap=bitmap, text=humidity_formatted, x=width - humidity_chars_width - 5, y=2, font_map=font24)
+        bitmap = lcd.draw_text(bitmap=bitmap, text=humidity_formatted, x=width - humidity_chars_width - 5, y=2, font_map=FONTS.get("Aclonica", 24))
 
         # Create a box big enough for the humidity
         bitmap = lcd.draw_graphic_box(bitmap=bitmap, x=width - humidity_chars_width - 8, y=0, width=humidity_chars_width + 8, height=25, radius=5, fill=False)
@@ -440,7 +449,7 @@ while True:
         formatted_time_str = f"{lt[3]:02}:{lt[4]:02}"
         print(f"[INFO] sending time: {formatted_time_str}")
 
-        bitmap = lcd.draw_text(bitmap=bitmap, text=formatted_time_str, x=67, y=32, font_map=font36)
+        bitmap = lcd.draw_text(bitmap=bitmap, text=formatted_time_str, x=67, y=32, font_map=FONTS.get("Aclonica", 36))
 
         packed = lcd.pack_bitmap(bitmap=bitmap)
         lcd.display_bitmap(bitmap=packed)
@@ -0,0 +1,27 @@
+"""
+Lets the benchmark scripts import the drivers under CPython by installing the stand-ins from the `host` package at
+the repository root (see `host/__init__.py`).
+
+When the scripts run on a MicroPython board the real modules are used and nothing is patched.
+"""
+import sys
+
+
+def install() -> bool:
+    """
+    Make the repository root importable and install the `host` stand-ins, if the script is not running on
+    MicroPython.
+
+    :return: True if the stand-ins were installed (running on the host).
+    :rtype: bool
+    """
+    if sys.implementation.name == "micropython":
+        return False
+
+    import os
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+    import host
+    return host.install()
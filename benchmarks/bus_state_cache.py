@@ -0,0 +1,107 @@
+"""
+Count control pin (CSA/CSB/RS/RW) writes for a full-frame flush with and without the bus's cached pin levels.
+
+The uncached run calls `invalidate()` before every bus access, which drives the pins exactly like the old code did.
+Every latched byte is recorded in both runs (chip select, RS, RW and data at the E pulse) to check that skipping
+unchanged pins never changes what the controllers see.
+
+    $ python benchmarks/bus_state_cache.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+_host.install()
+
+from topway import LM19264
+
+
+class RecordingPin:
+    """Wraps the E pin and records the bus state every time a byte is latched."""
+
+    def __init__(self, pin, bus):
+        self.pin = pin
+        self.bus = bus
+        self.latched = []
+
+    def on(self) -> None:
+        bus = self.bus
+        self.latched.append((bus.csa.value(), bus.csb.value(), bus.rs.value(), bus.rw.value(), bus.get_data()))
+        self.pin.on()
+
+    def off(self) -> None:
+        self.pin.off()
+
+    def value(self, *args):
+        return self.pin.value(*args)
+
+
+class UncachedBus:
+    """Forgets the cached levels before every access, like a bus without state caching."""
+
+    def __init__(self, bus):
+        self.bus = bus
+
+    def __getattr__(self, name):
+        attr = getattr(self.bus, name)
+        if name in ("select", "write", "write_data", "read"):
+            def call(*args):
+                self.bus.invalidate()
+                return attr(*args)
+            return call
+        return attr
+
+
+def per_column_flush(lcd: LM19264, frame: bytearray) -> None:
+    """The original flush: set the column before every data byte."""
+    for page in range(8):
+        for region in range(3):
+            lcd.do_select_chip(region)
+            lcd.set_page(page)
+            for col in range(64):
+                lcd.set_column(col)
+                lcd.send_data(frame[(region * 64) + col + (page * 192)])
+
+
+def flush(lcd: LM19264, frame: bytearray, method) -> tuple[int, int, list]:
+    bus = lcd.bus if not isinstance(lcd.bus, UncachedBus) else lcd.bus.bus
+    recorder = RecordingPin(bus.e, bus)
+    bus.e = recorder
+    # Start both runs from the same known pin and controller state
+    lcd.init_pins()
+    lcd.invalidate_address()
+    writes_before = bus.control_writes
+    skipped_before = bus.control_writes_skipped
+
+    method(lcd, frame)
+
+    bus.e = recorder.pin
+    return bus.control_writes - writes_before, bus.control_writes_skipped - skipped_before, recorder.latched
+
+
+lcd = LM19264(
+    db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1,  # DB7–DB0
+    e=9, rw=10, rs=11, csa=13, csb=12, rstb=14
+)
+frame = bytearray((i * 37) & 0xFF for i in range(lcd.width * 8))
+
+failures = 0
+for name, method in (("streamed runs", LM19264.display_bitmap), ("per-column", per_column_flush)):
+    cached_writes, _, cached_latched = flush(lcd, frame, method)
+
+    bus = lcd.bus
+    lcd.bus = UncachedBus(bus)
+    uncached_writes, _, uncached_latched = flush(lcd, frame, method)
+    lcd.bus = bus
+
+    saved = uncached_writes - cached_writes
+    print(f"{name:<14} control pin writes: {uncached_writes:>5} uncached, {cached_writes:>5} cached, "
+          f"saved {saved} ({100 * saved / uncached_writes:.1f}%)")
+
+    if cached_latched != uncached_latched:
+        failures += 1
+        print(f"FAIL {name}: latched bytes differ between the cached and uncached bus")
+
+print("OK" if not failures else f"{failures} failures")
+raise SystemExit(1 if failures else 0)
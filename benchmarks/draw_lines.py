@@ -0,0 +1,62 @@
+"""
+Time a clock face (60 tick lines plus three hands) drawn with float trigonometry per pixel versus the integer line
+engine, and count how many pixels each one plots.
+
+    $ python benchmarks/draw_lines.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import math
+import time
+from topway import Canvas
+
+CX, CY, RADIUS = 96, 32, 30
+
+LINES = []
+for minute in range(60):
+    angle = 90 - minute * 6
+    length = 6 if minute % 5 == 0 else 3
+    rad = math.radians(angle)
+    LINES.append([int(round(CX + math.cos(rad) * (RADIUS - length))), int(round(CY - math.sin(rad) * (RADIUS - length))),
+                  angle, length])
+LINES += [[CX, CY, 90 - 10 * 30, 16], [CX, CY, 90 - 42 * 6, 24], [CX, CY, 90 - 17 * 6, 28]]
+
+
+def float_lines(canvas: Canvas, lines: list) -> int:
+    """The original loop: radians, cos and sin per line, a float multiply and round() per pixel."""
+    plotted = 0
+    for x0, y0, angle_deg, length in lines:
+        angle_rad = math.radians(angle_deg)
+        dx = math.cos(angle_rad)
+        dy = -math.sin(angle_rad)
+        for i in range(length):
+            canvas.pixel(int(round(x0 + dx * i)), int(round(y0 + dy * i)), 1)
+            plotted += 1
+    return plotted
+
+
+def measure(name: str, draw, repeat: int = 50) -> None:
+    start = time.ticks_us()
+    for _ in range(repeat):
+        draw()
+    elapsed = time.ticks_diff(time.ticks_us(), start) / repeat
+    print(f"{name:<16} {elapsed / 1000:8.3f}ms per clock face")
+
+
+float_canvas = Canvas()
+integer_canvas = Canvas()
+print(f"float loop plots {float_lines(float_canvas, LINES)} pixels")
+integer_canvas.draw_graphic_lines(LINES)
+differ = sum(bin(a ^ b).count("1") for a, b in zip(float_canvas.buffer, integer_canvas.buffer))
+print(f"integer engine plots {sum(bin(b).count('1') for b in integer_canvas.buffer)} distinct pixels, "
+      f"{differ} differ from the float loop")
+
+measure("float", lambda: float_lines(float_canvas, LINES))
+measure("integer", lambda: integer_canvas.draw_graphic_lines(LINES))
+if ON_HOST:
+    print("(host run: timings reflect CPython)")
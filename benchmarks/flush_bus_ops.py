@@ -0,0 +1,77 @@
+"""
+Count bus writes (E pulses) for a full-frame flush, per-column addressing versus streamed runs.
+
+Runs on a board (real pins, with timings) or under CPython from the repository root:
+
+    $ python benchmarks/flush_bus_ops.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import time
+from topway import LM19264
+
+
+class CountingPin:
+    """Wraps a pin and counts how often it is driven high."""
+
+    def __init__(self, pin):
+        self.pin = pin
+        self.count = 0
+
+    def on(self) -> None:
+        self.count += 1
+        self.pin.on()
+
+    def off(self) -> None:
+        self.pin.off()
+
+    def value(self, *args):
+        return self.pin.value(*args)
+
+
+def count_bus_writes(lcd: LM19264) -> CountingPin:
+    """Count E pulses; every command or data byte latched into a controller is one pulse."""
+    counter = CountingPin(lcd.bus.e)
+    lcd.bus.e = counter
+    return counter
+
+
+def legacy_display_bitmap(lcd: LM19264, bitmap: bytearray) -> None:
+    """The original flush: set the column before every data byte."""
+    for page in range(8):
+        for region in range(3):
+            lcd.do_select_chip(region)
+            lcd.set_page(page)
+            for col in range(64):
+                lcd.set_column(col)
+                lcd.send_data(bitmap[(region * 64) + col + (page * 192)])
+
+
+def measure(name: str, lcd: LM19264, counter: CountingPin, flush) -> int:
+    counter.count = 0
+    start = time.ticks_us()
+    flush()
+    elapsed = time.ticks_diff(time.ticks_us(), start)
+    print(f"{name:<14} bus writes: {counter.count:>5}  elapsed: {elapsed / 1000:8.3f}ms")
+    return counter.count
+
+
+lcd = LM19264(
+    db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1,  # DB7–DB0
+    e=9, rw=10, rs=11, csa=13, csb=12, rstb=14
+)
+counter = count_bus_writes(lcd)
+
+frame = bytearray((i * 37) & 0xFF for i in range(lcd.width * 8))
+
+per_column = measure("per-column", lcd, counter, lambda: legacy_display_bitmap(lcd, frame))
+streamed = measure("streamed runs", lcd, counter, lambda: lcd.display_bitmap(frame))
+
+print(f"bus writes saved: {per_column - streamed} ({100 * (per_column - streamed) / per_column:.1f}%)")
+if ON_HOST:
+    print("(host run: timings reflect CPython, not the bus)")
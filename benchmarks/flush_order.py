@@ -0,0 +1,111 @@
+"""
+Count chip-select switches and page/column commands per flush, fixed page-major order versus the flush scheduler.
+
+The full-frame numbers are taken from the bytes latched on the bus (chip select, RS and data at every E pulse). The
+partial updates are typical dirty-span sets costed with `plan_flush()` against the old loop, which visited every
+page and then every region and addressed each run from scratch.
+
+    $ python benchmarks/flush_order.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+_host.install()
+
+from topway import LM19264
+from topway.flush import plan_flush
+
+
+class LatchRecorder:
+    """Wraps the E pin and records (region, rs, data) every time a byte is latched."""
+
+    def __init__(self, pin, bus):
+        self.pin = pin
+        self.bus = bus
+        self.latched = []
+
+    def on(self) -> None:
+        bus = self.bus
+        region = 1 if bus.csa.value() else 2 if bus.csb.value() else 0
+        self.latched.append((region, bus.rs.value(), bus.get_data()))
+        self.pin.on()
+
+    def off(self) -> None:
+        self.pin.off()
+
+    def value(self, *args):
+        return self.pin.value(*args)
+
+
+def summarize(latched: list) -> tuple[int, int]:
+    """Count chip-select switches and page/column commands in a latch log."""
+    switches = 0
+    commands = 0
+    region = -1
+    for chip, rs, value in latched:
+        if chip != region:
+            switches += 1
+            region = chip
+        if not rs and (value & 0xF8 == 0xB8 or value & 0xC0 == 0x40):
+            commands += 1
+    return switches, commands
+
+
+def page_major_flush(lcd: LM19264, frame: bytearray) -> None:
+    """The old flush loop: every page, then every region, page and column set for each run."""
+    for page in range(8):
+        for region in range(3):
+            lcd.do_select_chip(region)
+            lcd.set_page(page)
+            lcd.set_column(0)
+            lcd.bus.write_data(frame, (page * 192) + (region * 64), 64)
+
+
+def record(lcd: LM19264, flush) -> tuple[int, int]:
+    recorder = LatchRecorder(lcd.bus.e, lcd.bus)
+    lcd.bus.e = recorder
+    lcd.invalidate_address()
+    flush()
+    lcd.bus.e = recorder.pin
+    return summarize(recorder.latched)
+
+
+def page_major_cost(runs: list) -> int:
+    """Chip-select switches plus address commands of the old loop for a set of runs."""
+    cost = 0
+    region = -1
+    for run in sorted(runs, key=lambda run: (run[1], run[0], run[2])):
+        if run[0] != region:
+            region = run[0]
+            cost += 1
+        cost += 2
+    return cost
+
+
+lcd = LM19264(
+    db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1,  # DB7–DB0
+    e=9, rw=10, rs=11, csa=13, csb=12, rstb=14
+)
+frame = bytearray((i * 37) & 0xFF for i in range(lcd.width * 8))
+
+old_switches, old_commands = record(lcd, lambda: page_major_flush(lcd, frame))
+new_switches, new_commands = record(lcd, lambda: lcd.display_bitmap(frame))
+old = old_switches + old_commands
+new = new_switches + new_commands
+print(f"{'full frame':<20} page-major: {old:>3}  {lcd.last_plan['order']:<12} {new:>3}  saved {old - new:>2}  "
+      f"(CS switches {old_switches} -> {new_switches}, address commands {old_commands} -> {new_commands})")
+
+SCENARIOS = (
+    ("clock digits", [(1, page, 0, 64) for page in range(1, 7)] + [(2, page, 0, 20) for page in range(1, 7)]),
+    ("status bar", [(region, 7, 0, 64) for region in range(3)]),
+    ("seconds + bar", [(2, page, 40, 24) for page in range(2, 5)] + [(region, 7, 0, 64) for region in range(3)]),
+    ("scattered", [(region, page, (page * 11 + region * 7) % 48, 8) for page in range(0, 8, 2) for region in range(3)]),
+    ("two spans per cell", [(region, page, col, 6) for page in range(4) for region in range(3) for col in (4, 30)]),
+)
+for name, runs in SCENARIOS:
+    plan = plan_flush(runs)
+    old = page_major_cost(runs)
+    print(f"{name:<20} page-major: {old:>3}  {plan['order']:<12} {plan['cost']:>3}  saved {old - plan['cost']:>2}  "
+          f"{plan['costs']}")
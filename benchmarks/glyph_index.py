@@ -0,0 +1,61 @@
+"""
+Time glyph lookups for a 20-character status line, the font module's binary search over `_sparse` against the
+`IndexedFont` wrapper's flat index and cached glyphs, and check both return the same glyphs for every code point.
+
+    $ python benchmarks/glyph_index.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import time
+from topway import Canvas
+from topway.font import Aclonica_size24 as font24
+from topway.font import CourierNew_size12 as font12
+from topway.text import indexed_font
+
+STATUS = "Wed 27 Sep  12:34 68%"
+
+
+def measure(name: str, run, repeat: int = 200) -> None:
+    start = time.ticks_us()
+    for _ in range(repeat):
+        run()
+    elapsed = time.ticks_diff(time.ticks_us(), start) / repeat
+    print(f"{name:<30} {elapsed:8.1f}us per status line")
+
+
+def lookups(font_map: object) -> None:
+    for char in STATUS:
+        font_map.get_ch(char)
+
+
+failures = 0
+for font_map in (font12, font24):
+    indexed = indexed_font(font_map)
+    sparse = font_map._sparse
+    codes = [sparse[i] | (sparse[i + 1] << 8) for i in range(0, len(sparse), 4)] + list(range(256)) + [0x2603]
+    for code in codes:
+        expected = font_map.get_ch(chr(code))
+        glyph = indexed.get_ch(chr(code))
+        if bytes(glyph[0]) != bytes(expected[0]) or glyph[1:] != expected[1:]:
+            print(f"FAIL {font_map.__name__} U+{code:04X}")
+            failures += 1
+print("glyph check:", "FAIL" if failures else "OK")
+
+for font_map in (font12, font24):
+    indexed = indexed_font(font_map)
+    name = font_map.__name__.split(".")[-1]
+    measure(f"{name} get_ch (module)", lambda: lookups(font_map))
+    measure(f"{name} get_ch (indexed)", lambda: lookups(indexed))
+
+canvas = Canvas()
+measure("draw_text (module)", lambda: canvas.draw_text(STATUS, 0, 0, font12))
+measure("draw_text (indexed)", lambda: canvas.draw_text(STATUS, 0, 0, indexed_font(font12)))
+if ON_HOST:
+    print("(host run: timings reflect CPython)")
+if failures:
+    raise SystemExit(1)
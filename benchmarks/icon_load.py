@@ -0,0 +1,94 @@
+"""
+Load and draw every weather icon: JSON parsing plus a per-pixel overlay versus `load_icon()` plus a page-packed blit,
+from one file per icon and from a single `IconAtlas`.
+
+Reports time per icon and the peak heap used while loading (`tracemalloc` under CPython, `gc.mem_alloc()` on a
+board). Run `python tools/img2vlsb.py weather/64/*.json` and
+`python tools/build_atlas.py weather/64/*.json --out weather/64.atlas` first if the .bin / atlas files are missing.
+
+    $ python benchmarks/icon_load.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import gc
+import json
+import os
+import time
+from topway import Canvas
+from topway.icons import IconAtlas, load_icon
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+ICON_DIR = "weather/64" if ON_HOST else "/weather/64"
+if ON_HOST:
+    ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ICON_DIR)
+
+ATLAS = IconAtlas(ICON_DIR + ".atlas")
+NAMES = sorted(name[:-5] for name in os.listdir(ICON_DIR) if name.endswith(".json"))
+
+
+def load_json(name: str, canvas: Canvas, _buffer: bytearray) -> None:
+    with open(f"{ICON_DIR}/{name}.json", "r") as f:
+        icon = json.loads(f.read())
+    canvas.overlay_bitmap(icon, x=0, y=0, mode="or")
+
+
+def load_bin(name: str, canvas: Canvas, buffer: bytearray) -> None:
+    load_icon(f"{ICON_DIR}/{name}.bin", buffer)
+    canvas.blit(buffer, 64, 64, 0, 0)
+
+
+def load_atlas(name: str, canvas: Canvas, buffer: bytearray) -> None:
+    buf, width, height = ATLAS.load(name, buffer)
+    canvas.blit(buf, width, height, 0, 0)
+
+
+def measure(label: str, load) -> tuple[float, int, Canvas]:
+    canvas = Canvas()
+    buffer = bytearray(512)
+    peak = 0
+    elapsed = 0
+    for name in NAMES:
+        canvas.clear()
+        gc.collect()
+        if tracemalloc is not None:
+            tracemalloc.start()
+        else:
+            before = gc.mem_alloc()
+        start = time.ticks_us()
+
+        load(name, canvas, buffer)
+
+        elapsed += time.ticks_diff(time.ticks_us(), start)
+        if tracemalloc is not None:
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        else:
+            peak = max(peak, gc.mem_alloc() - before)
+
+    per_icon = elapsed / len(NAMES) / 1000
+    print(f"{label:<20} {per_icon:8.3f}ms per icon   peak heap {peak:>7} bytes")
+    return per_icon, peak, canvas
+
+
+print(f"{len(NAMES)} icons from {ICON_DIR}")
+json_time, json_peak, json_canvas = measure("json + overlay", load_json)
+bin_time, bin_peak, bin_canvas = measure("readinto + blit", load_bin)
+atlas_time, atlas_peak, atlas_canvas = measure("atlas + blit", load_atlas)
+print(f"files: speed-up {json_time / bin_time:.1f}x, peak heap {json_peak / max(bin_peak, 1):.1f}x smaller")
+print(f"atlas: speed-up {json_time / atlas_time:.1f}x, peak heap {json_peak / max(atlas_peak, 1):.1f}x smaller")
+ATLAS.close()
+
+if not json_canvas.buffer == bin_canvas.buffer == atlas_canvas.buffer:
+    print("FAIL the last icon differs between the two paths")
+    raise SystemExit(1)
+if ON_HOST:
+    print("(host run: timings reflect CPython)")
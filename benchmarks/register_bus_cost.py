@@ -0,0 +1,74 @@
+"""
+Compare the cost of putting a byte on the data pins with the register bus and the per-pin bus: register writes per
+byte versus `Pin.value()` calls per byte, for every byte value and several wirings. The register bus mask tables are
+checked by `tests/test_register_bus.py`.
+
+    $ python benchmarks/register_bus_cost.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+_host.install()
+
+from machine import Pin
+from topway.bus import PinBus, RegisterBus
+
+REG_SET = 0x1008
+REG_CLR = 0x100C
+REG_IN = 0x103C
+
+
+class CountingRegisterFile:
+    """Stands in for `machine.mem32`, counting the register writes."""
+
+    def __init__(self):
+        self.out = 0
+        self.writes = 0
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self.writes += 1
+        if address == REG_SET:
+            self.out |= value
+        elif address == REG_CLR:
+            self.out &= ~value
+
+    def __getitem__(self, address: int) -> int:
+        return self.out
+
+
+class CountingPin(Pin):
+    """Pin that counts calls, to compare the per-pin bus against the register bus."""
+    calls = 0
+
+    def value(self, level: int | None = None) -> int | None:
+        CountingPin.calls += 1
+        return super().value(level)
+
+
+def pins_for(gpios: tuple) -> tuple[Pin, ...]:
+    return tuple(Pin(gpio, Pin.OUT) for gpio in gpios)
+
+
+# The wiring from the README: DB0 is GPIO 8 down to DB7 on GPIO 1, so the bits are reversed on the port.
+WIRINGS = (
+    (8, 7, 6, 5, 4, 3, 2, 1),
+    (0, 1, 2, 3, 4, 5, 6, 7),
+    (31, 16, 3, 22, 9, 0, 27, 12),
+)
+
+rs, rw, e, csa, csb = pins_for((40, 41, 42, 43, 44))
+for gpios in WIRINGS:
+    mem = CountingRegisterFile()
+    bus = RegisterBus(data=gpios, rs=rs, rw=rw, e=e, csa=csa, csb=csb, registers=(REG_SET, REG_CLR, REG_IN), mem=mem)
+    for value in range(256):
+        bus.set_data(value)
+    print(f"register bus, wiring {gpios}: {mem.writes / 256:g} register writes per byte")
+
+for gpios in WIRINGS:
+    CountingPin.calls = 0
+    pin_bus = PinBus(data=[CountingPin(gpio, Pin.OUT) for gpio in gpios], rs=rs, rw=rw, e=e, csa=csa, csb=csb)
+    for value in range(256):
+        pin_bus.set_data(value)
+    print(f"per-pin bus, wiring {gpios}: {CountingPin.calls / 256:g} Pin.value() calls per byte")
@@ -0,0 +1,73 @@
+"""
+Compression ratio and decode time of run-length compressed icons (`topway/rle.py`) against raw page-packed icons.
+
+Every weather icon is compressed, checked to decode to the same pixels as the raw icon at several offsets and in every
+mode, then drawn from raw bytes, from compressed bytes and streamed from a file. Run
+`python tools/img2vlsb.py weather/64/*.json` first if the .bin files are missing.
+
+    $ python benchmarks/rle_icons.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import io
+import os
+import time
+from topway import Canvas
+from topway.icons import load_icon
+from topway.rle import decode_rle, encode_rle
+
+ICON_DIR = "weather/64" if ON_HOST else "/weather/64"
+if ON_HOST:
+    ICON_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ICON_DIR)
+
+ICONS = {name[:-4]: load_icon(f"{ICON_DIR}/{name}") for name in sorted(os.listdir(ICON_DIR)) if name.endswith(".bin")}
+PACKED = {name: bytes(encode_rle(icon)) for name, icon in ICONS.items()}
+
+raw_total = sum(len(icon) for icon in ICONS.values())
+rle_total = sum(len(data) for data in PACKED.values())
+smallest = min(PACKED, key=lambda name: len(PACKED[name]))
+largest = max(PACKED, key=lambda name: len(PACKED[name]))
+print(f"{len(ICONS)} icons: {raw_total} -> {rle_total} bytes, ratio {raw_total / rle_total:.2f}:1")
+print(f"smallest {len(PACKED[smallest])} bytes ({smallest}), largest {len(PACKED[largest])} bytes ({largest})")
+
+failures = 0
+buffer = bytearray(512)
+for name, icon in ICONS.items():
+    if decode_rle(PACKED[name], buffer, 512) != icon:
+        print(f"FAIL {name}: decoded bytes differ")
+        failures += 1
+    for x, y in ((0, 0), (70, 3), (-5, -11), (150, 20)):
+        for mode in ("or", "xor", "replace"):
+            raw = Canvas(bytearray((i * 29) & 0xFF for i in range(1536)))
+            rle = Canvas(bytearray(raw.buffer))
+            raw.blit(icon, 64, 64, x, y, mode)
+            rle.blit_rle(io.BytesIO(PACKED[name]), 64, 64, x, y, mode)
+            if raw.buffer != rle.buffer:
+                print(f"FAIL {name} at ({x}, {y}) {mode}")
+                failures += 1
+print("decode check:", "FAIL" if failures else "OK")
+
+
+def measure(label: str, draw, repeat: int = 5) -> None:
+    canvas = Canvas()
+    start = time.ticks_us()
+    for _ in range(repeat):
+        for name in ICONS:
+            draw(canvas, name)
+    elapsed = time.ticks_diff(time.ticks_us(), start) / repeat / len(ICONS)
+    print(f"{label:<24} {elapsed / 1000:8.3f}ms per icon")
+
+
+measure("raw blit", lambda canvas, name: canvas.blit(ICONS[name], 64, 64, 0, 3))
+measure("rle blit (bytes)", lambda canvas, name: canvas.blit_rle(PACKED[name], 64, 64, 0, 3))
+measure("rle blit (stream)", lambda canvas, name: canvas.blit_rle(io.BytesIO(PACKED[name]), 64, 64, 0, 3))
+measure("rle decode to buffer", lambda canvas, name: decode_rle(PACKED[name], buffer, 512))
+if ON_HOST:
+    print("(host run: timings reflect CPython)")
+if failures:
+    raise SystemExit(1)
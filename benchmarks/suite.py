@@ -0,0 +1,293 @@
+"""
+Time every drawing and flush API of both drivers and of `Canvas` against the emulated panel and compare with a stored baseline, so a
+change that slows down a per-pixel or per-byte loop, or changes what gets drawn or sent, is caught.
+
+Every case reports the best time per call over a few batches, its time relative to a fixed pure-Python workload
+timed alongside (`reference()`), and exact counts: pixels lit for drawing calls, bus cycles, commands, data writes
+and chip-select switches (as seen by `host.Panel`) for flushes. Counts must match the baseline exactly; relative times
+may be up to `--tolerance` slower. Relative times cancel most of the difference between machines and of the noise on
+a busy one, but the baseline is best recorded on the machine that runs the comparison.
+
+    $ python benchmarks/suite.py                      # compare with benchmarks/baseline.json
+    $ python benchmarks/suite.py --json results.json  # also write the results
+    $ python benchmarks/suite.py --update             # record a new baseline
+    $ python benchmarks/suite.py --filter draw_text   # only the cases whose name contains "draw_text"
+
+Host only: the flush cases need the emulated panel.
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+if not _host.install():
+    raise SystemExit("suite.py needs the host emulator; run it with CPython")
+
+import argparse
+import json
+import os
+import sys
+import time
+import host
+from topway import Canvas, LM19264
+from topway.font import CourierNew_size12, CourierNew_size24, CourierNew_size36, CourierNew_size48
+from topway.icons import pack_vlsb
+from topway.LM19264framebuf import LM19264 as LM19264fb
+
+WIRING = dict(db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1, e=9, rw=10, rs=11, csa=13, csb=12, rstb=14)
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+FONTS = {12: CourierNew_size12, 24: CourierNew_size24, 36: CourierNew_size36, 48: CourierNew_size48}
+TEXT = "12:34 Wed"
+LINES = [[96, 32, angle, 30] for angle in range(0, 360, 15)]
+CIRCLES = [(32, 32, 28, False), (96, 32, 20, True), (160, 32, 30, False)]
+BOX = (20, 8, 150, 48, 10)
+BUS_COUNTERS = ("cycles", "commands", "writes", "cs_switches")
+
+
+def lit_rows(call) -> dict:
+    """Counts for a call that returns a 2D bitmap."""
+    return {"pixels": sum(sum(row) for row in call())}
+
+
+def lit_bytes(buf: bytes | bytearray) -> int:
+    return sum(bin(value).count("1") for value in buf)
+
+
+def blank() -> list:
+    return [[0] * 192 for _ in range(64)]
+
+
+def pattern() -> list:
+    return [[(x * 7 + y * 3) % 5 == 0 for x in range(192)] for y in range(64)]
+
+
+def repeat_for(call, target_us: int) -> int:
+    """Number of calls that take about `target_us`."""
+    start = time.ticks_us()
+    call()
+    return max(1, int(target_us // max(time.ticks_diff(time.ticks_us(), start), 1)))
+
+
+def timed(call, repeat: int) -> float:
+    """Time per call in µs over `repeat` calls."""
+    start = time.ticks_us()
+    for _ in range(repeat):
+        call()
+    return time.ticks_diff(time.ticks_us(), start) / repeat
+
+
+def measure(call, batches: int, target_us: int = 20000) -> tuple[float, float]:
+    """
+    Time a call in batches of about `target_us`, each followed by a batch of `reference()`.
+
+    :return: Tuple of (best µs per call, median of the per-batch ratios to the reference). The ratio is what gets
+        compared: a machine that slows down or speeds up meanwhile (frequency scaling, other load) moves both sides.
+    :rtype: tuple
+    """
+    repeat = repeat_for(call, target_us)
+    reference_repeat = repeat_for(reference, target_us)
+    best = None
+    ratios = []
+    for _ in range(batches):
+        elapsed = timed(call, repeat)
+        ratios.append(elapsed / timed(reference, reference_repeat))
+        if best is None or elapsed < best:
+            best = elapsed
+    ratios.sort()
+    return best, ratios[len(ratios) // 2]
+
+
+def reference() -> None:
+    """Fixed pure-Python workload that times are expressed in, so they carry over between runs and machines."""
+    buf = bytearray(1536)
+    for index in range(1536):
+        buf[index] = (index * 7) & 0xFF
+
+
+def bus_counts(panel: host.Panel, lcd: object, call) -> dict:
+    """
+    Bus traffic of one call, as decoded by the emulated panel, from a known start: region 0 selected and no page or
+    column address remembered (the flush order depends on where the last flush left off).
+    """
+    lcd.invalidate_address()
+    lcd.do_select_chip(0)
+    panel.reset_counters()
+    call()
+    counters = panel.counters()
+    return {name: counters[name] for name in BUS_COUNTERS}
+
+
+def build_cases() -> list:
+    """
+    Set up both drivers on emulated panels and a `Canvas`, and list the cases.
+
+    Drawing calls only ever set pixels, so repeating them on the same bitmap gives the same result each time.
+
+    :return: List of (name, call, counts) where counts is a function returning the exact counts.
+    :rtype: list
+    """
+    cases = []
+
+    host.reset()
+    panel = host.Panel(**WIRING)
+    lcd = LM19264(**WIRING)
+
+    rows = pattern()
+    packed = lcd.pack_bitmap(rows)
+    icon = [[(x ^ y) & 1 for x in range(64)] for y in range(64)]
+
+    def bitmap_case(name: str, draw) -> None:
+        bitmap = blank()
+        cases.append((f"bitmap.{name}", lambda: draw(bitmap), lambda: lit_rows(lambda: draw(bitmap))))
+
+    cases.append(("bitmap.pack_bitmap", lambda: lcd.pack_bitmap(rows),
+                  lambda: {"pixels": lit_bytes(lcd.pack_bitmap(rows))}))
+    cases.append(("bitmap.overlay_bitmap", lambda: lcd.overlay_bitmap(rows, icon, 64, 0),
+                  lambda: lit_rows(lambda: lcd.overlay_bitmap(rows, icon, 64, 0))))
+    for size, font in FONTS.items():
+        bitmap_case(f"draw_text.{size}", lambda bitmap, font=font: lcd.draw_text(bitmap, TEXT, 0, 0, font))
+    bitmap_case("lines", lambda bitmap: lcd.draw_graphic_lines(bitmap, LINES))
+    bitmap_case("circles", lambda bitmap: lcd.draw_graphic_circles(bitmap, CIRCLES))
+    bitmap_case("box", lambda bitmap: lcd.draw_graphic_box(bitmap, *BOX, fill=True))
+    cases.append(("bitmap.display_bitmap", lambda: lcd.display_bitmap(packed),
+                  lambda: bus_counts(panel, lcd, lambda: lcd.display_bitmap(packed))))
+
+    fb_panel = host.Panel(**WIRING)
+    fb = LM19264fb(**WIRING)
+
+    def framebuf_case(name: str, draw) -> None:
+        def call():
+            fb.fill(0)
+            draw()
+
+        def counts():
+            call()
+            return {"pixels": lit_bytes(fb.buffer)}
+
+        cases.append((f"framebuf.{name}", call, counts))
+
+    for size, font in FONTS.items():
+        framebuf_case(f"draw_text.{size}", lambda font=font: fb.draw_text(TEXT, 0, 0, font))
+    framebuf_case("lines", lambda: fb.draw_graphic_lines(LINES))
+    framebuf_case("circles", lambda: fb.draw_graphic_circles(CIRCLES))
+    framebuf_case("box", lambda: fb.draw_graphic_box(*BOX, fill=True))
+
+    def full_frame():
+        fb.buffer[:] = packed
+        fb.display(full=True)
+
+    def text_update():
+        fb.fill_rect(0, 0, 80, 16, 0)
+        fb.draw_text(TEXT, 0, 0, CourierNew_size12)
+        fb.display()
+
+    cases.append(("framebuf.pack_bitmap", lambda: fb.pack_bitmap(rows),
+                  lambda: {"pixels": lit_bytes(fb.pack_bitmap(rows))}))
+    cases.append(("framebuf.overlay_bitmap", lambda: fb.overlay_bitmap(rows, icon, 64, 0),
+                  lambda: lit_rows(lambda: fb.overlay_bitmap(rows, icon, 64, 0))))
+    cases.append(("framebuf.display_bitmap", lambda: fb.display_bitmap(packed),
+                  lambda: bus_counts(fb_panel, fb, lambda: fb.display_bitmap(packed))))
+    cases.append(("framebuf.display.full", full_frame, lambda: bus_counts(fb_panel, fb, full_frame)))
+    cases.append(("framebuf.display.text", text_update, lambda: bus_counts(fb_panel, fb, text_update)))
+
+    canvas = Canvas()
+    icon_vlsb = pack_vlsb(icon)
+
+    def canvas_case(name: str, draw) -> None:
+        def call():
+            canvas.clear()
+            draw()
+
+        def counts():
+            call()
+            return {"pixels": lit_bytes(canvas.buffer)}
+
+        cases.append((f"canvas.{name}", call, counts))
+
+    for size, font in FONTS.items():
+        canvas_case(f"draw_text.{size}", lambda font=font: canvas.draw_text(TEXT, 0, 0, font))
+    canvas_case("lines", lambda: canvas.draw_graphic_lines(LINES))
+    canvas_case("circles", lambda: canvas.draw_graphic_circles(CIRCLES))
+    canvas_case("box", lambda: canvas.draw_graphic_box(*BOX, fill=True))
+    canvas_case("fill_span_rect", lambda: canvas.fill_span_rect(5, 3, 180, 60))
+    canvas_case("overlay_bitmap", lambda: canvas.overlay_bitmap(icon, 64, 0))
+    canvas_case("blit", lambda: canvas.blit(icon_vlsb, 64, 64, 61, 3))
+    return cases
+
+
+def run(cases: list, batches: int, only: str | None) -> dict:
+    results = {}
+    for name, call, counts in cases:
+        if only and only not in name:
+            continue
+        elapsed, relative = measure(call, batches)
+        results[name] = {"us": round(elapsed, 1), "relative": round(relative, 4), "counts": counts()}
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float, only: str | None) -> int:
+    """Print each case next to the baseline; return the number of regressions."""
+    regressions = 0
+    print(f"{'case':<28}{'us':>11}{'baseline':>11}{'change':>9}  status")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<28}{result['us']:>11.1f}{'':>11}{'':>9}  new")
+            continue
+        change = result["relative"] / base["relative"] - 1 if base["relative"] else 0.0
+        status = "ok"
+        if result["counts"] != base["counts"]:
+            status = f"counts changed: {base['counts']} -> {result['counts']}"
+            regressions += 1
+        elif change > tolerance:
+            status = "SLOWER"
+            regressions += 1
+        elif change < -tolerance:
+            status = "faster"
+        print(f"{name:<28}{result['us']:>11.1f}{base['us']:>11.1f}{change:>+9.0%}  {status}")
+    for name in baseline:
+        if name not in results and not (only and only not in name):
+            print(f"{name:<28}{'':>11}{baseline[name]['us']:>11.1f}{'':>9}  not run")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--baseline", default=BASELINE, help="baseline file (default: benchmarks/baseline.json)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%% (default)")
+    parser.add_argument("--json", help="also write the results to this file")
+    parser.add_argument("--update", action="store_true", help="write the results as the new baseline")
+    parser.add_argument("--batches", type=int, default=7, help="timed batches per case (default 7)")
+    parser.add_argument("--filter", help="only run the cases whose name contains this")
+    args = parser.parse_args()
+
+    results = run(build_cases(), args.batches, args.filter)
+    report = {"python": sys.version.split()[0], "results": results}
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+    if args.update:
+        if args.filter and os.path.exists(args.baseline):
+            # Only replace the cases that were run
+            with open(args.baseline) as f:
+                report["results"] = dict(json.load(f)["results"], **results)
+        with open(args.baseline, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"wrote {len(results)} of {len(report['results'])} cases to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(json.dumps(report, indent=2, sort_keys=True))
+        print(f"no baseline at {args.baseline}; record one with --update")
+        return 0
+    with open(args.baseline) as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.tolerance, args.filter)
+    print("OK" if not regressions else f"FAIL ({regressions} regressions)")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""
+Time measuring label widths by summing `get_ch()` widths against `text_width()` with the per-font width table.
+
+    $ python benchmarks/text_measure.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+ON_HOST = _host.install()
+
+import time
+from topway.font import Aclonica_size24 as font24
+from topway.font import CourierNew_size12 as font12
+from topway.text import advance_widths, text_bbox, text_width
+
+LABELS = ("21.5", "68%", "Wednesday", "September 27", "12:34:56", "Feels like 19.0 C", "°Ωλ")
+
+
+def get_ch_width(font_map: object, text: str) -> int:
+    """What the examples did: a binary search and a glyph memoryview per character."""
+    return sum([r[2] for r in [font_map.get_ch(c) for c in text]])
+
+
+def measure(name: str, measure_label, repeat: int = 200) -> None:
+    start = time.ticks_us()
+    for _ in range(repeat):
+        for font_map in (font12, font24):
+            for label in LABELS:
+                measure_label(font_map, label)
+    elapsed = time.ticks_diff(time.ticks_us(), start) / repeat / (2 * len(LABELS))
+    print(f"{name:<12} {elapsed:8.2f}us per label")
+
+
+failures = 0
+for font_map in (font12, font24):
+    start = time.ticks_us()
+    first, widths, _ = advance_widths(font_map)
+    built = time.ticks_diff(time.ticks_us(), start)
+    print(f"{font_map.__name__}: {len(widths)} widths from {chr(first)!r} built in {built / 1000:.2f}ms")
+    for label in LABELS:
+        if text_width(font_map, label, spacing=0) != get_ch_width(font_map, label):
+            print(f"FAIL {font_map.__name__} {label!r}")
+            failures += 1
+print("width check:", "FAIL" if failures else "OK")
+print(f"right-aligned '68%' at x=187: {text_bbox(font24, '68%', x=187, align='right')}")
+
+measure("get_ch sum", get_ch_width)
+measure("text_width", lambda font_map, label: text_width(font_map, label, 0))
+if ON_HOST:
+    print("(host run: timings reflect CPython)")
+if failures:
+    raise SystemExit(1)
@@ -0,0 +1,83 @@
+"""
+Record the bus traffic of a short animation on the FrameBuffer driver with `RecordingBus`, export it, load it back
+and replay it onto a second emulated panel, checking that every frame shows the same pixels. Prints the traffic of
+each frame and the time taken to draw and to replay.
+
+On a board, the recording and export work the same (point `TRACE` at the flash); the emulated panels are host only.
+
+    $ python benchmarks/trace_replay.py
+"""
+try:
+    import _host
+except ImportError:
+    from benchmarks import _host
+
+if not _host.install():
+    raise SystemExit("trace_replay.py needs the host emulator; run it with CPython")
+
+import os
+import tempfile
+import time
+import host
+from host.machine import Pin
+from topway import trace
+from topway.bus import PinBus
+from topway.font import CourierNew_size12 as font12
+from topway.LM19264framebuf import LM19264
+
+WIRING = dict(db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1, e=9, rw=10, rs=11, csa=13, csb=12, rstb=14)
+FRAMES = 60
+TRACE = os.path.join(tempfile.gettempdir(), "lm19264.trace")
+
+host.reset()
+recorded_panel = host.Panel(**WIRING)
+lcd = LM19264(**WIRING)
+lcd.bus = trace.RecordingBus(lcd.bus, capacity=FRAMES * 1700)
+
+shown = []
+start = time.ticks_us()
+for frame in range(FRAMES):
+    lcd.fill(0)
+    lcd.draw_text(f"frame {frame:02d}", 2 + frame, 2, font12)
+    lcd.draw_graphic_box(frame * 2, 30, 40, 20, radius=4, fill=frame % 2 == 0)
+    lcd.display(full=frame == 0)
+    lcd.bus.mark_frame()
+    shown.append(recorded_panel.frame())
+draw_us = time.ticks_diff(time.ticks_us(), start)
+
+count = lcd.bus.export(TRACE)
+print(f"recorded {count} events in {FRAMES} frames, {lcd.bus.dropped} dropped, {os.stat(TRACE)[6]} bytes on disk")
+
+entries, stamps = trace.load(TRACE)
+per_frame = trace.summarize(entries)
+print("frame  commands   data  CS  dir  reads  status")
+for number, counts in enumerate(per_frame[:5] + per_frame[-2:]):
+    label = number if number < 5 else len(per_frame) - 7 + number
+    print(f"{label:>5}  {counts['cmd']:>8}  {counts['data']:>5}  {counts['cs']:>2}  {counts['dir']:>3}  "
+          f"{counts['read']:>5}  {counts['status']:>6}")
+
+# A fresh panel behind a bus of its own; the driver's initialisation is part of the trace only if it was recorded,
+# so switch the replayed panel on the same way first.
+host.reset()
+replayed_panel = host.Panel(**WIRING)
+pins = {name: Pin(gpio, Pin.OUT, value=0) for name, gpio in WIRING.items()}
+bus = PinBus(data=tuple(pins[f"db{bit}"] for bit in range(8)), rs=pins["rs"], rw=pins["rw"], e=pins["e"],
+             csa=pins["csa"], csb=pins["csb"])
+for region in range(3):
+    bus.select(region)
+    bus.write(0x3F, 0)
+    bus.write(0xC0, 0)
+
+mismatches = []
+start = time.ticks_us()
+totals = trace.replay(entries, bus, on_frame=lambda number: mismatches.append(replayed_panel.frame() != shown[number]))
+replay_us = time.ticks_diff(time.ticks_us(), start)
+os.remove(TRACE)
+
+print(f"draw and flush {draw_us / FRAMES / 1000:.2f} ms/frame, replay {replay_us / FRAMES / 1000:.2f} ms/frame")
+print(f"replayed {totals['frame']} frames: {totals['cmd']} commands, {totals['data']} data bytes, "
+      f"{totals['cs']} CS switches")
+failures = sum(mismatches) + (totals["frame"] != FRAMES)
+print("OK" if not failures else f"FAIL ({failures} frames differ)")
+if failures:
+    raise SystemExit(1)
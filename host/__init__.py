@@ -0,0 +1,50 @@
+"""
+Pure-CPython stand-ins for the MicroPython modules the drivers use (`machine`, `micropython`, `framebuf`) and an
+emulator of the panel's controllers, so the drivers can be run, checked and measured off the board:
+
+    import host
+    host.install()
+
+    from topway import LM19264
+
+    WIRING = dict(db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1, e=9, rw=10, rs=11, csa=13, csb=12, rstb=14)
+    panel = host.Panel(**WIRING)  # before the driver, so it sees the reset and initialisation
+    lcd = LM19264(**WIRING)
+    lcd.display_bitmap(frame)
+    assert panel.frame() == frame
+"""
+import sys
+import time
+
+from . import framebuf, machine, micropython
+from .ks0108 import Controller, Panel
+
+
+def install() -> bool:
+    """
+    Register the stand-in modules and patch `time` with the MicroPython-only functions, unless running on
+    MicroPython.
+
+    :return: True if the stand-ins were installed (running on the host).
+    :rtype: bool
+    """
+    if sys.implementation.name == "micropython":
+        return False
+
+    sys.modules["machine"] = machine
+    sys.modules["micropython"] = micropython
+    sys.modules["framebuf"] = framebuf
+
+    time.sleep_us = lambda us: None
+    time.sleep_ms = lambda ms: None
+    time.ticks_us = lambda: time.perf_counter_ns() // 1000
+    time.ticks_ms = lambda: time.perf_counter_ns() // 1000000
+    time.ticks_cpu = time.perf_counter_ns
+    time.ticks_add = lambda ticks, delta: ticks + delta
+    time.ticks_diff = lambda new, old: new - old
+    return True
+
+
+def reset() -> None:
+    """Forget every pin and watcher, e.g. between two emulated panels in one run."""
+    machine.pins.reset()
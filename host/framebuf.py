@@ -0,0 +1,128 @@
+"""
+Stand-in for the `framebuf` module, MONO_VLSB only: byte `(y // 8) * width + x`, least significant bit on top, the
+layout of the display RAM. Drawing follows MicroPython's clipping rules so results can be compared byte for byte.
+"""
+MONO_VLSB = 0
+MONO_HLSB = 3
+MONO_HMSB = 4
+
+
+class FrameBuffer:
+    def __init__(self, buffer: bytearray | memoryview, width: int, height: int, format: int, stride: int | None = None):
+        """
+        Monochrome frame buffer drawing straight into `buffer`.
+
+        :param buffer: Backing buffer, at least `width * ((height + 7) // 8)` bytes.
+        :type buffer: bytearray | memoryview
+        :param width: Width in pixels.
+        :type width: int
+        :param height: Height in pixels.
+        :type height: int
+        :param format: Only `MONO_VLSB` is supported.
+        :type format: int
+        :param stride: Pixels between the starts of two rows of pages; `width` if None.
+        :type stride: int | None
+        :raises ValueError: For any other format or a buffer that is too small.
+        """
+        if format != MONO_VLSB:
+            raise ValueError("Only MONO_VLSB is emulated")
+        self._buf = buffer
+        self._width = width
+        self._height = height
+        self._stride = width if stride is None else stride
+        if len(buffer) < self._stride * ((height + 7) // 8):
+            raise ValueError("Buffer too small")
+
+    def pixel(self, x: int, y: int, c: int | None = None) -> int | None:
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None
+        index = (y >> 3) * self._stride + x
+        bit = 1 << (y & 7)
+        if c is None:
+            return 1 if self._buf[index] & bit else 0
+        if c:
+            self._buf[index] |= bit
+        else:
+            self._buf[index] &= ~bit
+
+    def fill(self, c: int) -> None:
+        value = 0xFF if c else 0
+        buf = self._buf
+        for index in range(self._stride * ((self._height + 7) // 8)):
+            buf[index] = value
+
+    def fill_rect(self, x: int, y: int, w: int, h: int, c: int) -> None:
+        x0 = max(x, 0)
+        y0 = max(y, 0)
+        x1 = min(x + w, self._width)
+        y1 = min(y + h, self._height)
+        if x0 >= x1 or y0 >= y1:
+            return
+        buf = self._buf
+        for page in range(y0 >> 3, ((y1 - 1) >> 3) + 1):
+            top = max(y0, page * 8) - page * 8
+            bottom = min(y1, page * 8 + 8) - page * 8
+            mask = ((1 << (bottom - top)) - 1) << top
+            offset = page * self._stride
+            for col in range(x0, x1):
+                if c:
+                    buf[offset + col] |= mask
+                else:
+                    buf[offset + col] &= ~mask
+
+    def hline(self, x: int, y: int, w: int, c: int) -> None:
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x: int, y: int, h: int, c: int) -> None:
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x: int, y: int, w: int, h: int, c: int, f: bool = False) -> None:
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.fill_rect(x, y, w, 1, c)
+        self.fill_rect(x, y + h - 1, w, 1, c)
+        self.fill_rect(x, y, 1, h, c)
+        self.fill_rect(x + w - 1, y, 1, h, c)
+
+    def line(self, x1: int, y1: int, x2: int, y2: int, c: int) -> None:
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        err = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            e2 = 2 * err
+            if e2 >= dy:
+                err += dy
+                x1 += sx
+            if e2 <= dx:
+                err += dx
+                y1 += sy
+
+    def blit(self, fbuf: "FrameBuffer | tuple", x: int, y: int, key: int = -1,
+             palette: "FrameBuffer | None" = None) -> None:
+        if isinstance(fbuf, tuple):
+            fbuf = FrameBuffer(*fbuf)
+        for sy in range(max(0, -y), min(fbuf._height, self._height - y)):
+            for sx in range(max(0, -x), min(fbuf._width, self._width - x)):
+                c = fbuf.pixel(sx, sy)
+                if palette is not None:
+                    c = palette.pixel(c, 0)
+                if c != key:
+                    self.pixel(x + sx, y + sy, c)
+
+    def scroll(self, xstep: int, ystep: int) -> None:
+        old = bytes(self._buf)
+        stride = self._stride
+        for y in range(self._height):
+            sy = y - ystep
+            if not 0 <= sy < self._height:
+                continue
+            for x in range(self._width):
+                sx = x - xstep
+                if 0 <= sx < self._width:
+                    self.pixel(x, y, (old[(sy >> 3) * stride + sx] >> (sy & 7)) & 1)
@@ -0,0 +1,268 @@
+"""
+Emulator of the LM19264's three 64x64 KS0108-style controllers, wired to pins on the `host.machine` registry.
+
+Each E strobe is decoded the way the panel does it: CSA/CSB pick the controller (both low: left, CSA high: middle,
+CSB high: right), RS/RW pick the operation, and DB0–DB7 are latched on the falling edge for writes or driven while E
+is high for reads. Every strobe is counted, so a flush can be checked pixel for pixel and measured in bus operations.
+"""
+from .machine import pins
+
+# Default E cycle time in nanoseconds (the controllers' minimum is 1000 ns), used to turn cycles into bus time.
+CYCLE_NS = 1000
+
+
+class Controller:
+    def __init__(self):
+        """
+        One 64x64 controller: 8 pages of 64 columns of display RAM, page (X) and column (Y) address, start line (Z)
+        and the display on/off flag. The column auto-increments after every data read or write and wraps at 64.
+        """
+        self.ram = bytearray(512)
+        self.page = 0
+        self.column = 0
+        self.start_line = 0
+        self.on = False
+        # Reads return the output register and then reload it, so the first read after an address change is a dummy
+        self.output = 0
+        self.reset()
+
+    def reset(self) -> None:
+        """Hardware reset: display off and start line 0; the RAM keeps its contents."""
+        self.on = False
+        self.start_line = 0
+        self.page = 0
+        self.column = 0
+
+    def command(self, value: int) -> bool:
+        """
+        Execute an instruction.
+
+        :param value: Instruction byte.
+        :type value: int
+        :return: False if the byte isn't a known instruction.
+        :rtype: bool
+        """
+        if value & 0xFE == 0x3E:
+            self.on = bool(value & 1)
+        elif value & 0xC0 == 0x40:
+            self.column = value & 0x3F
+        elif value & 0xF8 == 0xB8:
+            self.page = value & 0x07
+        elif value & 0xC0 == 0xC0:
+            self.start_line = value & 0x3F
+        else:
+            return False
+        return True
+
+    def write(self, value: int) -> None:
+        """Write a display data byte at the current address and advance the column."""
+        self.ram[self.page * 64 + self.column] = value
+        self.column = (self.column + 1) & 63
+
+    def read(self) -> int:
+        """Read display data: return the output register, reload it from the current address and advance."""
+        value = self.output
+        self.output = self.ram[self.page * 64 + self.column]
+        self.column = (self.column + 1) & 63
+        return value
+
+    def status(self) -> int:
+        """Status byte: bit 7 busy (never), bit 5 display off, bit 4 in reset (never)."""
+        return 0 if self.on else 0x20
+
+
+class Panel:
+    def __init__(self, db0: int, db1: int, db2: int, db3: int, db4: int, db5: int, db6: int, db7: int, rs: int,
+                 rw: int, e: int, csa: int, csb: int, rstb: int | None = None, cycle_ns: int = CYCLE_NS):
+        """
+        Wire the three controllers to GPIO numbers, taking the same keyword arguments as the drivers so one wiring
+        dict can build both. Create the panel before the driver so it sees the reset and initialisation.
+
+        :param db0: GPIO for DB0 (and so on to DB7).
+        :type db0: int
+        :param rs: GPIO for RS.
+        :type rs: int
+        :param rw: GPIO for RW.
+        :type rw: int
+        :param e: GPIO for E.
+        :type e: int
+        :param csa: GPIO for CSA.
+        :type csa: int
+        :param csb: GPIO for CSB.
+        :type csb: int
+        :param rstb: GPIO for RSTB, or None if reset isn't wired.
+        :type rstb: int | None
+        :param cycle_ns: E cycle time used by `bus_time_ns()`.
+        :type cycle_ns: int
+        """
+        self.data = (db0, db1, db2, db3, db4, db5, db6, db7)
+        self.rs = rs
+        self.rw = rw
+        self.csa = csa
+        self.csb = csb
+        self.cycle_ns = cycle_ns
+        self.controllers = (Controller(), Controller(), Controller())
+        self.reset_counters()
+
+        pins.watch(e, self._on_e)
+        if rstb is not None:
+            pins.watch(rstb, self._on_reset)
+
+    def reset_counters(self) -> None:
+        """Zero every bus counter."""
+        self.cycles = 0
+        self.commands = 0
+        self.writes = 0
+        self.reads = 0
+        self.status_reads = 0
+        self.cs_switches = 0
+        self.unselected = 0
+        self.unknown_commands = 0
+        self.contention = 0
+        self.region_writes = [0, 0, 0]
+        self._region = -1
+
+    def _selected(self) -> int:
+        csa = pins.get(self.csa)
+        csb = pins.get(self.csb)
+        if csa and csb:
+            return -1
+        return 1 if csa else 2 if csb else 0
+
+    def _on_reset(self, level: int) -> None:
+        if not level:
+            for controller in self.controllers:
+                controller.reset()
+
+    def _on_e(self, level: int) -> None:
+        rw = pins.get(self.rw)
+        if level and not rw:
+            return  # Writes are latched on the falling edge
+        if not level and rw:
+            return  # Read data was driven on the rising edge
+
+        self.cycles += 1
+        region = self._selected()
+        if region < 0:
+            self.unselected += 1
+            return
+        if region != self._region:
+            self.cs_switches += 1
+            self._region = region
+        controller = self.controllers[region]
+        rs = pins.get(self.rs)
+
+        if rw:
+            if rs:
+                value = controller.read()
+                self.reads += 1
+            else:
+                value = controller.status()
+                self.status_reads += 1
+            for bit, gpio in enumerate(self.data):
+                if pins.modes.get(gpio) != 1:  # Pin.IN
+                    self.contention += 1
+                pins.set(gpio, (value >> bit) & 1)
+            return
+
+        value = 0
+        for bit, gpio in enumerate(self.data):
+            if pins.get(gpio):
+                value |= 1 << bit
+        if rs:
+            controller.write(value)
+            self.writes += 1
+            self.region_writes[region] += 1
+        else:
+            self.commands += 1
+            if not controller.command(value):
+                self.unknown_commands += 1
+
+    def bus_time_ns(self) -> int:
+        """
+        Time the counted E cycles take on the bus at `cycle_ns` each, leaving out the CPU time between them.
+
+        :return: Nanoseconds.
+        :rtype: int
+        """
+        return self.cycles * self.cycle_ns
+
+    def counters(self) -> dict:
+        """
+        Get the bus counters.
+
+        :return: Mapping of counter name to value.
+        :rtype: dict
+        """
+        return {
+            "cycles": self.cycles,
+            "commands": self.commands,
+            "writes": self.writes,
+            "reads": self.reads,
+            "status_reads": self.status_reads,
+            "cs_switches": self.cs_switches,
+            "unselected": self.unselected,
+            "unknown_commands": self.unknown_commands,
+            "contention": self.contention,
+        }
+
+    def ram(self) -> bytearray:
+        """
+        Get the display RAM of all three controllers side by side, in the drivers' 192-wide page layout.
+
+        :return: 1536 bytes, byte `page * 192 + x`.
+        :rtype: bytearray
+        """
+        frame = bytearray(1536)
+        for region, controller in enumerate(self.controllers):
+            for page in range(8):
+                start = page * 192 + region * 64
+                frame[start:start + 64] = controller.ram[page * 64:page * 64 + 64]
+        return frame
+
+    def frame(self) -> bytearray:
+        """
+        Get what the panel shows: the RAM rotated by each controller's start line, blank where the display is off.
+
+        :return: 1536 bytes, byte `page * 192 + x`.
+        :rtype: bytearray
+        """
+        frame = bytearray(1536)
+        for region, controller in enumerate(self.controllers):
+            if not controller.on:
+                continue
+            ram = controller.ram
+            shift = controller.start_line
+            for col in range(64):
+                column = 0
+                for page in range(8):
+                    column |= ram[page * 64 + col] << (page * 8)
+                # Row r of the display shows RAM line (r + start line) % 64
+                column = ((column >> shift) | (column << (64 - shift))) & 0xFFFFFFFFFFFFFFFF
+                for page in range(8):
+                    frame[page * 192 + region * 64 + col] = (column >> (page * 8)) & 0xFF
+        return frame
+
+    def pixel(self, x: int, y: int) -> int:
+        """
+        Get a visible pixel.
+
+        :param x: Column (0–191).
+        :type x: int
+        :param y: Row (0–63).
+        :type y: int
+        :return: 0 or 1.
+        :rtype: int
+        """
+        return (self.frame()[(y >> 3) * 192 + x] >> (y & 7)) & 1
+
+    def text(self, on: str = "#", off: str = ".") -> str:
+        """
+        Render what the panel shows as 64 lines of 192 characters, handy in failing checks.
+
+        :return: The picture.
+        :rtype: str
+        """
+        frame = self.frame()
+        return "\n".join("".join(on if (frame[(y >> 3) * 192 + x] >> (y & 7)) & 1 else off for x in range(192))
+                         for y in range(64))
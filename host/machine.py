@@ -0,0 +1,185 @@
+"""
+Stand-in for MicroPython's `machine` module: `Pin` objects backed by a shared pin registry, and a `mem32` register
+file whose GPIO set/clear/input registers act on the same pins, so `PinBus` and `RegisterBus` can both be emulated.
+"""
+
+
+class PinRegistry:
+    def __init__(self):
+        """
+        Level and mode of every GPIO, shared by all `Pin` objects with the same id like on the real chip, plus
+        callbacks run when a pin changes level (how the controller emulator sees the E strobe).
+        """
+        self.levels = {}
+        self.modes = {}
+        self.watchers = {}
+        # Pins switched between input and output, e.g. to read the display RAM.
+        self.direction_changes = 0
+
+    def reset(self) -> None:
+        """Forget every pin, watcher and counter."""
+        self.levels.clear()
+        self.modes.clear()
+        self.watchers.clear()
+        self.direction_changes = 0
+
+    def watch(self, id: int, callback) -> None:
+        """
+        Call `callback(level)` whenever a pin changes level.
+
+        :param id: GPIO number.
+        :type id: int
+        :param callback: Function taking the new level.
+        :type callback: callable
+        """
+        self.watchers.setdefault(id, []).append(callback)
+
+    def set_mode(self, id: int, mode: int) -> None:
+        """
+        Record a pin's direction, counting switches between input and output.
+
+        :param id: GPIO number.
+        :type id: int
+        :param mode: `Pin.IN` or `Pin.OUT`.
+        :type mode: int
+        """
+        old = self.modes.get(id)
+        if old is not None and old != mode:
+            self.direction_changes += 1
+        self.modes[id] = mode
+
+    def set(self, id: int, level: int) -> None:
+        """
+        Drive a pin and run its watchers if the level changed.
+
+        :param id: GPIO number.
+        :type id: int
+        :param level: 0 or 1.
+        :type level: int
+        """
+        level = 1 if level else 0
+        if self.levels.get(id, 0) == level:
+            return
+        self.levels[id] = level
+        for callback in self.watchers.get(id, ()):
+            callback(level)
+
+    def get(self, id: int) -> int:
+        """
+        Sample a pin.
+
+        :param id: GPIO number.
+        :type id: int
+        :return: 0 or 1.
+        :rtype: int
+        """
+        return self.levels.get(id, 0)
+
+
+pins = PinRegistry()
+
+
+class Pin:
+    IN = 1
+    OUT = 3
+    OPEN_DRAIN = 7
+    PULL_UP = 1
+    PULL_DOWN = 2
+
+    def __init__(self, id: int, mode: int = -1, pull: int = -1, value: int | None = None):
+        """
+        GPIO pin on the shared registry; no hardware is touched.
+
+        :param id: GPIO number.
+        :type id: int
+        :param mode: `Pin.IN` or `Pin.OUT`; unchanged if -1.
+        :type mode: int
+        :param pull: Ignored.
+        :type pull: int
+        :param value: Initial level for outputs.
+        :type value: int | None
+        """
+        self.id = id
+        self.init(mode, pull, value)
+
+    def __repr__(self) -> str:
+        return f"Pin({self.id})"
+
+    def init(self, mode: int = -1, pull: int = -1, value: int | None = None) -> None:
+        if mode != -1:
+            pins.set_mode(self.id, mode)
+        if value is not None:
+            pins.set(self.id, value)
+
+    @property
+    def level(self) -> int:
+        return pins.get(self.id)
+
+    def on(self) -> None:
+        pins.set(self.id, 1)
+
+    def off(self) -> None:
+        pins.set(self.id, 0)
+
+    def value(self, level: int | None = None) -> int | None:
+        if level is None:
+            return pins.get(self.id)
+        pins.set(self.id, level)
+
+    def __call__(self, level: int | None = None) -> int | None:
+        return self.value(level)
+
+
+# GPIO_OUT_W1TS, GPIO_OUT_W1TC and GPIO_IN of the ESP32-S2, the board the README was tested on; pass these to
+# `RegisterBus(registers=...)` since `os.uname()` on the host doesn't name a supported chip.
+GPIO_REGISTERS = (0x3F404008, 0x3F40400C, 0x3F40403C)
+
+
+class Mem32:
+    def __init__(self, registers: tuple[int, int, int] = GPIO_REGISTERS):
+        """
+        Stand-in for `machine.mem32`: writes to the set and clear registers drive GPIO 0–31 on the pin registry
+        (write-1-to-set, write-1-to-clear) and the input register reads their levels. Other addresses are plain
+        memory.
+
+        :param registers: (set register, clear register, input register) addresses.
+        :type registers: tuple
+        """
+        self.reg_set, self.reg_clr, self.reg_in = registers
+        self.memory = {}
+        self.writes = 0
+        self.reads = 0
+
+    def __setitem__(self, address: int, value: int) -> None:
+        self.writes += 1
+        if address == self.reg_set or address == self.reg_clr:
+            level = 1 if address == self.reg_set else 0
+            gpio = 0
+            while value:
+                if value & 1:
+                    pins.set(gpio, level)
+                value >>= 1
+                gpio += 1
+        else:
+            self.memory[address] = value & 0xFFFFFFFF
+
+    def __getitem__(self, address: int) -> int:
+        self.reads += 1
+        if address == self.reg_in:
+            levels = 0
+            for gpio in range(32):
+                if pins.get(gpio):
+                    levels |= 1 << gpio
+            return levels
+        return self.memory.get(address, 0)
+
+
+mem32 = Mem32()
+
+
+def freq() -> int:
+    return 240_000_000
+
+
+def unique_id() -> bytes:
+    return b"host"
@@ -0,0 +1,24 @@
+"""
+Stand-in for the `micropython` module: the code emitters are no-op decorators, so decorated functions run as plain
+Python.
+"""
+
+
+def native(f):
+    return f
+
+
+def viper(f):
+    return f
+
+
+def const(x):
+    return x
+
+
+def opt_level(level: int | None = None) -> int:
+    return 0
+
+
+def mem_info(verbose: bool = False) -> None:
+    print("[DEBUG] mem_info: not available on the host")
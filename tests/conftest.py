@@ -0,0 +1,57 @@
+"""
+Run the drivers under CPython: the repository root goes on the path and the `host` stand-ins replace `machine`,
+`micropython` and `framebuf` before any test module imports `topway`.
+
+    $ python -m pytest -q
+"""
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import host
+import pytest
+
+host.install()
+
+WIRING = dict(db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1, e=9, rw=10, rs=11, csa=13, csb=12, rstb=14)
+
+
+@pytest.fixture
+def new_panel():
+    """
+    Get a function that wires a fresh emulated panel and a driver to it, with the panel's counters zeroed after the
+    driver's initialisation.
+    """
+    def make(driver: type, **options) -> tuple[host.Panel, object]:
+        host.reset()
+        panel = host.Panel(**WIRING)
+        lcd = driver(**WIRING, **options)
+        panel.reset_counters()
+        return panel, lcd
+
+    return make
+
+
+def check_shows(panel: host.Panel, expected: bytes | bytearray, stats: object = None) -> None:
+    counters = panel.counters()
+    panel.reset_counters()
+    shown = panel.frame()
+    wrong = sum(bin(a ^ b).count("1") for a, b in zip(shown, expected))
+    assert wrong == 0, f"{wrong} pixels differ"
+    for counter in ("unselected", "unknown_commands", "contention"):
+        assert counters[counter] == 0, counter
+    if stats is not None:
+        assert (stats.bytes, stats.commands) == (counters["writes"], counters["commands"])
+
+
+@pytest.fixture
+def assert_shows():
+    """
+    Get a function that checks that the panel shows `expected` pixel for pixel, that it saw no bus errors and, given
+    the driver's `last_flush`, that the flush reported the data writes and commands the panel decoded. It zeroes the
+    panel's counters for the next check.
+    """
+    return check_shows
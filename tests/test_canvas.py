@@ -0,0 +1,151 @@
+"""
+`Canvas` against the list-of-rows path of the bitmap driver, and the `raster` helpers against pixel-by-pixel
+references: every drawing call must set exactly the same pixels.
+"""
+import random
+import pytest
+from topway import Canvas, LM19264
+from topway.font import CourierNew_size12 as font12
+from topway.font import CourierNew_size24 as font24
+from topway.raster import blit_glyph, blit_vlsb, circle_half_heights, corner_profile, fill_rect
+
+rng = random.Random(192)
+PATTERN = [[rng.getrandbits(1) for _ in range(192)] for _ in range(64)]
+ICON = [[(x * y + x) % 3 == 0 for x in range(20)] for y in range(13)]
+
+# (name, arguments after the bitmap), called as `lcd.name(bitmap, *args)` and `canvas.name(*args)`
+DRAWS = (
+    ("draw_text", ("12:34 Wed", 3, 5, font12)),
+    ("draw_text", ("Hg", -4, 30, font24)),
+    ("draw_text", ("inverted", 60, 21, font12, 2, True)),
+    ("draw_graphic_lines", ([[96, 32, angle, 40] for angle in range(0, 360, 25)],)),
+    ("draw_graphic_circle", (30, 30, 25)),
+    ("draw_graphic_circle", (185, 60, 12)),
+    ("draw_graphic_circle_filled", (96, 32, 20)),
+    ("draw_graphic_circle_filled", (4, 3, 9)),
+    ("draw_graphic_circles", ([(40, 20, 10, False), (150, 40, 18, True)],)),
+    ("draw_graphic_box", (10, 5, 100, 40)),
+    ("draw_graphic_box", (20, 9, 150, 50, 12)),
+    ("draw_graphic_box", (120, 30, 90, 50, 7, True)),
+    ("fill_span_rect", (5, 3, 180, 60, "xor")),
+    ("fill_span_rect", (-10, 17, 40, 200, "and")),
+    ("overlay_bitmap", (ICON, 180, 57)),
+    ("overlay_bitmap", (ICON, 7, -4, "replace")),
+)
+
+
+@pytest.mark.parametrize("name, args", DRAWS, ids=[f"{name}-{i}" for i, (name, _) in enumerate(DRAWS)])
+def test_canvas_matches_list_bitmap(new_panel, name, args):
+    _, lcd = new_panel(LM19264)
+    bitmap = [row[:] for row in PATTERN]
+    bitmap = getattr(lcd, name)(bitmap, *args)
+
+    canvas = Canvas.from_bitmap(PATTERN)
+    getattr(canvas, name)(*args)
+    assert canvas.buffer == lcd.pack_bitmap(bitmap)
+    assert canvas.buffer != Canvas.from_bitmap(PATTERN).buffer, "nothing was drawn"
+
+    # The driver hands a canvas over to the canvas method
+    canvas = Canvas.from_bitmap(PATTERN)
+    assert getattr(lcd, name)(canvas, *args) is canvas
+    assert canvas.buffer == lcd.pack_bitmap(bitmap)
+
+
+def test_bitmap_round_trip():
+    canvas = Canvas.from_bitmap(PATTERN)
+    assert canvas.to_bitmap() == PATTERN
+    assert all(canvas.pixel(x, y) == PATTERN[y][x] for y in range(64) for x in range(192))
+
+
+def reference(draw) -> bytearray:
+    """Page buffer with the pixels `draw(x, y)` returns true for."""
+    canvas = Canvas()
+    for y in range(64):
+        for x in range(192):
+            if draw(x, y):
+                canvas.pixel(x, y, 1)
+    return canvas.buffer
+
+
+@pytest.mark.parametrize("y", (0, 5, -3, 60))
+@pytest.mark.parametrize("invert", (False, True))
+def test_blit_glyph(y, invert):
+    glyph, height, width = font24.get_ch("g")
+    pages = (height + 7) >> 3
+    x = 100
+
+    def lit(px, py):
+        col, row = px - x, py - y
+        if not (0 <= col < width and 0 <= row < height):
+            return False
+        bit = glyph[col * pages + (row >> 3)] >> (row & 7) & 1
+        return bool(bit) != invert
+
+    buf = bytearray(1536)
+    blit_glyph(buf, 192, 64, glyph, width, height, x, y, invert)
+    assert buf == reference(lit)
+
+
+@pytest.mark.parametrize("x, y", ((0, 0), (3, 11), (-5, -6), (180, 58)))
+@pytest.mark.parametrize("mode", ("or", "xor", "replace"))
+def test_blit_vlsb(x, y, mode):
+    icon = Canvas()
+    icon.overlay_bitmap(ICON, 0, 0)
+    src = bytes(icon.buffer[page * 192 + col] for page in range(2) for col in range(20))
+    base = Canvas.from_bitmap(PATTERN)
+
+    def lit(px, py):
+        under = PATTERN[py][px]
+        col, row = px - x, py - y
+        if not (0 <= col < 20 and 0 <= row < 13):
+            return under
+        pixel = ICON[row][col]
+        if mode == "or":
+            return under or pixel
+        if mode == "xor":
+            return under != bool(pixel)
+        return pixel
+
+    blit_vlsb(base.buffer, 192, 64, src, 20, 13, x, y, mode)
+    assert base.buffer == reference(lit)
+
+
+@pytest.mark.parametrize("mode", ("or", "and", "xor"))
+@pytest.mark.parametrize("box", ((0, 0, 191, 63), (5, 3, 6, 60), (-4, 9, 30, 15), (100, 17, 99, 30)))
+def test_fill_rect(mode, box):
+    x0, y0, x1, y1 = box
+    buf = Canvas.from_bitmap(PATTERN).buffer
+
+    def lit(px, py):
+        inside = x0 <= px <= x1 and y0 <= py <= y1
+        under = PATTERN[py][px]
+        if not inside:
+            return under
+        return {"or": True, "and": False, "xor": not under}[mode]
+
+    fill_rect(buf, 192, 64, x0, y0, x1, y1, mode)
+    assert buf == reference(lit)
+
+
+def outline(radius: int) -> set:
+    """(dx, dy) offsets of a midpoint circle's pixels, as `Canvas.draw_graphic_circle()` draws them."""
+    canvas = Canvas()
+    canvas.draw_graphic_circle(96, 32, radius)
+    return {(x - 96, y - 32) for y in range(64) for x in range(192) if canvas.pixel(x, y)}
+
+
+@pytest.mark.parametrize("radius", (1, 2, 7, 16, 31))
+def test_corner_profile(radius):
+    points = outline(radius)
+    outer, inner = corner_profile(radius)
+    for b in range(radius + 1):
+        row = [dx for dx, dy in points if dy == b and dx >= 0]
+        assert (outer[b], inner[b]) == (max(row), min(row))
+    assert corner_profile(radius) is corner_profile(radius)
+
+
+@pytest.mark.parametrize("radius", (0, 1, 5, 13, 31))
+def test_circle_half_heights(radius):
+    points = outline(radius) if radius else {(0, 0)}
+    heights = circle_half_heights(radius)
+    assert list(heights) == [max(dy for dx, dy in points if dx >= a) for a in range(radius + 1)]
@@ -0,0 +1,151 @@
+"""
+Page-packed images: run-length compression, icon atlases against the source icons under `weather/64`, and the sprite
+cache's bookkeeping.
+"""
+import json
+import os
+import random
+import struct
+import pytest
+from topway import Canvas
+from topway.icons import ATLAS_ENTRY, ATLAS_HEADER, ATLAS_MAGIC, FORMAT_RLE, FORMAT_VLSB, IconAtlas, fnv1a, pack_vlsb
+from topway.rle import decode_rle, encode_rle
+from topway.sprites import SpriteCache, sprite_size
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ICONS = os.path.join(ROOT, "weather", "64")
+ATLAS = os.path.join(ROOT, "weather", "64.atlas")
+NAMES = ("moon-night-stars", "forecast-weather-sun-sunny-hot-summer", "cloud-snow-winter-cold")
+
+rng = random.Random(64)
+SAMPLES = {
+    "empty": b"",
+    "blank": bytes(512),
+    "noise": bytes(rng.getrandbits(8) for _ in range(300)),
+    "runs of two": bytes(value for value in range(100) for _ in range(2)),
+    "long run": b"\x01" + b"\xaa" * 1000 + b"\x02",
+    "literal then run": bytes(range(200)) + b"\x00" * 200 + bytes(range(130)),
+}
+
+
+def source_icon(name: str) -> bytearray:
+    with open(os.path.join(ICONS, name + ".json")) as f:
+        return pack_vlsb(json.load(f))
+
+
+@pytest.mark.parametrize("data", SAMPLES.values(), ids=SAMPLES.keys())
+def test_rle_round_trip(data, tmp_path):
+    compressed = encode_rle(data)
+    assert decode_rle(compressed, bytearray(len(data)), len(data)) == data
+
+    # From a stream, read a small chunk at a time
+    path = tmp_path / "image.rle"
+    path.write_bytes(compressed)
+    with open(path, "rb") as f:
+        assert decode_rle(f, bytearray(len(data)), len(data)) == data
+
+
+def test_rle_truncated():
+    compressed = encode_rle(bytes(range(100)))
+    with pytest.raises(ValueError):
+        decode_rle(compressed[:-1], bytearray(100), 100)
+
+
+def test_rle_compresses_icons():
+    for name in NAMES:
+        icon = source_icon(name)
+        assert len(encode_rle(icon)) < len(icon) // 2
+
+
+def write_atlas(path: str, icons: dict, fmt: int) -> None:
+    """Lay out an atlas as described at the top of `topway/icons.py`, every icon in the same format."""
+    entries = sorted((fnv1a(name), data) for name, data in icons.items())
+    offset = struct.calcsize(ATLAS_HEADER) + len(entries) * struct.calcsize(ATLAS_ENTRY)
+    index = b""
+    blob = b""
+    for key, data in entries:
+        stored = encode_rle(data) if fmt == FORMAT_RLE else data
+        index += struct.pack(ATLAS_ENTRY, key, offset + len(blob), 64, 64, fmt)
+        blob += stored
+    with open(path, "wb") as f:
+        f.write(struct.pack(ATLAS_HEADER, ATLAS_MAGIC, len(entries), 0) + index + blob)
+
+
+@pytest.mark.parametrize("fmt", (FORMAT_VLSB, FORMAT_RLE), ids=("vlsb", "rle"))
+def test_icon_atlas(tmp_path, fmt):
+    icons = {name: source_icon(name) for name in NAMES}
+    path = str(tmp_path / "icons.atlas")
+    write_atlas(path, icons, fmt)
+
+    with IconAtlas(path) as atlas:
+        assert len(atlas) == len(NAMES)
+        assert "no-such-icon" not in atlas
+        with pytest.raises(KeyError):
+            atlas.load("no-such-icon")
+
+        for name, icon in icons.items():
+            assert atlas.size(name) == (64, 64)
+            assert atlas.load(name) == (icon, 64, 64)
+
+            for x, y, mode in ((0, 0, "or"), (100, 5, "replace"), (-10, 20, "xor"), (150, -3, "or")):
+                expected = Canvas.from_bitmap([[(col + row) & 1 for col in range(192)] for row in range(64)])
+                drawn = Canvas(bytearray(expected.buffer))
+                expected.blit(icon, 64, 64, x, y, mode)
+                assert atlas.blit(name, drawn, x, y, mode) == (64, 64)
+                assert drawn.buffer == expected.buffer
+
+
+def test_weather_atlas():
+    with IconAtlas(ATLAS) as atlas:
+        names = [name[:-5] for name in os.listdir(ICONS) if name.endswith(".json")]
+        assert len(atlas) == len(names)
+        buf = bytearray(512)
+        for name in names:
+            assert atlas.load(name, buf) == (buf, 64, 64)
+            assert buf == source_icon(name)
+
+
+def test_not_an_atlas(tmp_path):
+    path = tmp_path / "icon.bin"
+    path.write_bytes(bytes(512))
+    with pytest.raises(ValueError):
+        IconAtlas(str(path))
+
+
+def test_sprite_size():
+    assert sprite_size(bytearray(512)) == 512
+    assert sprite_size((bytearray(512), 64, 64)) == 512
+    assert sprite_size(Canvas()) == 1536
+    assert sprite_size([[0] * 10] * 3) == 4 * (3 + 30)
+    with pytest.raises(TypeError):
+        sprite_size(object())
+
+
+def test_sprite_cache():
+    loads = []
+
+    def loader(name):
+        loads.append(name)
+        return bytearray(100)
+
+    cache = SpriteCache(budget=300, loader=loader)
+    for name in ("a", "b", "c", "a", "d", "b", "a"):
+        cache.get(name)
+    # a, b, c load; a hits; d evicts b; b evicts c; a hits
+    assert loads == ["a", "b", "c", "d", "b"]
+    assert (cache.hits, cache.misses, cache.evictions) == (2, 5, 2)
+    assert list(cache._sprites) == ["d", "b", "a"]
+    assert (len(cache), cache.size) == (3, 300)
+    assert "c" not in cache
+
+    # Sprites over the whole budget are returned but not kept, and evict nothing
+    assert len(cache.get("big", lambda name: bytearray(400))) == 400
+    assert "big" not in cache and cache.evictions == 2
+
+    # Replacing a sprite frees its old size first
+    cache.put("a", bytearray(50))
+    assert cache.size == 250 and cache.evictions == 2
+    cache.discard("d")
+    assert (len(cache), cache.size) == (2, 150)
+
+    assert SpriteCache().get("x") is None
@@ -0,0 +1,135 @@
+"""
+Both drivers against the emulated controllers (`host.Panel`): what the panel shows must match what was drawn, pixel
+for pixel, and `last_flush` must agree with the bus traffic the panel saw.
+"""
+import random
+import pytest
+from host.machine import GPIO_REGISTERS, mem32
+from topway import LM19264
+from topway.bus import RegisterBus
+from topway.font import CourierNew_size12 as font12
+from topway.LM19264framebuf import LM19264 as LM19264fb
+
+rng = random.Random(19264)
+FRAMES = [bytes(rng.getrandbits(8) for _ in range(1536)) for _ in range(2)]
+
+
+def test_display_bitmap(new_panel, assert_shows):
+    panel, lcd = new_panel(LM19264)
+    for frame in FRAMES:
+        lcd.display_bitmap(frame)
+        assert_shows(panel, frame, lcd.last_flush)
+
+
+def test_read_display_to_bitmap(new_panel, assert_shows):
+    panel, lcd = new_panel(LM19264)
+    lcd.display_bitmap(FRAMES[0])
+    assert lcd.pack_bitmap(lcd.read_display_to_bitmap()) == panel.ram()
+    # Reading must leave the display as it was
+    assert_shows(panel, FRAMES[0])
+
+
+def test_display_bitmap_register_bus(new_panel, assert_shows):
+    panel, lcd = new_panel(LM19264)
+    # DB0 to DB7 on GPIO 8 down to 1, as wired by `new_panel`
+    lcd.bus = RegisterBus(data=(8, 7, 6, 5, 4, 3, 2, 1), rs=lcd.rs, rw=lcd.rw, e=lcd.e, csa=lcd.csa, csb=lcd.csb,
+                          registers=GPIO_REGISTERS, mem=mem32)
+    lcd.invalidate_address()
+    for frame in FRAMES:
+        lcd.display_bitmap(frame)
+        assert_shows(panel, frame, lcd.last_flush)
+
+
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_updates(new_panel, assert_shows, shadow):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    lcd.fill(0)
+    lcd.display(full=True)
+    assert_shows(panel, lcd.buffer)
+
+    lcd.draw_text("12:34 Wed 27", 3, 2, font12)
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+    lcd.draw_graphic_box(100, 20, 60, 30, radius=6, fill=True)
+    lcd.draw_graphic_lines([(10, 60, 30, 40), (150, 5, 200, 30)])
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+    lcd.fill_rect(60, 33, 9, 9, 1)
+    lcd.mark_dirty(60, 33, 9, 9)
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_fill_is_flushed(new_panel, assert_shows, shadow):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    lcd.draw_text("12:34", 0, 0, font12)
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+    lcd.fill(0)
+    lcd.display()
+    assert_shows(panel, bytes(1536), lcd.last_flush)
+    lcd.fill(1)
+    lcd.display()
+    assert_shows(panel, b"\xff" * 1536, lcd.last_flush)
+
+
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_scroll_vertical(new_panel, assert_shows, shadow):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    lcd.draw_text("top line", 0, 0, font12)
+    lcd.display(full=True)
+    panel.reset_counters()
+    for dy in (5, -13, 21):
+        lcd.scroll_vertical(dy)
+        assert_shows(panel, lcd.buffer, lcd.last_flush)
+        lcd.draw_text(f"scrolled {dy}", 0, 52 if dy > 0 else 0, font12)
+        lcd.display()
+        assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_display_bitmap(new_panel, assert_shows, shadow):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    # After a scroll the start line is no longer 0, and display_bitmap() must still show the image the right way up
+    lcd.draw_text("before", 0, 0, font12)
+    lcd.display(full=True)
+    lcd.scroll_vertical(11)
+    panel.reset_counters()
+
+    lcd.display_bitmap(FRAMES[0])
+    assert_shows(panel, FRAMES[0], lcd.last_flush)
+
+    # The next flush compares against what display_bitmap() sent, not the buffer from before it
+    lcd.buffer[:] = FRAMES[0]
+    lcd.draw_text("after", 0, 40, font12)
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_display_after_display_bitmap(new_panel, assert_shows, shadow):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    lcd.draw_text("framebuffer", 0, 0, font12)
+    lcd.display(full=True)
+    lcd.display_bitmap(FRAMES[1])
+    panel.reset_counters()
+
+    # Nothing was drawn since, but the panel shows the bitmap, so display() must bring back the whole framebuffer
+    lcd.display()
+    assert_shows(panel, lcd.buffer, lcd.last_flush)
+
+
+@pytest.mark.parametrize("start", (0, 13), ids=("unscrolled", "scrolled"))
+@pytest.mark.parametrize("shadow", (False, True), ids=("dirty", "shadow"))
+def test_framebuf_display_after_write_run(new_panel, assert_shows, shadow, start):
+    panel, lcd = new_panel(LM19264fb, shadow=shadow)
+    lcd.display(full=True)
+    lcd.scroll_vertical(start)
+    for page in (0, 7):
+        lcd.write_run(1, page, 10, b"\xff" * 40, 0, 40)
+    lcd.display()
+    # The buffer is still blank, so the flush must overwrite the runs written behind its back
+    assert_shows(panel, lcd.buffer)
@@ -0,0 +1,93 @@
+"""
+`RegisterBus` mask tables against a fake GPIO register file that applies the set/clear writes like the hardware
+(write-1-to-set, write-1-to-clear), and the chip lookup that picks the registers.
+"""
+import pytest
+from machine import Pin
+from topway import bus
+from topway.bus import RegisterBus, chip_name
+from types import SimpleNamespace
+
+REG_SET = 0x1008
+REG_CLR = 0x100C
+REG_IN = 0x103C
+
+# The wiring from the README (DB0 on GPIO 8 down to DB7 on GPIO 1, so the bits are reversed on the port), a straight
+# one and a scattered one.
+WIRINGS = (
+    (8, 7, 6, 5, 4, 3, 2, 1),
+    (0, 1, 2, 3, 4, 5, 6, 7),
+    (31, 16, 3, 22, 9, 0, 27, 12),
+)
+
+
+class FakeRegisterFile:
+    """Stands in for `machine.mem32` with a W1TS/W1TC output register and an input register."""
+
+    def __init__(self):
+        self.out = 0
+
+    def __setitem__(self, address: int, value: int) -> None:
+        if address == REG_SET:
+            self.out |= value
+        elif address == REG_CLR:
+            self.out &= ~value
+        else:
+            raise ValueError(f"write to unexpected register 0x{address:08x}")
+
+    def __getitem__(self, address: int) -> int:
+        if address != REG_IN:
+            raise ValueError(f"read from unexpected register 0x{address:08x}")
+        return self.out
+
+
+def register_bus(gpios: tuple, mem: FakeRegisterFile) -> RegisterBus:
+    rs, rw, e, csa, csb = (Pin(gpio, Pin.OUT) for gpio in (40, 41, 42, 43, 44))
+    return RegisterBus(data=gpios, rs=rs, rw=rw, e=e, csa=csa, csb=csb, registers=(REG_SET, REG_CLR, REG_IN), mem=mem)
+
+
+@pytest.mark.parametrize("gpios", WIRINGS)
+def test_every_byte_value(gpios):
+    mem = FakeRegisterFile()
+    data_bus = register_bus(gpios, mem)
+    # Noise on an unrelated GPIO must survive every write
+    other = 1 << 13 if 13 not in gpios else 1 << 14
+    mem.out = other
+
+    for value in range(256):
+        data_bus.set_data(value)
+        levels = [bool(mem.out & (1 << gpio)) for gpio in gpios]
+        assert levels == [bool(value & (1 << bit)) for bit in range(8)], f"byte 0x{value:02x}"
+        assert mem.out & other, f"byte 0x{value:02x} cleared an unrelated GPIO"
+        assert data_bus.get_data() == value
+
+
+@pytest.mark.parametrize("gpio", (32, -1))
+def test_gpio_outside_bank_0(gpio):
+    with pytest.raises(ValueError):
+        register_bus((gpio, 1, 2, 3, 4, 5, 6, 7), FakeRegisterFile())
+
+
+@pytest.mark.parametrize("machine, chip", (
+    ("ESP32 module with ESP32", "ESP32"),
+    ("ESP32-S2 module with ESP32S2", "ESP32S2"),
+    ("ESP32C3 module with ESP32C3", "ESP32C3"),
+    ("ESP32C6 module with ESP32C6", "ESP32C6"),
+    ("Raspberry Pi Pico with RP2040", "RP2040"),
+))
+def test_chip_name(machine, chip):
+    assert chip_name(machine) == chip
+
+
+@pytest.mark.parametrize("machine, registers", (
+    ("ESP32 module with ESP32", dict(bus.REGISTERS)["ESP32"]),
+    ("ESP32-S3 module with ESP32S3", dict(bus.REGISTERS)["ESP32S3"]),
+    ("Raspberry Pi Pico with RP2040", dict(bus.REGISTERS)["RP2040"]),
+    # Newer variants have other register maps and must not be taken for a classic ESP32
+    ("ESP32C6 module with ESP32C6", None),
+    ("ESP32H2 module with ESP32H2", None),
+    ("Generic ESP32P4 module with ESP32P4", None),
+))
+def test_detect_registers(monkeypatch, machine, registers):
+    monkeypatch.setattr(bus.os, "uname", lambda: SimpleNamespace(machine=machine))
+    assert bus.detect_registers() == registers
@@ -0,0 +1,131 @@
+"""
+Text measuring and glyph lookups against the font modules' own `get_ch()`, the glyph cache of the FrameBuffer driver,
+and unloading fonts through `FontRegistry`.
+"""
+import sys
+import pytest
+from topway import text
+from topway.font import Aclonica_size24, CourierNew_size12, CourierNew_size36
+from topway.fonts import FontRegistry
+from topway.glyphs import GlyphCache
+from topway.LM19264framebuf import LM19264 as LM19264fb
+from topway.text import IndexedFont, indexed_font, text_bbox, text_width
+
+FONTS = (CourierNew_size12, CourierNew_size36, Aclonica_size24)
+# Printable ASCII, characters past it and one no font has
+SAMPLE = "".join(chr(code) for code in range(32, 127)) + "°äß\n☃"
+
+
+@pytest.mark.parametrize("font", FONTS, ids=lambda font: font.__name__.rpartition(".")[2])
+@pytest.mark.parametrize("spacing", (0, 1, 3))
+def test_text_width(font, spacing):
+    expected = sum(font.get_ch(char)[2] + spacing for char in SAMPLE)
+    # Twice, so the second pass reads the tables built by the first
+    assert text_width(font, SAMPLE, spacing) == expected
+    assert text_width(font, SAMPLE, spacing) == expected
+    assert text_width(indexed_font(font), SAMPLE, spacing) == expected
+
+    first, widths, extra = text.advance_widths(font)
+    for char in SAMPLE:
+        width = font.get_ch(char)[2]
+        code = ord(char)
+        assert (widths[code - first] if 0 <= code - first < len(widths) else extra[code]) == width
+
+
+def test_text_bbox():
+    width = text_width(CourierNew_size12, "12:34", 2) - 2
+    assert text_bbox(CourierNew_size12, "12:34", 100, 5, 2) == (100, 5, width, CourierNew_size12.height())
+    assert text_bbox(CourierNew_size12, "12:34", 100, 5, 2, "right")[0] == 100 - width
+    assert text_bbox(CourierNew_size12, "12:34", 100, 5, 2, "center")[0] == 100 - width // 2
+
+
+@pytest.mark.parametrize("font", FONTS, ids=lambda font: font.__name__.rpartition(".")[2])
+def test_indexed_font(font):
+    wrapper = indexed_font(font)
+    assert isinstance(wrapper, IndexedFont)
+    assert indexed_font(font) is wrapper and indexed_font(wrapper) is wrapper
+    assert wrapper.height() == font.height()
+    for char in SAMPLE:
+        glyph, height, width = font.get_ch(char)
+        cached = wrapper.get_ch(char)
+        assert (cached[1], cached[2]) == (height, width)
+        assert (cached[0] is None) == (glyph is None)
+        if glyph is not None:
+            assert bytes(cached[0]) == bytes(glyph)
+
+
+@pytest.mark.parametrize("invert", (False, True))
+def test_draw_text_without_glyph_cache(new_panel, invert):
+    _, cached = new_panel(LM19264fb)
+    _, plain = new_panel(LM19264fb, glyph_cache=0)
+    assert cached.glyph_cache is not None and plain.glyph_cache is None
+
+    for lcd in (cached, plain):
+        lcd.fill_rect(0, 20, 192, 10, 1)
+        lcd.draw_text("Hello, 12:34", 3, -2, CourierNew_size36, invert=invert)
+        lcd.draw_text("äöü °C", 150, 23, CourierNew_size12, spacing=2, invert=invert)
+    assert cached.buffer == plain.buffer
+    # The second draw of the same text only hits the cache
+    misses = cached.glyph_cache.misses
+    cached.draw_text("Hello, 12:34", 3, -2, CourierNew_size36, invert=invert)
+    assert cached.glyph_cache.misses == misses
+
+
+def test_glyph_cache_budget_and_lru():
+    font = CourierNew_size12
+    size = len(font.get_ch("A")[0])  # bytes per glyph of a fixed-width font
+    cache = GlyphCache(budget=3 * size)
+
+    for char in "ABC":
+        cache.get(font, char)
+    cache.get(font, "A")  # A is now the most recently used, B the least
+    cache.get(font, "D")
+    assert cache.size == 3 * size <= cache.budget
+    assert [key[1] for key in cache._glyphs] == ["C", "A", "D"]
+    assert (cache.hits, cache.misses) == (1, 4)
+
+    # Inverted glyphs are cached on their own and count against the same budget
+    cache.get(font, "A", invert=True)
+    assert [key[1:] for key in cache._glyphs] == [("A", False), ("D", False), ("A", True)]
+    assert cache.size <= cache.budget
+
+    # A glyph larger than the whole budget is returned but not cached
+    fb, height, width = cache.get(CourierNew_size36, "W")
+    assert fb is not None and cache.size <= cache.budget
+    assert all(key[0] is font for key in cache._glyphs)
+
+    cache.discard_font(font)
+    assert (len(cache._glyphs), cache.size) == (0, 0)
+
+
+def test_font_registry_evict():
+    cache = GlyphCache()
+    registry = FontRegistry(indexed=True, glyph_cache=cache)
+    font = registry.get("Luminari", 24)
+    module = font.font
+    assert registry.loaded() == [("Luminari", 24)] and registry.loads == 1
+    assert registry.get("Luminari", 24) is font and registry.loads == 1
+
+    text_width(font, "Luminari °")
+    text_width(module, "Luminari °")
+    cache.get(font, "L")
+    cache.get(module, "L", invert=True)
+
+    assert registry.evict("Luminari", 24)
+    assert not registry.evict("Luminari", 24)
+    assert registry.loaded() == [] and registry.size == 0
+    assert module not in text._INDEXED
+    assert module not in text._ADVANCES and font not in text._ADVANCES
+    assert cache.size == 0 and not cache._glyphs
+    assert module.__name__ not in sys.modules
+    assert not hasattr(sys.modules["topway.font"], "Luminari_size24")
+
+
+def test_font_registry_budget():
+    registry = FontRegistry(budget=1)
+    registry.get("Babycake", 24)
+    registry.get("Babycake", 36)
+    # Over budget: the older font goes, the one asked for stays even though it's larger than the budget
+    assert registry.loaded() == [("Babycake", 36)]
+    assert registry.evictions == 1
+    registry.evict("Babycake", 36)
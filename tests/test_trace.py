@@ -0,0 +1,138 @@
+"""
+Bus traces recorded with `RecordingBus` survive export and load and replay onto a second emulated panel, and
+`profile=True` instruments a driver while `profile=False` leaves it alone.
+"""
+import pytest
+import host
+from host.machine import Pin
+from topway import trace
+from topway.bus import PinBus
+from topway.font import CourierNew_size12 as font12
+from topway.LM19264framebuf import LM19264 as LM19264fb
+
+WIRING = dict(db0=8, db1=7, db2=6, db3=5, db4=4, db5=3, db6=2, db7=1, e=9, rw=10, rs=11, csa=13, csb=12, rstb=14)
+
+
+def record(lcd: LM19264fb, panel: host.Panel, frames: int) -> list:
+    """Draw and flush some frames through the driver's `RecordingBus`; return what the panel showed after each."""
+    shown = []
+    for frame in range(frames):
+        # Every frame selects and addresses every controller again, so any frame can be replayed on its own
+        lcd.bus.invalidate()
+        lcd.invalidate_address()
+        lcd.fill(0)
+        lcd.draw_text(f"frame {frame}", frame * 3, 20, font12)
+        lcd.draw_graphic_box(frame * 5, 40, 30, 20, radius=3, fill=frame % 2 == 1)
+        lcd.display()
+        lcd.bus.mark_frame()
+        shown.append(panel.frame())
+    return shown
+
+
+def replay_panel() -> tuple[host.Panel, PinBus]:
+    """A fresh emulated panel behind a bus of its own, switched on with the start line at 0."""
+    host.reset()
+    panel = host.Panel(**WIRING)
+    pins = {name: Pin(gpio, Pin.OUT, value=0) for name, gpio in WIRING.items()}
+    bus = PinBus(data=tuple(pins[f"db{bit}"] for bit in range(8)), rs=pins["rs"], rw=pins["rw"], e=pins["e"],
+                 csa=pins["csa"], csb=pins["csb"])
+    for region in range(3):
+        bus.select(region)
+        bus.write(0x3F, 0)
+        bus.write(0xC0, 0)
+    return panel, bus
+
+
+@pytest.mark.parametrize("timestamps", (False, True))
+def test_export_load_replay(new_panel, tmp_path, timestamps):
+    panel, lcd = new_panel(LM19264fb)
+    lcd.bus = trace.RecordingBus(lcd.bus, capacity=20000, timestamps=timestamps)
+    shown = record(lcd, panel, 5)
+    assert lcd.bus.dropped == 0
+
+    path = str(tmp_path / "frames.trace")
+    count = lcd.bus.export(path)
+    entries, stamps = trace.load(path)
+    assert count == len(entries) == lcd.bus.recorded
+    assert (entries, stamps) == lcd.bus.events()
+    assert (stamps is not None) == timestamps
+
+    per_frame = trace.summarize(entries)
+    assert len(per_frame) == 5
+    assert sum(counts["data"] for counts in per_frame) == sum(1 for entry in entries if entry >> 8 == trace.DATA)
+
+    replayed, bus = replay_panel()
+    matches = []
+    totals = trace.replay(entries, bus, on_frame=lambda number: matches.append(replayed.frame() == shown[number]))
+    assert matches == [True] * 5
+    assert totals["frame"] == 5
+    assert totals["data"] == sum(counts["data"] for counts in per_frame)
+
+
+def test_replay_after_wrap(new_panel, tmp_path):
+    panel, lcd = new_panel(LM19264fb)
+    lcd.bus = trace.RecordingBus(lcd.bus, capacity=2500)
+    shown = record(lcd, panel, 6)
+    recorded = lcd.bus.recorded
+    assert lcd.bus.dropped == recorded - 2500 > 0
+
+    path = str(tmp_path / "wrapped.trace")
+    assert lcd.bus.export(path) == 2500
+    entries, _ = trace.load(path)
+    assert entries == lcd.bus.events()[0]
+    # Oldest first: the file ends with the last frame marker
+    assert entries[-1] == (trace.FRAME << 8) | 5
+
+    # The frames that were kept whole replay exactly, starting at the first marker left in the ring
+    first = next(i for i, entry in enumerate(entries) if entry >> 8 == trace.FRAME)
+    replayed, bus = replay_panel()
+    matches = []
+    trace.replay(entries[first + 1:], bus, on_frame=lambda number: matches.append(replayed.frame() == shown[number]))
+    assert matches and all(matches)
+    assert replayed.frame() == shown[-1]
+
+
+def test_load_rejects_other_files(tmp_path):
+    path = tmp_path / "not.trace"
+    path.write_bytes(b"TWBX" + bytes(6))
+    with pytest.raises(ValueError):
+        trace.load(str(path))
+
+    path.write_bytes(b"TWBT\x00\x00\x10\x00\x00\x00" + bytes(4))
+    with pytest.raises(ValueError):
+        trace.load(str(path))
+
+
+def test_profile(new_panel):
+    _, lcd = new_panel(LM19264fb, profile=True)
+    for _ in range(3):
+        lcd.draw_text("12:34", 0, 0, font12)
+        lcd.display()
+
+    stats = lcd.profiler.stats()
+    assert stats["display"]["calls"] == stats["draw_text"]["calls"] == 3
+    assert stats["_write_run"]["calls"] > 0
+    assert stats["scroll_vertical"]["calls"] == 0
+    for record in stats.values():
+        assert sum(record["histogram"]) == record["calls"]
+        assert record["max_us"] <= record["total_us"]
+    # The wrappers are set on the instance
+    assert "display" in vars(lcd)
+
+
+def test_profile_named_methods(new_panel):
+    _, lcd = new_panel(LM19264fb, profile=("display",))
+    lcd.display()
+    assert list(lcd.profiler.stats()) == ["display"]
+
+    lcd.profiler.reset()
+    assert lcd.profiler.stats()["display"]["calls"] == 0
+
+
+def test_no_profile(new_panel):
+    _, lcd = new_panel(LM19264fb)
+    assert lcd.profiler is None
+    for name in LM19264fb.PROFILED:
+        method = getattr(lcd, name)
+        assert name not in vars(lcd)
+        assert method.__self__ is lcd and method.__func__ is getattr(LM19264fb, name)
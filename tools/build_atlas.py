@@ -0,0 +1,110 @@
+"""
+Pack a set of icons into a single atlas file for `topway.icons.IconAtlas`.
+
+Inputs can be JSON / Python list-of-lists images (packed like `img2vlsb.py` does) or raw page-packed `.bin` files,
+whose dimensions are given with `--size`. Each icon is named after its file without the extension, which is the name
+passed to `IconAtlas.load()`. With `--rle` each icon is stored run-length compressed (format 1) unless that would
+not make it smaller. The file layout is described at the top of `topway/icons.py`.
+
+Runs on the host with regular Python; the hash, layout and compression are the ones in `topway.icons` and
+`topway.rle` (`img2vlsb` installs the `host` stand-ins they need):
+
+    $ python tools/build_atlas.py weather/64/*.json --out weather/64.atlas
+    $ python tools/build_atlas.py weather/64/*.bin --size 64x64 --out weather/64.atlas --rle
+"""
+import argparse
+import os
+import struct
+import sys
+
+from img2vlsb import read_bitmap
+from topway.icons import ATLAS_ENTRY, ATLAS_HEADER, ATLAS_MAGIC, FORMAT_RLE, FORMAT_VLSB, fnv1a, pack_vlsb
+from topway.rle import encode_rle
+
+
+def read_icon(path: str, var: str, size: tuple[int, int]) -> tuple[bytes, int, int]:
+    """
+    Read one input as page-packed data.
+
+    :param path: Input file.
+    :type path: str
+    :param var: Variable name to look for in Python files.
+    :type var: str
+    :param size: (width, height) of raw `.bin` inputs.
+    :type size: tuple
+    :return: Tuple of (packed data, width, height).
+    :rtype: tuple
+    """
+    if path.endswith(".bin"):
+        width, height = size
+        with open(path, "rb") as f:
+            data = f.read()
+        if len(data) != width * ((height + 7) // 8):
+            raise ValueError(f"{path}: {len(data)} bytes is not a {width}x{height} page-packed icon")
+        return data, width, height
+
+    bitmap = read_bitmap(path, var)
+    return bytes(pack_vlsb(bitmap)), len(bitmap[0]) if bitmap else 0, len(bitmap)
+
+
+def build_atlas(icons: dict, rle: bool = False) -> bytes:
+    """
+    Lay out an atlas: header, index sorted by name hash, then the icon data in the same order.
+
+    :param icons: Mapping of name to (packed data, width, height).
+    :type icons: dict
+    :param rle: Store icons run-length compressed where that's smaller.
+    :type rle: bool
+    :return: Atlas file contents.
+    :rtype: bytes
+    """
+    entries = {}
+    for name, icon in icons.items():
+        key = fnv1a(name)
+        if key in entries:
+            raise ValueError(f"`{name}` and `{entries[key][0]}` have the same hash; rename one of them")
+        entries[key] = (name,) + icon
+
+    header = struct.pack(ATLAS_HEADER, ATLAS_MAGIC, len(entries), 0)
+    offset = len(header) + len(entries) * struct.calcsize(ATLAS_ENTRY)
+    index = bytearray()
+    data = bytearray()
+    for key in sorted(entries):
+        _, packed, width, height = entries[key]
+        fmt = FORMAT_VLSB
+        if rle:
+            compressed = encode_rle(packed)
+            if len(compressed) < len(packed):
+                packed = compressed
+                fmt = FORMAT_RLE
+        index += struct.pack(ATLAS_ENTRY, key, offset + len(data), width, height, fmt)
+        data += packed
+    return header + bytes(index) + bytes(data)
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="JSON / Python images or raw page-packed .bin files")
+    parser.add_argument("--out", required=True, help="atlas file to write")
+    parser.add_argument("--var", default="img", help="variable holding the image in Python files (default: img)")
+    parser.add_argument("--rle", action="store_true", help="run-length compress icons where it makes them smaller")
+    parser.add_argument("--size", default="64x64", help="WIDTHxHEIGHT of raw .bin inputs (default: 64x64)")
+    args = parser.parse_args(argv)
+
+    size = tuple(int(n) for n in args.size.lower().split("x"))
+    icons = {}
+    for path in args.inputs:
+        name = os.path.splitext(os.path.basename(path))[0]
+        if name in icons:
+            raise ValueError(f"{path}: an icon named `{name}` was already added")
+        icons[name] = read_icon(path, args.var, size)
+
+    atlas = build_atlas(icons, args.rle)
+    with open(args.out, "wb") as f:
+        f.write(atlas)
+    print(f"{len(icons)} icons -> {args.out}: {len(atlas)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Convert list-of-lists images into raw page-packed (MONO_VLSB) files for `topway.icons.load_icon()`.
+
+Accepts the JSON icons under `weather/` (a list of rows of 0/1) and Python files that assign such a list to a variable,
+like `img` in `EXAMPLES/Cat.py`. Each input is written next to it (or into `--out`) with a `.bin` extension; a 64×64
+icon becomes 512 bytes. With `--rle` the data is run-length compressed (see `topway/rle.py`) and written with an
+`.rle` extension instead, for `Canvas.blit_rle()`.
+
+Runs on the host with regular Python; the packing and compression are the ones in `topway.icons` and `topway.rle`,
+imported with the `host` stand-ins installed:
+
+    $ python tools/img2vlsb.py weather/64/*.json
+    $ python tools/img2vlsb.py EXAMPLES/Cat.py --var img --out /tmp
+    $ python tools/img2vlsb.py weather/64/*.json --rle
+"""
+import argparse
+import ast
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+import host
+
+host.install()
+
+from topway.icons import pack_vlsb
+from topway.rle import encode_rle
+
+
+def read_bitmap(path: str, var: str) -> list:
+    """
+    Read a list-of-lists image from a JSON file or from a variable assignment in a Python file.
+
+    :param path: Input file.
+    :type path: str
+    :param var: Variable name to look for in Python files.
+    :type var: str
+    :return: List of rows.
+    :rtype: list
+    :raises ValueError: If the rows don't all have the same width.
+    """
+    with open(path, "r") as f:
+        text = f.read()
+
+    if not path.endswith(".py"):
+        bitmap = json.loads(text)
+    else:
+        # Parse rather than import, so the example's hardware setup doesn't run
+        for node in ast.walk(ast.parse(text, filename=path)):
+            if isinstance(node, ast.Assign) and any(isinstance(t, ast.Name) and t.id == var for t in node.targets):
+                bitmap = ast.literal_eval(node.value)
+                break
+        else:
+            raise ValueError(f"{path}: no assignment to `{var}`")
+
+    # `pack_vlsb()` takes the width from the first row
+    if any(len(row) != len(bitmap[0]) for row in bitmap):
+        raise ValueError(f"{path}: all rows must have the same width")
+    return bitmap
+
+
+def main(argv: list | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("inputs", nargs="+", help="JSON or Python files holding list-of-lists images")
+    parser.add_argument("--var", default="img", help="variable holding the image in Python files (default: img)")
+    parser.add_argument("--out", help="output directory (default: next to each input)")
+    parser.add_argument("--rle", action="store_true", help="run-length compress and write .rle files")
+    args = parser.parse_args(argv)
+
+    for path in args.inputs:
+        bitmap = read_bitmap(path, args.var)
+        packed = pack_vlsb(bitmap)
+        if args.rle:
+            packed = encode_rle(packed)
+
+        name = os.path.splitext(os.path.basename(path))[0] + (".rle" if args.rle else ".bin")
+        out = os.path.join(args.out or os.path.dirname(path), name)
+        with open(out, "wb") as f:
+            f.write(packed)
+
+        width = len(bitmap[0]) if bitmap else 0
+        print(f"{path} -> {out}: {width}x{len(bitmap)}, {os.path.getsize(path)} -> {len(packed)} bytes")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
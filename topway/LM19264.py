@@ -1,6 +1,11 @@
 from machine import Pin
+from .bus import PinBus, RegisterBus
+from .canvas import Canvas
+from .flush import plan_flush
+from .profiler import Profiler
+from .raster import circle_half_heights, corner_profile, line_end
+from .stats import FlushStats
 import micropython
-import math
 import time
 
 
@@ -9,9 +14,15 @@ class LM19264:
     width = 192
     height = 64
 
+    # Methods timed with `profile=True`.
+    PROFILED = ("display_bitmap", "write_run", "pack_bitmap", "overlay_bitmap", "draw_text", "fill_span_rect",
+                "draw_graphic_lines", "draw_graphic_box", "draw_graphic_circle", "draw_graphic_circle_filled",
+                "draw_graphic_circles", "read_display_to_bitmap")
+
     def __init__(self, db0: int | Pin, db1: int | Pin, db2: int | Pin, db3: int | Pin, db4: int | Pin, db5: int | Pin,
                  db6: int | Pin, db7: int | Pin, rs: int | Pin, rw: int | Pin, e: int | Pin, rstb: int | Pin,
-                 csa: int | Pin, csb: int | Pin, debug: bool = False):
+                 csa: int | Pin, csb: int | Pin, debug: bool = False, fast_bus: bool = False,
+                 profile: bool | tuple = False):
         """
         Driver for LM19264 192x64 LCD.
 
@@ -45,6 +56,12 @@ class LM19264:
         :type csb: int | Pin
         :param debug: True to enable debug output.
         :type debug: bool
+        :param fast_bus: True to drive DB0–DB7 through GPIO registers when the data pins are GPIO numbers on a
+            supported chip (ESP32, ESP32-S2, -S3, -C3, RP2040); falls back to per-pin writes otherwise.
+        :type fast_bus: bool
+        :param profile: True to time the drawing and flush methods listed in `PROFILED` (or a tuple of method names
+            to time instead); see `profiler.report()`. When False the methods are called directly, with no overhead.
+        :type profile: bool | tuple
         """
         self.db0 = Pin(db0, Pin.OUT) if not isinstance(db0, Pin) else db0
         self.db1 = Pin(db1, Pin.OUT) if not isinstance(db1, Pin) else db1
@@ -64,21 +81,42 @@ class LM19264:
 
         self.debug = debug
 
+        self.bus = PinBus(data=(self.db0, self.db1, self.db2, self.db3, self.db4, self.db5, self.db6, self.db7),
+                          rs=self.rs, rw=self.rw, e=self.e, csa=self.csa, csb=self.csb)
+        if fast_bus:
+            try:
+                self.bus = RegisterBus(data=(db0, db1, db2, db3, db4, db5, db6, db7),
+                                       rs=self.rs, rw=self.rw, e=self.e, csa=self.csa, csb=self.csb)
+            except ValueError as exc:
+                if self.debug:
+                    print(f"[DEBUG] register bus unavailable, using per-pin bus: {exc}")
+
+        # Last selected region and each controller's page and column address, 0xFF when not known. Used to skip
+        # address commands that would not change anything.
+        self._selected = -1
+        self._page = bytearray(b"\xff\xff\xff")
+        self._column = bytearray(b"\xff\xff\xff")
+
+        # Order and cost of the runs sent by the last flush, see `plan_flush()`.
+        self.last_plan = None
+
+        # Bus traffic, time and heap used by the last `display_bitmap()`.
+        self.last_flush = FlushStats()
+
         self.init_pins()
         self.do_reset()
         self.initialize()
 
+        # Call counts and timings, see `Profiler`; None when not profiling.
+        self.profiler = None
+        if profile:
+            self.profiler = Profiler()
+            self.profiler.instrument(self, self.PROFILED if profile is True else profile)
+
     @micropython.native
     def init_pins(self) -> None:
         """Initialize all control and data pins to default states."""
-        self.db0.off()
-        self.db1.off()
-        self.db2.off()
-        self.db3.off()
-        self.db4.off()
-        self.db5.off()
-        self.db6.off()
-        self.db7.off()
+        self.bus.set_data(0)
 
         self.rs.off()
         self.rw.off()
@@ -88,6 +126,8 @@ class LM19264:
 
         self.csa.off()
         self.csb.off()
+        self.bus.invalidate()
+        self._selected = -1
 
     @micropython.native
     def pulse_e(self) -> None:
@@ -107,79 +147,30 @@ class LM19264:
         :param is_command: True to send as command, False to send as data.
         :type is_command: bool
         """
-        if is_command:
-            self.rs.off()
-            self.rw.off()
-        else:
-            self.rs.on()
-            self.rw.off()
-
-        # Set the pins to the bit value using bit shifting
-        self.db0.value((value >> 0) & 1)
-        self.db1.value((value >> 1) & 1)
-        self.db2.value((value >> 2) & 1)
-        self.db3.value((value >> 3) & 1)
-        self.db4.value((value >> 4) & 1)
-        self.db5.value((value >> 5) & 1)
-        self.db6.value((value >> 6) & 1)
-        self.db7.value((value >> 7) & 1)
-
-        # Pulse `e`
-        self.e.on()
-        self.e.off()
-        # self.pulse_e()
+        # RS = L for instructions, RS = H for display data
+        self.bus.write(value, 0 if is_command else 1)
 
     @micropython.native
     def read_data(self) -> int:
-        self.rs.on()  # RS = 1 (data)
-        self.rw.on()  # RW = 1 (read)
-        self.e.on()  # Pulse E high
-        time.sleep_us(1)
+        """
+        Read a display data byte from the selected controller; DB0–DB7 must already be inputs.
 
-        value = 0
-        if self.db0.value():
-            value |= 1 << 0
-        if self.db1.value():
-            value |= 1 << 1
-        if self.db2.value():
-            value |= 1 << 2
-        if self.db3.value():
-            value |= 1 << 3
-        if self.db4.value():
-            value |= 1 << 4
-        if self.db5.value():
-            value |= 1 << 5
-        if self.db6.value():
-            value |= 1 << 6
-        if self.db7.value():
-            value |= 1 << 7
-
-        self.e.off()  # Pulse E low
-        return value
+        :return: 8-bit data value.
+        :rtype: int
+        """
+        if self._selected >= 0:
+            self._column[self._selected] = 0xFF
+        return self.bus.read()
 
     @micropython.native
     def set_db_outputs(self) -> None:
         """Configure DB0–DB7 pins as outputs (for writing commands/data)."""
-        self.db0.init(Pin.OUT)
-        self.db1.init(Pin.OUT)
-        self.db2.init(Pin.OUT)
-        self.db3.init(Pin.OUT)
-        self.db4.init(Pin.OUT)
-        self.db5.init(Pin.OUT)
-        self.db6.init(Pin.OUT)
-        self.db7.init(Pin.OUT)
+        self.bus.set_outputs()
 
     @micropython.native
     def set_db_inputs(self) -> None:
         """Configure DB0–DB7 pins as inputs (for reading data)."""
-        self.db0.init(Pin.IN, Pin.PULL_DOWN)
-        self.db1.init(Pin.IN, Pin.PULL_DOWN)
-        self.db2.init(Pin.IN, Pin.PULL_DOWN)
-        self.db3.init(Pin.IN, Pin.PULL_DOWN)
-        self.db4.init(Pin.IN, Pin.PULL_DOWN)
-        self.db5.init(Pin.IN, Pin.PULL_DOWN)
-        self.db6.init(Pin.IN, Pin.PULL_DOWN)
-        self.db7.init(Pin.IN, Pin.PULL_DOWN)
+        self.bus.set_inputs()
 
     @micropython.native
     def read_display_to_bitmap(self) -> list[list[int]]:
@@ -208,6 +199,8 @@ class LM19264:
 
         # Restore DB lines to outputs for normal driver operation
         self.set_db_outputs()
+        self.bus.invalidate()
+        self.invalidate_address()
         return bitmap
 
     @micropython.native
@@ -229,6 +222,8 @@ class LM19264:
         :type value: int
         """
         self.send_bytes(value=value, is_command=False)
+        if self._selected >= 0 and self._column[self._selected] != 0xFF:
+            self._column[self._selected] = (self._column[self._selected] + 1) & 63
 
     @micropython.native
     def read_status(self, region: int) -> dict:
@@ -245,50 +240,21 @@ class LM19264:
         self.rw.on()
 
         # Change the output pins to input
-        self.db0.init(Pin.IN, Pin.PULL_DOWN)
-        self.db1.init(Pin.IN, Pin.PULL_DOWN)
-        self.db2.init(Pin.IN, Pin.PULL_DOWN)
-        self.db3.init(Pin.IN, Pin.PULL_DOWN)
-        self.db4.init(Pin.IN, Pin.PULL_DOWN)
-        self.db5.init(Pin.IN, Pin.PULL_DOWN)
-        self.db6.init(Pin.IN, Pin.PULL_DOWN)
-        self.db7.init(Pin.IN, Pin.PULL_DOWN)
+        self.bus.set_inputs()
         time.sleep_us(1)
 
         self.e.on()
         time.sleep_us(2)
 
-        # Read the values from each pin and bit shift
-        value = 0
-        if self.db0.value():
-            value |= (1 << 0)
-        if self.db1.value():
-            value |= (1 << 1)
-        if self.db2.value():
-            value |= (1 << 2)
-        if self.db3.value():
-            value |= (1 << 3)
-        if self.db4.value():
-            value |= (1 << 4)
-        if self.db5.value():
-            value |= (1 << 5)
-        if self.db6.value():
-            value |= (1 << 6)
-        if self.db7.value():
-            value |= (1 << 7)
+        value = self.bus.get_data()
 
         self.e.off()
         time.sleep_us(2)
 
         # Change the pins to output again.
-        self.db0.init(Pin.OUT)
-        self.db1.init(Pin.OUT)
-        self.db2.init(Pin.OUT)
-        self.db3.init(Pin.OUT)
-        self.db4.init(Pin.OUT)
-        self.db5.init(Pin.OUT)
-        self.db6.init(Pin.OUT)
-        self.db7.init(Pin.OUT)
+        self.bus.set_outputs()
+        # RS/RW were driven directly above
+        self.bus.invalidate()
 
         return {
             "raw": value,
@@ -304,6 +270,19 @@ class LM19264:
         time.sleep_ms(5)
         self.rstb.on()
         time.sleep_ms(5)
+        self.bus.invalidate()
+        self.invalidate_address()
+
+    @micropython.native
+    def invalidate_address(self) -> None:
+        """
+        Forget the page and column address of every controller so the next run sets them again.
+
+        Call this after sending page or column commands with `send_command()` directly.
+        """
+        for region in range(3):
+            self._page[region] = 0xFF
+            self._column[region] = 0xFF
 
     @micropython.native
     def do_select_chip(self, region: int) -> None:
@@ -313,13 +292,8 @@ class LM19264:
         :param region: Region index (0 = left, 1 = middle, 2 = right).
         :type region: int
         """
-        self.csa.off()
-        self.csb.off()
-        # time.sleep_us(1)
-        cs_map = [(0, 0), (1, 0), (0, 1)]
-        self.csa.value(cs_map[region][0])
-        self.csb.value(cs_map[region][1])
-        # time.sleep_us(1)
+        self.bus.select(region)
+        self._selected = region
 
     @micropython.native
     def set_display_on(self, region: int, on: bool = True) -> None:
@@ -356,6 +330,8 @@ class LM19264:
         :type page: int
         """
         self.send_command(0xB8 | (page & 0x07))
+        if self._selected >= 0:
+            self._page[self._selected] = page & 0x07
 
     @micropython.native
     def set_column(self, col: int) -> None:
@@ -366,6 +342,8 @@ class LM19264:
         :type col: int
         """
         self.send_command(0x40 | (col & 0x3F))
+        if self._selected >= 0:
+            self._column[self._selected] = col & 0x3F
 
     @micropython.native
     def initialize(self) -> None:
@@ -393,26 +371,62 @@ class LM19264:
         self.set_column(col)
         self.send_data(data)
 
+    @micropython.native
+    def write_run(self, region: int, page: int, start_col: int, buf: bytes | bytearray | memoryview, start: int,
+                  length: int) -> None:
+        """
+        Stream a run of bytes into consecutive columns of one page in a region.
+
+        The controller auto-increments the column (Y address) after every data write, so the page and column only
+        have to be set once for the whole run instead of once per byte. They are skipped altogether when the
+        controller is already there, e.g. a run continuing where the previous one in that region ended.
+
+        :param region: Region index (0 = left, 1 = middle, 2 = right).
+        :type region: int
+        :param page: Page number (0–7).
+        :type page: int
+        :param start_col: Column number (0–63) of the first byte in the run.
+        :type start_col: int
+        :param buf: Buffer holding the bytes to send.
+        :type buf: bytes | bytearray | memoryview
+        :param start: Index of the first byte in `buf` to send.
+        :type start: int
+        :param length: Number of bytes to send.
+        :type length: int
+        """
+        if start_col + length > 64:
+            raise ValueError(f"Run of {length} bytes from column {start_col} crosses the end of the page")
+
+        self.do_select_chip(region)
+        if self._page[region] != page:
+            self.set_page(page)
+        if self._column[region] != start_col:
+            self.set_column(start_col)
+        self.bus.write_data(buf, start, length)
+        self._column[region] = (start_col + length) & 63
+
     @micropython.native
     def do_clear_display(self) -> None:
         """Clear all bitmap across all regions and pages."""
+        blank = bytes(64)
         for region in range(3):
-            self.do_select_chip(region)
             for page in range(8):
-                self.set_page(page)
-                for col in range(64):
-                    self.set_column(col)
-                    self.send_data(0x00)
+                self.write_run(region, page, 0, blank, 0, 64)
 
     @micropython.native
     def pack_bitmap(self, bitmap: list | tuple[list | tuple[int]]) -> bytearray:
         """
         Pack a 2D pixel array into display-ready format.
 
-        :param bitmap: List of 64 rows, each containing 192 binary pixel values (0 or 1).
-        :type bitmap: list
+        A `Canvas` is already packed, so its buffer is returned as-is.
+
+        :param bitmap: List of 64 rows, each containing 192 binary pixel values (0 or 1), or a `Canvas`.
+        :type bitmap: list | Canvas
         :return: Bytearray, packed for the display.
         """
+        if isinstance(bitmap, Canvas):
+            return bitmap.buffer
+
         if len(bitmap) != self.height or any(len(row) != self.width for row in bitmap):
             raise ValueError("Input must be 64 rows of 192 columns each.")
 
@@ -435,8 +449,8 @@ class LM19264:
         """
         Overlay a 2D pixel array onto another at a given (x, y) position.
 
-        :param base_bitmap: 2D list of 64 rows × 192 columns (0 or 1), the target display buffer.
-        :type base_bitmap: list | tuple
+        :param base_bitmap: 2D list of 64 rows × 192 columns (0 or 1), or a `Canvas`, the target display buffer.
+        :type base_bitmap: list | tuple | Canvas
         :param overlay_bitmap: 2D list of rows × columns (0 or 1), the overlay image.
         :type overlay_bitmap: list | tuple
         :param x: Horizontal offset (0–191) where overlay starts.
@@ -445,9 +459,13 @@ class LM19264:
         :type y: int
         :param mode: Bitwise mode: "or", "and", "xor", or "replace".
         :type mode: str
-        :return: New 2D list of 64×192 bitmap with overlay applied.
-        :rtype: list
+        :return: New 2D list of 64×192 bitmap with overlay applied, or the same `Canvas` updated in place.
+        :rtype: list | Canvas
         """
+        if isinstance(base_bitmap, Canvas):
+            base_bitmap.overlay_bitmap(overlay_bitmap=overlay_bitmap, x=x, y=y, mode=mode)
+            return base_bitmap
+
         height = len(overlay_bitmap)
         width = len(overlay_bitmap[0])
 
@@ -479,20 +497,24 @@ class LM19264:
         """
         Draw a full-screen bitmap to the display.
 
-        :param bitmap: Bytearray of 1536 bytes (192×64 bitmap).
-        :type bitmap: bytearray
+        The bytes, commands, chip-select switches, pin direction changes, time and heap used are stored in
+        `last_flush`.
+
+        :param bitmap: Bytearray of 1536 bytes (192×64 bitmap), or a `Canvas`.
+        :type bitmap: bytearray | Canvas
         """
+        if isinstance(bitmap, Canvas):
+            bitmap = bitmap.buffer
+
         if len(bitmap) != self.width * 8:
             raise ValueError(f"Bitmap must be 1536 bytes (192×64 bitmap), received width {len(bitmap)}")
 
-        for page in range(8):
-            for region in range(3):
-                self.do_select_chip(region)
-                self.set_page(page)
-                for col in range(self.height):
-                    index = (region * self.height) + col + (page * self.width)
-                    self.set_column(col)
-                    self.send_data(bitmap[index])
+        self.last_flush.begin(self.bus)
+        self.last_plan = plan_flush([(region, page, 0, 64) for page in range(8) for region in range(3)],
+                                    self._selected, self._page, self._column)
+        for region, page, col, length in self.last_plan["runs"]:
+            self.write_run(region, page, col, bitmap, (page * self.width) + (region * 64) + col, length)
+        self.last_flush.end(self.bus)
 
     @micropython.native
     def draw_text(self, bitmap: list | tuple[list | tuple[int]], text: str, x: int, y: int, font_map: object,
@@ -500,8 +522,8 @@ class LM19264:
         """
         Render a string of text onto a 2D bitmap array.
 
-        :param bitmap: 2D list of pixels [row][col].
-        :type bitmap: list | tuple
+        :param bitmap: 2D list of pixels [row][col], or a `Canvas` to draw on in place.
+        :type bitmap: list | tuple | Canvas
         :param text: String to render.
         :type text: str
         :param x: Horizontal pixel offset (starting column).
@@ -515,6 +537,10 @@ class LM19264:
         :param invert: If True, invert glyph pixels (1 → 0, 0 → 1).
         :type invert: bool
         """
+        if isinstance(bitmap, Canvas):
+            bitmap.draw_text(text=text, x=x, y=y, font_map=font_map, spacing=spacing, invert=invert)
+            return bitmap
+
         for char in text:
             # Retrieve glyph data for the character
             glyph, glyph_height, glyph_width = font_map.get_ch(char)
@@ -570,22 +596,40 @@ class LM19264:
         * - **IMPORTANT:**
         * - Degrees are measured counter-clockwise from the positive x-axis. This means 90 degrees from left to right is actually 0 and 180 degrees top to bottom is actually 270.
 
-        :param bitmap: A 2D list or tuple representing the bitmap to draw on.
-        :type bitmap: list | tuple
+        :param bitmap: A 2D list or tuple representing the bitmap to draw on, or a `Canvas` to draw on in place.
+        :type bitmap: list | tuple | Canvas
         :param lines: A list or tuple of lines, each defined as [x0, y0, angle_deg, length].
         :type lines: list | tuple
         """
+        if isinstance(bitmap, Canvas):
+            bitmap.draw_graphic_lines(lines=lines)
+            return bitmap
+
         # Modify the bitmap for each line:
         for x0, y0, angle_deg, length in lines:
-            angle_rad = math.radians(angle_deg)
-            deg_x = math.cos(angle_rad)
-            deg_y = -math.sin(angle_rad)  # negative because y increases downward
-
-            for i in range(length):
-                x = int(round(x0 + deg_x * i))
-                y = int(round(y0 + deg_y * i))
+            if length <= 0:
+                continue
+            # Integer end point from the fixed-point sine table, then integer Bresenham steps between the two
+            x1, y1 = line_end(x0, y0, angle_deg, length)
+            dx = abs(x1 - x0)
+            dy = -abs(y1 - y0)
+            sx = 1 if x0 < x1 else -1
+            sy = 1 if y0 < y1 else -1
+            err = dx + dy
+            x = x0
+            y = y0
+            while True:
                 if 0 <= x < self.width and 0 <= y < self.height:
                     bitmap[y][x] = 1
+                if x == x1 and y == y1:
+                    break
+                e2 = 2 * err
+                if e2 >= dy:
+                    err += dy
+                    x += sx
+                if e2 <= dx:
+                    err += dx
+                    y += sy
 
         return bitmap
 
@@ -599,8 +643,8 @@ class LM19264:
         replicate the points across the other octants. The algorithm takes into account the constraints of the
         display dimensions (width and height) to ensure that the circle does not exceed the bitmap's boundaries.
 
-        :param bitmap: A list representing the bitmap.
-        :type bitmap: list
+        :param bitmap: A list representing the bitmap, or a `Canvas` to draw on in place.
+        :type bitmap: list | Canvas
         :param cx: Integer coordinate for the x-center of the circle.
         :type cx: int
         :param cy: Integer coordinate for the y-center of the circle.
@@ -610,6 +654,10 @@ class LM19264:
         :return: A modified 2D list representing the bitmap with the circle drawn on it.
         :rtype: list
         """
+        if isinstance(bitmap, Canvas):
+            bitmap.draw_graphic_circle(cx=cx, cy=cy, radius=radius)
+            return bitmap
+
         x = radius  # Start at the far right of the circle
         y = 0  # Start at the top
         d = 1 - radius  # Decision variable to determine when to step x
@@ -652,8 +700,8 @@ class LM19264:
         replicate the points across the other octants. The algorithm takes into account the constraints of the
         display dimensions (width and height) to ensure that the circle does not exceed the bitmap's boundaries.
 
-        :param bitmap: A list representing the bitmap.
-        :type bitmap: list
+        :param bitmap: A list representing the bitmap, or a `Canvas` to draw on in place.
+        :type bitmap: list | Canvas
         :param cx: Integer coordinate for the x-center of the circle.
         :type cx: int
         :param cy: Integer coordinate for the y-center of the circle.
@@ -663,44 +711,18 @@ class LM19264:
         :return: A modified 2D list representing the bitmap with the circle drawn on it.
         :rtype: list
         """
-        x = radius  # Start at the far right edge of the circle
-        y = 0  # Start at the top
-        d = 1 - radius  # Decision variable for midpoint algorithm
-
-        def draw_span(y_offset: int, x_left: int, x_right: int):
-            """
-            Draws a horizontal span at a specified vertical offset relative to a central point
-            with defined left and right horizontal lengths.
-
-            :param y_offset: Vertical offset, relative to the center `cy`, where the span should be drawn.
-            :type y_offset: int
-            :param x_left: Number of pixels to extend to the left of the center `cx`.
-            :type x_left: int
-            :param x_right: Number of pixels to extend to the right of the center `cx`.
-            :type x_right: int
-            """
-            y_pos = cy + y_offset
-            if 0 <= y_pos < self.height:  # Check vertical bounds
-                for x_pos in range(cx - x_left, cx + x_right + 1):
-                    if 0 <= x_pos < self.width:  # Check horizontal bounds
-                        bitmap[y_pos][x_pos] = 1  # Set pixel ON
-
-        # Loop through each vertical slice of the circle
-        while x >= y:
-            # Draw horizontal spans for each symmetrical row
-            draw_span(+y, x, x)  # Top half
-            draw_span(-y, x, x)  # Bottom half
-            draw_span(+x, y, y)  # Right half
-            draw_span(-x, y, y)  # Left half
+        if isinstance(bitmap, Canvas):
+            bitmap.draw_graphic_circle_filled(cx=cx, cy=cy, radius=radius)
+            return bitmap
 
-            y += 1  # Move down one row
-
-            # Update the decision variable to determine whether to shrink x
-            if d < 0:
-                d += 2 * y + 1
-            else:
-                x -= 1
-                d += 2 * (y - x) + 1
+        # By symmetry the half-height of column `cx ± b` is also the half-width of row `cy ± b`, so each row of the
+        # circle is a single span
+        heights = circle_half_heights(radius)
+        for b in range(radius + 1):
+            w = heights[b]
+            self.fill_span_rect(bitmap, cx - w, cy - b, cx + w, cy - b)
+            if b:
+                self.fill_span_rect(bitmap, cx - w, cy + b, cx + w, cy + b)
 
         return bitmap
 
@@ -711,8 +733,8 @@ class LM19264:
 
         Each circle is defined as a tuple: (cx, cy, radius, filled).
 
-        :param bitmap: A list representing the bitmap.
-        :type bitmap: list
+        :param bitmap: A list representing the bitmap, or a `Canvas` to draw on in place.
+        :type bitmap: list | Canvas
         :param circles: A list or tuple containing the definitions of circles.
         :type circles: list | tuple
         :return: The updated bitmap after drawing the specified circles.
@@ -726,14 +748,62 @@ class LM19264:
 
         return bitmap
 
+    @micropython.native
+    def fill_span_rect(self, bitmap: list[list[int]], x0: int, y0: int, x1: int, y1: int,
+                       mode: str = "or") -> list | tuple[list | tuple[int]]:
+        """
+        Set, clear or invert a rectangle from (x0, y0) to (x1, y1) inclusive, clipped to the display.
+
+        Setting and clearing replace a whole slice of each row at once rather than one pixel at a time. Nothing is
+        drawn if x1 < x0 or y1 < y0. Unlike `FrameBuffer.fill_rect(x, y, w, h, c)` on the FrameBuffer driver, this
+        takes the two corners.
+
+        :param bitmap: A list representing the bitmap, or a `Canvas` to draw on in place.
+        :type bitmap: list | Canvas
+        :param x0: First column.
+        :type x0: int
+        :param y0: First row.
+        :type y0: int
+        :param x1: Last column.
+        :type x1: int
+        :param y1: Last row.
+        :type y1: int
+        :param mode: "or" to set the pixels, "and" to clear them or "xor" to invert them.
+        :type mode: str
+        :return: The updated bitmap.
+        :rtype: list
+        """
+        if isinstance(bitmap, Canvas):
+            bitmap.fill_span_rect(x0=x0, y0=y0, x1=x1, y1=y1, mode=mode)
+            return bitmap
+
+        if mode not in ("or", "and", "xor"):
+            raise ValueError(f"Unknown mode: {mode}")
+
+        x0 = max(x0, 0)
+        x1 = min(x1, self.width - 1)
+        if x0 > x1:
+            return bitmap
+
+        span = [0 if mode == "and" else 1] * (x1 - x0 + 1)
+        for yi in range(max(y0, 0), min(y1, self.height - 1) + 1):
+            row = bitmap[yi]
+            if mode == "xor":
+                for xi in range(x0, x1 + 1):
+                    row[xi] ^= 1
+            else:
+                row[x0:x1 + 1] = span
+
+        return bitmap
+
     @micropython.native
     def draw_graphic_box(self, bitmap: list[list[int]], x: int, y: int, width: int, height: int, radius: int = 0,
                          fill: bool = False) -> list | tuple[list | tuple[int]]:
         """
         Draws a box with quarter-circle rounded corners, tangent-aligned to edges.
 
-        :param bitmap: A list representing the bitmap.
-        :type bitmap: list
+        :param bitmap: A list representing the bitmap, or a `Canvas` to draw on in place.
+        :type bitmap: list | Canvas
         :param x: Top-left x-coordinate.
         :param y: Top-left y-coordinate.
         :param width: Width of the box.
@@ -743,95 +813,34 @@ class LM19264:
         :return: The updated bitmap after drawing the box.
         :returns: list
         """
+        if isinstance(bitmap, Canvas):
+            bitmap.draw_graphic_box(x=x, y=y, width=width, height=height, radius=radius, fill=fill)
+            return bitmap
+
         x0 = max(0, min(x, self.width - 1))
         x1 = max(0, min(x + width - 1, self.width - 1))
         y0 = max(0, min(y, self.height - 1))
         y1 = max(0, min(y + height - 1, self.height - 1))
         radius = max(1, min(radius, min((x1 - x0) // 2, (y1 - y0) // 2)))
 
-        # Fill interior rectangle (excluding corners)
+        # Straight section between the corners: the whole width when filled, otherwise the two vertical edges
         if fill:
-            # Fills interior rectangle excluding corners on y axis
-            for yi in range(y0 + radius, y1 - radius + 1):
-                for xi in range(x0 + 1, x1):
-                    bitmap[yi][xi] = 1
-            # Fills interior rectangle excluding corners on y axis
-            for yi in range(y0 + 1, y0 + radius):
-                for xi in range(x0 + radius, x1 - radius + 1):
-                    bitmap[yi][xi] = 1
-            # Fills bottom interior rectangle excluding corners
-            for yi in range(y1 - radius + 1, y1):
-                for xi in range(x0 + radius, x1 - radius + 1):
-                    bitmap[yi][xi] = 1
-
-        # Horizontal edges (stop at radius from corners)
-        for xi in range(x0 + radius, x1 - radius + 1):
-            # Draws horizontal edges stopping at radius from corners
-            if 0 <= xi < self.width:
-                if 0 <= y0 < self.height:
-                    bitmap[y0][xi] = 1
-                if 0 <= y1 < self.height:
-                    bitmap[y1][xi] = 1
-
-        # Vertical edges (stop at radius from corners)
-        for yi in range(y0 + radius, y1 - radius + 1):
-            # Draws vertical edges stopping at radius from corners
-            if 0 <= yi < self.height:
-                if 0 <= x0 < self.width:
-                    bitmap[yi][x0] = 1
-                if 0 <= x1 < self.width:
-                    bitmap[yi][x1] = 1
-
-        # Quarter-circle corners
-        steps = radius * 2
-        # Iterates and sets pixels for each rounded corner
-        for i in range(steps + 1):
-            theta = (math.pi / 2) * (i / steps)
-            dx = int(round(radius * math.cos(theta)))
-            dy = int(round(radius * math.sin(theta)))
-
-            # Top-left
-            px = x0 + radius - dx
-            py = y0 + radius - dy
-            if 0 <= px < self.width and 0 <= py < self.height:
-                bitmap[py][px] = 1
-            # Fills top left quadrant if fill is enabled
-            if fill:
-                for fy in range(py + 1, y0 + radius):
-                    if 0 <= fy < self.height:
-                        bitmap[fy][px] = 1
-
-            # Top-right
-            px = x1 - radius + dx
-            py = y0 + radius - dy
-            if 0 <= px < self.width and 0 <= py < self.height:
-                bitmap[py][px] = 1
-            # Fills top right quadrant if fill is enabled
-            if fill:
-                for fy in range(py + 1, y0 + radius):
-                    if 0 <= fy < self.height:
-                        bitmap[fy][px] = 1
-
-            # Bottom-left
-            px = x0 + radius - dx
-            py = y1 - radius + dy
-            if 0 <= px < self.width and 0 <= py < self.height:
-                bitmap[py][px] = 1
-            # Fills bottom left quadrant if fill is enabled
-            if fill:
-                for fy in range(y1 - radius + 1, py):
-                    if 0 <= fy < self.height:
-                        bitmap[fy][px] = 1
-
-            # Bottom-right
-            px = x1 - radius + dx
-            py = y1 - radius + dy
-            if 0 <= px < self.width and 0 <= py < self.height:
-                bitmap[py][px] = 1
-            # Fills bottom right quadrant if fill is enabled
-            if fill:
-                for fy in range(y1 - radius + 1, py):
-                    if 0 <= fy < self.height:
-                        bitmap[fy][px] = 1
+            self.fill_span_rect(bitmap, x0, y0 + radius, x1, y1 - radius)
+        else:
+            self.fill_span_rect(bitmap, x0, y0 + radius, x0, y1 - radius)
+            self.fill_span_rect(bitmap, x1, y0 + radius, x1, y1 - radius)
+
+        # Corner rows from the cached quarter-circle profile, mirrored to the top and bottom. The outermost row
+        # also carries the horizontal edge (stopping at radius from the corners), so it's one span across.
+        outer, inner = corner_profile(radius)
+        for b in range(1, radius + 1):
+            left = x0 + radius - outer[b]
+            right = x1 - radius + outer[b]
+            for row in (y0 + radius - b, y1 - radius + b):
+                if fill or b == radius:
+                    self.fill_span_rect(bitmap, left, row, right, row)
+                else:
+                    self.fill_span_rect(bitmap, left, row, x0 + radius - inner[b], row)
+                    self.fill_span_rect(bitmap, x1 - radius + inner[b], row, right, row)
 
         return bitmap
@@ -1,31 +1,35 @@
 from framebuf import FrameBuffer, MONO_VLSB
 from machine import Pin
+from .bus import PinBus, RegisterBus
+from .canvas import Canvas
+from .flush import plan_flush
+from .glyphs import GlyphCache
+from .profiler import Profiler
+from .raster import blit_glyph, circle_half_heights, corner_profile, line_end
+from .stats import FlushStats
 import micropython
-import math
 import time
 
 
-def timed_function(f, *args, **kwargs):
-    myname = str(f).split(' ')[1]
-
-    def new_func(*args, **kwargs):
-        t = time.ticks_us()
-        result = f(*args, **kwargs)
-        delta = time.ticks_diff(time.ticks_us(), t)
-        print('Function {} Time = {:6.3f}ms'.format(myname, delta/1000))
-        return result
-
-    return new_func
-
-
 # noinspection GrazieInspection
 class LM19264(FrameBuffer):
     width = 192
     height = 64
 
+    # Bus writes needed to start a new run within a page: the column command. Each controller keeps its page address
+    # and `_write_run()` skips the page command when it has not changed.
+    READDRESS_COST = 1
+
+    # Methods timed with `profile=True`.
+    PROFILED = ("display", "_flush_dirty", "_flush_diff", "_write_run", "display_bitmap", "pack_bitmap",
+                "overlay_bitmap", "draw_bitmap_array", "draw_text", "draw_graphic_lines", "draw_graphic_box",
+                "draw_graphic_circle", "draw_graphic_circle_filled", "draw_graphic_circles", "scroll_vertical",
+                "read_display_to_bitmap")
+
     def __init__(self, db0: int | Pin, db1: int | Pin, db2: int | Pin, db3: int | Pin, db4: int | Pin, db5: int | Pin,
                  db6: int | Pin, db7: int | Pin, rs: int | Pin, rw: int | Pin, e: int | Pin, rstb: int | Pin,
-                 csa: int | Pin, csb: int | Pin, debug: bool = False):
+                 csa: int | Pin, csb: int | Pin, debug: bool = False, fast_bus: bool = False, shadow: bool = False,
+                 glyph_cache: int = 4096, profile: bool | tuple = False):
         """
         Driver for LM19264 192x64 LCD with framebuffer.
 
@@ -59,6 +63,18 @@ class LM19264(FrameBuffer):
         :type csb: int | Pin
         :param debug: True to enable debug output.
         :type debug: bool
+        :param fast_bus: True to drive DB0–DB7 through GPIO registers when the data pins are GPIO numbers on a
+            supported chip (ESP32, ESP32-S2, -S3, -C3, RP2040); falls back to per-pin writes otherwise.
+        :type fast_bus: bool
+        :param shadow: True to keep a copy of what was last sent to the panel and only send changed bytes, which
+            also catches drawing done with the raw `FrameBuffer` methods. Costs another 1536 bytes of RAM.
+        :type shadow: bool
+        :param glyph_cache: Byte budget for glyphs kept as `FrameBuffer` objects so `draw_text()` can `blit()` them;
+            0 disables the cache and glyphs are copied into the framebuffer byte by byte instead.
+        :type glyph_cache: int
+        :param profile: True to time the drawing and flush methods listed in `PROFILED` (or a tuple of method names
+            to time instead); see `profiler.report()`. When False the methods are called directly, with no overhead.
+        :type profile: bool | tuple
         """
         self.db0 = Pin(db0, Pin.OUT) if not isinstance(db0, Pin) else db0
         self.db1 = Pin(db1, Pin.OUT) if not isinstance(db1, Pin) else db1
@@ -78,24 +94,61 @@ class LM19264(FrameBuffer):
 
         self.debug = debug
 
+        self.bus = PinBus(data=(self.db0, self.db1, self.db2, self.db3, self.db4, self.db5, self.db6, self.db7),
+                          rs=self.rs, rw=self.rw, e=self.e, csa=self.csa, csb=self.csb)
+        if fast_bus:
+            try:
+                self.bus = RegisterBus(data=(db0, db1, db2, db3, db4, db5, db6, db7),
+                                       rs=self.rs, rw=self.rw, e=self.e, csa=self.csa, csb=self.csb)
+            except ValueError as exc:
+                if self.debug:
+                    print(f"[DEBUG] register bus unavailable, using per-pin bus: {exc}")
+
         self.buffer = bytearray(192 * 64 // 8)  # 1536 bytes
         super().__init__(self.buffer, 192, 64, MONO_VLSB)
 
+        # Dirty column span per (page, region) cell, index `page * 3 + region`; a low bound of 0xFF means clean.
+        # Everything starts dirty so the first `display()` pushes the whole frame.
+        self._dirty_lo = bytearray(24)
+        self._dirty_hi = bytearray(b"\x3f" * 24)
+
+        # Copy of the panel contents for diff flushing; it can only be trusted after a full flush.
+        self._shadow = bytearray(len(self.buffer)) if shadow else None
+        self._shadow_valid = False
+
+        # Bus traffic, time and heap used by the last `display()`.
+        self.last_flush = FlushStats()
+
+        # Last selected region and each controller's page and column address, 0xFF when not known. Used to skip
+        # address commands that would not change anything.
+        self._selected = -1
+        self._page = bytearray(b"\xff\xff\xff")
+        self._column = bytearray(b"\xff\xff\xff")
+
+        # Order and cost of the runs sent by the last flush, see `plan_flush()`.
+        self.last_plan = None
+
+        self.glyph_cache = GlyphCache(glyph_cache) if glyph_cache > 0 else None
+
+        # Display start line of all three controllers. The framebuffer stays in logical (on-screen) coordinates and
+        # is rotated into `_ram` on the way out while the start line isn't 0, see `scroll_vertical()`.
+        self._start = 0
+        self._ram = None
+
         self.init_pins()
         self.do_reset()
         self.initialize()
 
+        # Call counts and timings, see `Profiler`; None when not profiling.
+        self.profiler = None
+        if profile:
+            self.profiler = Profiler()
+            self.profiler.instrument(self, self.PROFILED if profile is True else profile)
+
     @micropython.native
     def init_pins(self) -> None:
         """Initialize all control and data pins to default states."""
-        self.db0.off()
-        self.db1.off()
-        self.db2.off()
-        self.db3.off()
-        self.db4.off()
-        self.db5.off()
-        self.db6.off()
-        self.db7.off()
+        self.bus.set_data(0)
 
         self.rs.off()
         self.rw.off()
@@ -105,6 +158,8 @@ class LM19264(FrameBuffer):
 
         self.csa.off()
         self.csb.off()
+        self.bus.invalidate()
+        self._selected = -1
 
     @micropython.native
     def pulse_e(self) -> None:
@@ -124,79 +179,30 @@ class LM19264(FrameBuffer):
         :param is_command: True to send as command, False to send as data.
         :type is_command: bool
         """
-        if is_command:
-            self.rs.off()
-            self.rw.off()
-        else:
-            self.rs.on()
-            self.rw.off()
-
-        # Set the pins to the bit value using bit shifting
-        self.db0.value((value >> 0) & 1)
-        self.db1.value((value >> 1) & 1)
-        self.db2.value((value >> 2) & 1)
-        self.db3.value((value >> 3) & 1)
-        self.db4.value((value >> 4) & 1)
-        self.db5.value((value >> 5) & 1)
-        self.db6.value((value >> 6) & 1)
-        self.db7.value((value >> 7) & 1)
-
-        # Pulse `e`
-        self.e.on()
-        self.e.off()
-        # self.pulse_e()
+        # RS = L for instructions, RS = H for display data
+        self.bus.write(value, 0 if is_command else 1)
 
     @micropython.native
     def read_data(self) -> int:
-        self.rs.on()  # RS = 1 (data)
-        self.rw.on()  # RW = 1 (read)
-        self.e.on()  # Pulse E high
-        time.sleep_us(1)
+        """
+        Read a display data byte from the selected controller; DB0–DB7 must already be inputs.
 
-        value = 0
-        if self.db0.value():
-            value |= 1 << 0
-        if self.db1.value():
-            value |= 1 << 1
-        if self.db2.value():
-            value |= 1 << 2
-        if self.db3.value():
-            value |= 1 << 3
-        if self.db4.value():
-            value |= 1 << 4
-        if self.db5.value():
-            value |= 1 << 5
-        if self.db6.value():
-            value |= 1 << 6
-        if self.db7.value():
-            value |= 1 << 7
-
-        self.e.off()  # Pulse E low
-        return value
+        :return: 8-bit data value.
+        :rtype: int
+        """
+        if self._selected >= 0:
+            self._column[self._selected] = 0xFF
+        return self.bus.read()
 
     @micropython.native
     def set_db_outputs(self) -> None:
         """Configure DB0–DB7 pins as outputs (for writing commands/data)."""
-        self.db0.init(Pin.OUT)
-        self.db1.init(Pin.OUT)
-        self.db2.init(Pin.OUT)
-        self.db3.init(Pin.OUT)
-        self.db4.init(Pin.OUT)
-        self.db5.init(Pin.OUT)
-        self.db6.init(Pin.OUT)
-        self.db7.init(Pin.OUT)
+        self.bus.set_outputs()
 
     @micropython.native
     def set_db_inputs(self) -> None:
         """Configure DB0–DB7 pins as inputs (for reading data)."""
-        self.db0.init(Pin.IN, Pin.PULL_DOWN)
-        self.db1.init(Pin.IN, Pin.PULL_DOWN)
-        self.db2.init(Pin.IN, Pin.PULL_DOWN)
-        self.db3.init(Pin.IN, Pin.PULL_DOWN)
-        self.db4.init(Pin.IN, Pin.PULL_DOWN)
-        self.db5.init(Pin.IN, Pin.PULL_DOWN)
-        self.db6.init(Pin.IN, Pin.PULL_DOWN)
-        self.db7.init(Pin.IN, Pin.PULL_DOWN)
+        self.bus.set_inputs()
 
     @micropython.native
     def read_display_to_bitmap(self) -> list[list[int]]:
@@ -225,6 +231,8 @@ class LM19264(FrameBuffer):
 
         # Restore DB lines to outputs for normal driver operation
         self.set_db_outputs()
+        self.bus.invalidate()
+        self.invalidate_address()
         return bitmap
 
     @micropython.native
@@ -246,6 +254,10 @@ class LM19264(FrameBuffer):
         :type value: int
         """
         self.send_bytes(value=value, is_command=False)
+        # Written behind the shadow copy's back, so it can no longer be trusted
+        self._shadow_valid = False
+        if self._selected >= 0 and self._column[self._selected] != 0xFF:
+            self._column[self._selected] = (self._column[self._selected] + 1) & 63
 
     @micropython.native
     def read_status(self, region: int) -> dict:
@@ -262,50 +274,21 @@ class LM19264(FrameBuffer):
         self.rw.on()
 
         # Change the output pins to input
-        self.db0.init(Pin.IN, Pin.PULL_DOWN)
-        self.db1.init(Pin.IN, Pin.PULL_DOWN)
-        self.db2.init(Pin.IN, Pin.PULL_DOWN)
-        self.db3.init(Pin.IN, Pin.PULL_DOWN)
-        self.db4.init(Pin.IN, Pin.PULL_DOWN)
-        self.db5.init(Pin.IN, Pin.PULL_DOWN)
-        self.db6.init(Pin.IN, Pin.PULL_DOWN)
-        self.db7.init(Pin.IN, Pin.PULL_DOWN)
+        self.bus.set_inputs()
         time.sleep_us(1)
 
         self.e.on()
         time.sleep_us(2)
 
-        # Read the values from each pin and bit shift
-        value = 0
-        if self.db0.value():
-            value |= (1 << 0)
-        if self.db1.value():
-            value |= (1 << 1)
-        if self.db2.value():
-            value |= (1 << 2)
-        if self.db3.value():
-            value |= (1 << 3)
-        if self.db4.value():
-            value |= (1 << 4)
-        if self.db5.value():
-            value |= (1 << 5)
-        if self.db6.value():
-            value |= (1 << 6)
-        if self.db7.value():
-            value |= (1 << 7)
+        value = self.bus.get_data()
 
         self.e.off()
         time.sleep_us(2)
 
         # Change the pins to output again.
-        self.db0.init(Pin.OUT)
-        self.db1.init(Pin.OUT)
-        self.db2.init(Pin.OUT)
-        self.db3.init(Pin.OUT)
-        self.db4.init(Pin.OUT)
-        self.db5.init(Pin.OUT)
-        self.db6.init(Pin.OUT)
-        self.db7.init(Pin.OUT)
+        self.bus.set_outputs()
+        # RS/RW were driven directly above
+        self.bus.invalidate()
 
         return {
             "raw": value,
@@ -321,6 +304,20 @@ class LM19264(FrameBuffer):
         time.sleep_ms(5)
         self.rstb.on()
         time.sleep_ms(5)
+        self.bus.invalidate()
+        self.invalidate_address()
+        self._shadow_valid = False
+
+    @micropython.native
+    def invalidate_address(self) -> None:
+        """
+        Forget the page and column address of every controller so the next run sets them again.
+
+        Call this after sending page or column commands with `send_command()` directly.
+        """
+        for region in range(3):
+            self._page[region] = 0xFF
+            self._column[region] = 0xFF
 
     @micropython.native
     def do_select_chip(self, region: int) -> None:
@@ -330,19 +327,14 @@ class LM19264(FrameBuffer):
         :param region: Region index (0 = left, 1 = middle, 2 = right).
         :type region: int
         """
-        self.csa.off()
-        self.csb.off()
-        # time.sleep_us(1)
-        cs_map = [(0, 0), (1, 0), (0, 1)]
-        self.csa.value(cs_map[region][0])
-        self.csb.value(cs_map[region][1])
-        # time.sleep_us(1)
+        self.bus.select(region)
+        self._selected = region
 
     @micropython.native
     def do_clear_display(self) -> None:
         """Clear all bitmap across all regions and pages."""
         self.fill(0)
-        self.display()
+        self.display(full=True)
 
     @micropython.native
     def set_display_on(self, region: int, on: bool = True) -> None:
@@ -379,6 +371,8 @@ class LM19264(FrameBuffer):
         :type page: int
         """
         self.send_command(0xB8 | (page & 0x07))
+        if self._selected >= 0:
+            self._page[self._selected] = page & 0x07
 
     @micropython.native
     def set_column(self, col: int) -> None:
@@ -389,6 +383,8 @@ class LM19264(FrameBuffer):
         :type col: int
         """
         self.send_command(0x40 | (col & 0x3F))
+        if self._selected >= 0:
+            self._column[self._selected] = col & 0x3F
 
     @micropython.native
     def initialize(self) -> None:
@@ -396,18 +392,306 @@ class LM19264(FrameBuffer):
         for region in range(3):
             self.set_display_on(region=region, on=True)
             self.set_start_line(region=region, line=0)
+        self._start = 0
 
     @micropython.native
-    def display(self) -> None:
-        """Send framebuffer content to the LCD."""
+    def scroll_vertical(self, dy: int) -> None:
+        """
+        Scroll the screen contents by `dy` rows using the controllers' start line (Z address).
+
+        The panel RAM is treated as a ring of 64 lines: the start line of all three controllers is moved in lockstep,
+        which costs one command per controller, and only the rows scrolled into view are written. The framebuffer is
+        scrolled along with it, so keep drawing in screen coordinates; the exposed rows are cleared, draw into them
+        and call `display()` as usual.
+
+        Pending changes are sent first. Don't call `set_start_line()` directly while using this. `last_flush` covers
+        everything sent, pending changes included.
+
+        :param dy: Rows to scroll; positive moves the contents up and exposes rows at the bottom (like a log tail),
+            negative moves them down and exposes rows at the top.
+        :type dy: int
+        """
+        if dy == 0:
+            return
+        self.last_flush.begin(self.bus)
+        if abs(dy) >= self.height:
+            self.fill(0)
+            self._flush(full=True)
+            self.last_flush.end(self.bus)
+            return
+
+        self._flush()
+
+        self.scroll(0, -dy)
+        if dy > 0:
+            exposed = (self.height - dy, dy)
+        else:
+            exposed = (0, -dy)
+        self.fill_rect(0, exposed[0], self.width, exposed[1], 0)
+
+        self._start = (self._start + dy) % self.height
+        if self._start and self._ram is None:
+            self._ram = bytearray(len(self.buffer))
+        for region in range(3):
+            self.set_start_line(region, self._start)
+
+        self.mark_dirty(0, exposed[0], self.width, exposed[1])
+        self._flush_dirty()
+        if self._shadow is not None:
+            self._shadow[:] = self.buffer
+            self._shadow_valid = True
+        self.last_flush.end(self.bus)
+
+    def write_run(self, region: int, page: int, start_col: int, buf: bytes | bytearray | memoryview, start: int,
+                  length: int) -> None:
+        """
+        Stream a run of bytes into consecutive columns of one page in a region.
+
+        The controller auto-increments the column (Y address) after every data write, so the page and column only
+        have to be set once for the whole run instead of once per byte. They are skipped altogether when the
+        controller is already there, e.g. a run continuing where the previous one in that region ended.
+
+        The run goes to the panel behind the framebuffer's back, so the next `display()` overwrites it: the rows it
+        covers are marked dirty, or with `shadow=True` the whole framebuffer is sent since the shadow copy no longer
+        matches the panel.
+
+        :param region: Region index (0 = left, 1 = middle, 2 = right).
+        :type region: int
+        :param page: Page number (0–7) in panel RAM, which is the screen page while the start line is 0.
+        :type page: int
+        :param start_col: Column number (0–63) of the first byte in the run.
+        :type start_col: int
+        :param buf: Buffer holding the bytes to send.
+        :type buf: bytes | bytearray | memoryview
+        :param start: Index of the first byte in `buf` to send.
+        :type start: int
+        :param length: Number of bytes to send.
+        :type length: int
+        """
+        self._write_run(region, page, start_col, buf, start, length)
+        if self._shadow is not None:
+            self._shadow_valid = False
+        else:
+            # RAM page `page` is shown from screen row `8 * page - start line`, wrapping at the bottom
+            x = region * 64 + start_col
+            y = (page * 8 - self._start) % self.height
+            self.mark_dirty(x, y, length, 8)
+            if y + 8 > self.height:
+                self.mark_dirty(x, 0, length, y + 8 - self.height)
+
+    @micropython.native
+    def _write_run(self, region: int, page: int, start_col: int, buf: bytes | bytearray | memoryview, start: int,
+                   length: int) -> None:
+        """Send a run without touching the dirty spans or the shadow copy; see `write_run()`."""
+        if start_col + length > 64:
+            raise ValueError(f"Run of {length} bytes from column {start_col} crosses the end of the page")
+
+        self.do_select_chip(region)
+        if self._page[region] != page:
+            self.set_page(page)
+        if self._column[region] != start_col:
+            self.set_column(start_col)
+        self.bus.write_data(buf, start, length)
+        self._column[region] = (start_col + length) & 63
+
+    def fill(self, c: int) -> None:
+        """
+        Fill the whole framebuffer and mark it dirty, so the next `display()` sends every page.
+
+        :param c: Color, 0 or 1.
+        :type c: int
+        """
+        super().fill(c)
+        self.mark_dirty(0, 0, self.width, self.height)
+
+    @micropython.native
+    def mark_dirty(self, x: int, y: int, w: int, h: int) -> None:
+        """
+        Mark a rectangle of the framebuffer as changed so the next `display()` sends it.
+
+        The drawing methods of this driver and `fill()` mark what they touch; call this after drawing with the raw
+        `FrameBuffer` methods (`line()`, `fill_rect()`, `blit()`, ...).
+
+        :param x: Top-left x-coordinate.
+        :type x: int
+        :param y: Top-left y-coordinate.
+        :type y: int
+        :param w: Width of the rectangle.
+        :type w: int
+        :param h: Height of the rectangle.
+        :type h: int
+        """
+        x0 = max(x, 0)
+        x1 = min(x + w, self.width) - 1
+        y0 = max(y, 0)
+        y1 = min(y + h, self.height) - 1
+        if x0 > x1 or y0 > y1:
+            return
+
+        dirty_lo = self._dirty_lo
+        dirty_hi = self._dirty_hi
+        for page in range(y0 >> 3, (y1 >> 3) + 1):
+            for region in range(x0 >> 6, (x1 >> 6) + 1):
+                index = page * 3 + region
+                lo = max(x0 - region * 64, 0)
+                hi = min(x1 - region * 64, 63)
+                if lo < dirty_lo[index]:
+                    dirty_lo[index] = lo
+                if hi > dirty_hi[index]:
+                    dirty_hi[index] = hi
+
+    @micropython.native
+    def display(self, full: bool = False) -> None:
+        """
+        Send framebuffer content to the LCD.
+
+        Only the column spans marked dirty since the last call are sent, one run per (page, region) cell. With
+        `shadow=True` the framebuffer is instead compared with what was last sent and only the changed runs go out.
+        Runs are sent page-major, region-major or nearest-next, whichever needs the fewest chip-select switches and
+        address commands (see `last_plan`). The bytes, commands, chip-select switches, pin direction changes, time and
+        heap used are stored in `last_flush`.
+
+        :param full: True to send the whole framebuffer regardless of what changed.
+        :type full: bool
+        """
+        self.last_flush.begin(self.bus)
+        self._flush(full)
+        self.last_flush.end(self.bus)
+
+    @micropython.native
+    def _flush(self, full: bool = False) -> None:
+        """Send what changed (or everything), without touching `last_flush`; see `display()`."""
+        if self._shadow is not None and self._shadow_valid and not full:
+            self._flush_diff()
+            self._clear_dirty()
+            self._shadow_valid = True
+        else:
+            if full or self._shadow is not None:
+                self.mark_dirty(0, 0, self.width, self.height)
+            self._flush_dirty()
+            if self._shadow is not None:
+                self._shadow[:] = self.buffer
+                self._shadow_valid = True
+
+    @micropython.native
+    def _clear_dirty(self) -> None:
+        """Mark every (page, region) cell clean."""
+        dirty_lo = self._dirty_lo
+        dirty_hi = self._dirty_hi
+        for index in range(24):
+            dirty_lo[index] = 0xFF
+            dirty_hi[index] = 0
+
+    @micropython.native
+    def _flush_dirty(self) -> None:
+        """Send the dirty column span of every (page, region) cell and mark it clean."""
+        dirty_lo = self._dirty_lo
+        dirty_hi = self._dirty_hi
+        runs = []
         for page in range(8):
             for region in range(3):
-                self.do_select_chip(region)
-                self.set_page(page)
+                index = page * 3 + region
+                lo = dirty_lo[index]
+                if lo == 0xFF:
+                    continue
+                runs.append((region, page, lo, dirty_hi[index] - lo + 1))
+                dirty_lo[index] = 0xFF
+                dirty_hi[index] = 0
+
+        self._send_runs(runs)
+
+    @micropython.native
+    def _flush_diff(self) -> None:
+        """
+        Send only the bytes that differ from the shadow copy and update it.
+
+        Changed bytes are grouped into runs per (page, region) cell. Two runs are merged when the unchanged gap
+        between them is shorter than `READDRESS_COST`, because re-sending the gap is then cheaper than the column
+        command needed to start a new run.
+        """
+        buf = self.buffer
+        shadow = self._shadow
+        if buf == shadow:
+            return
+
+        merge_gap = self.READDRESS_COST
+        runs = []
+        for page in range(8):
+            for region in range(3):
+                base = (page * 192) + (region * 64)
+                run_start = -1
+                last_changed = -1
                 for col in range(64):
-                    index = (region * 64) + col + (page * 192)
-                    self.set_column(col)
-                    self.send_data(self.buffer[index])
+                    if buf[base + col] != shadow[base + col]:
+                        if run_start < 0:
+                            run_start = col
+                        elif col - last_changed - 1 >= merge_gap:
+                            runs.append((region, page, run_start, last_changed - run_start + 1))
+                            run_start = col
+                        last_changed = col
+                if run_start >= 0:
+                    runs.append((region, page, run_start, last_changed - run_start + 1))
+
+        self._send_runs(runs)
+        shadow[:] = buf
+
+    @micropython.native
+    def _send_runs(self, runs: list) -> None:
+        """
+        Send (region, page, start column, length) runs in the order that needs the fewest chip-select switches and
+        address commands; the chosen plan is kept in `last_plan`.
+        """
+        buf = self.buffer
+        if self._start:
+            runs = self._rotate_runs(runs)
+            buf = self._ram
+
+        self.last_plan = plan_flush(runs, self._selected, self._page, self._column)
+        for region, page, col, length in self.last_plan["runs"]:
+            self._write_run(region, page, col, buf, (page * 192) + (region * 64) + col, length)
+
+    @micropython.native
+    def _rotate_runs(self, runs: list) -> list:
+        """
+        Translate runs in screen pages into runs in panel RAM pages for the current start line, and fill those bytes
+        of `_ram` from the framebuffer.
+
+        With a start line of `8 * q + s`, RAM page `P` holds the bottom `8 - s` rows of screen page `P - q` and the
+        top `s` rows of the page below it, so each screen run touches up to two RAM pages.
+        """
+        q = self._start >> 3
+        s = self._start & 7
+        ram_lo = bytearray(b"\xff" * 24)
+        ram_hi = bytearray(24)
+        for region, page, col, length in runs:
+            last = col + length - 1
+            for ram_page in ((page + q) & 7, (page + q + 1) & 7) if s else ((page + q) & 7,):
+                index = ram_page * 3 + region
+                if col < ram_lo[index]:
+                    ram_lo[index] = col
+                if last > ram_hi[index]:
+                    ram_hi[index] = last
+
+        buf = self.buffer
+        ram = self._ram
+        ram_runs = []
+        for ram_page in range(8):
+            upper = ((ram_page - q) & 7) * 192
+            lower = ((ram_page - q - 1) & 7) * 192
+            for region in range(3):
+                index = ram_page * 3 + region
+                lo = ram_lo[index]
+                if lo == 0xFF:
+                    continue
+                hi = ram_hi[index]
+                base = ram_page * 192
+                for x in range(region * 64 + lo, region * 64 + hi + 1):
+                    if s:
+                        ram[base + x] = ((buf[upper + x] << s) | (buf[lower + x] >> (8 - s))) & 0xFF
+                    else:
+                        ram[base + x] = buf[upper + x]
+                ram_runs.append((region, ram_page, lo, hi - lo + 1))
+        return ram_runs
 
     @micropython.native
     def draw_text(self, text: str, x: int, y: int, font_map: object, spacing: int = 1, invert: bool = False) -> None:
@@ -427,44 +711,26 @@ class LM19264(FrameBuffer):
         :param invert: If True, invert glyph pixels (1 → 0, 0 → 1).
         :type invert: bool
         """
+        cache = self.glyph_cache
         for char in text:
-            # Retrieve glyph data for the character
-            glyph, glyph_height, glyph_width = font_map.get_ch(char)
-            if glyph is None:
-                x += spacing  # Skip unknown characters
-                continue
+            if cache is not None:
+                # Cached glyph frame buffers are drawn by `blit()` in C; key 0 leaves the background untouched, while
+                # inverted glyphs overwrite their whole box
+                fb, glyph_height, glyph_width = cache.get(font_map, char, invert)
+                if fb is None:
+                    x += spacing  # Skip unknown characters
+                    continue
+                self.blit(fb, x, y, -1 if invert else 0)
+            else:
+                # Retrieve glyph data for the character
+                glyph, glyph_height, glyph_width = font_map.get_ch(char)
+                if glyph is None:
+                    x += spacing  # Skip unknown characters
+                    continue
 
-            # Each column may span multiple bytes depending on glyph height
-            bytes_per_column = (glyph_height + 7) // 8  # Round up to the nearest byte
-
-            # Iterate over each column in the glyph
-            for col in range(glyph_width):
-                # For each row in the glyph height
-                for row in range(glyph_height):
-                    # Determine which byte contains the bit for this row
-                    byte_index = col * bytes_per_column + (row // 8)
-                    bit_index = row % 8  # Bit position within the byte
-
-                    # Safety check: avoid out-of-bounds access
-                    if byte_index >= len(glyph):
-                        continue
-
-                    # Check if the bit is set (i.e., pixel should be drawn)
-                    bit_set = glyph[byte_index] & (1 << bit_index)
-
-                    # Compute final pixel coordinates
-                    bx = x + col  # Horizontal position on bitmap
-                    by = y + row  # Vertical position on bitmap
-
-                    # Bounds check before writing to bitmap
-                    if 0 <= by < self.height and 0 <= bx < self.width:
-                        if invert:
-                            # Inverted mode
-                            self.pixel(bx, by, 0 if bit_set else 1)
-                        else:
-                            # Normal mode
-                            if bit_set:
-                                self.pixel(bx, by, 1)
+                # Glyph columns are already in the page layout, so they're copied a byte at a time
+                blit_glyph(self.buffer, self.width, self.height, glyph, glyph_width, glyph_height, x, y, invert)
+            self.mark_dirty(x, y, glyph_width, glyph_height)
 
             # Advance x position for next character
             x += glyph_width + spacing
@@ -484,15 +750,17 @@ class LM19264(FrameBuffer):
         :type lines: list | tuple
         """
         for x0, y0, angle_deg, length in lines:
-            angle_rad = math.radians(angle_deg)
-            dx = math.cos(angle_rad)
-            dy = -math.sin(angle_rad)  # negative because y increases downward
-
-            for i in range(length):
-                x = int(round(x0 + dx * i))
-                y = int(round(y0 + dy * i))
-                if 0 <= x < self.width and 0 <= y < self.height:
-                    self.pixel(x, y, 1)
+            if length <= 0:
+                continue
+            # Integer end point from the fixed-point sine table, then let `FrameBuffer` draw the line in C
+            x1, y1 = line_end(x0, y0, angle_deg, length)
+            if y0 == y1:
+                self.hline(min(x0, x1), y0, abs(x1 - x0) + 1, 1)
+            elif x0 == x1:
+                self.vline(x0, min(y0, y1), abs(y1 - y0) + 1, 1)
+            else:
+                self.line(x0, y0, x1, y1, 1)
+            self.mark_dirty(min(x0, x1), min(y0, y1), abs(x1 - x0) + 1, abs(y1 - y0) + 1)
 
     @micropython.native
     def draw_graphic_circle(self, cx: int, cy: int, radius: int) -> None:
@@ -506,6 +774,8 @@ class LM19264(FrameBuffer):
         :param radius: Radius of the circle, specified as an integer.
         :type radius: int
         """
+        self.mark_dirty(cx - radius, cy - radius, 2 * radius + 1, 2 * radius + 1)
+
         x = radius
         y = 0
         d = 1 - radius
@@ -549,44 +819,15 @@ class LM19264(FrameBuffer):
         :param radius: Radius of the circle, specified as an integer.
         :type radius: int
         """
-        x = radius
-        y = 0
-        d = 1 - radius
-
-        def draw_span(y_offset: int, x_left: int, x_right: int):
-            """
-            Draws a horizontal span at a specified vertical offset relative to a central point
-            with defined left and right horizontal lengths.
-
-            :param y_offset: Vertical offset, relative to the center `cy`, where the span should be drawn.
-            :type y_offset: int
-            :param x_left: Number of pixels to extend to the left of the center `cx`.
-            :type x_left: int
-            :param x_right: Number of pixels to extend to the right of the center `cx`.
-            :type x_right: int
-            """
-            y_pos = cy + y_offset
-            if 0 <= y_pos < self.height:  # Check vertical bounds
-                for x_pos in range(cx - x_left, cx + x_right + 1):
-                    if 0 <= x_pos < self.width:  # Check horizontal bounds
-                        self.pixel(x_pos, y_pos, 1)  # Set pixel ON
-
-        # Loop through each vertical slice of the circle
-        while x >= y:
-            # Draw horizontal spans for each symmetrical row
-            draw_span(+y, x, x)  # Top half
-            draw_span(-y, x, x)  # Bottom half
-            draw_span(+x, y, y)  # Right half
-            draw_span(-x, y, y)  # Left half
+        self.mark_dirty(cx - radius, cy - radius, 2 * radius + 1, 2 * radius + 1)
 
-            y += 1  # Move down one row
-
-            # Update the decision variable to determine whether to shrink x
-            if d < 0:
-                d += 2 * y + 1
-            else:
-                x -= 1
-                d += 2 * (y - x) + 1
+        # One `vline()` per column; `FrameBuffer` fills it a byte mask per page in C
+        heights = circle_half_heights(radius)
+        for a in range(radius + 1):
+            h = heights[a]
+            self.vline(cx - a, cy - h, 2 * h + 1, 1)
+            if a:
+                self.vline(cx + a, cy - h, 2 * h + 1, 1)
 
     @micropython.native
     def draw_graphic_circles(self, circles: list | tuple[list | tuple[int]]) -> None:
@@ -622,66 +863,28 @@ class LM19264(FrameBuffer):
         y1 = max(0, min(y + height - 1, self.height - 1))
         radius = max(1, min(radius, min((x1 - x0) // 2, (y1 - y0) // 2)))
 
-        # Fill interior rectangle (excluding corners)
+        self.mark_dirty(x0, y0, x1 - x0 + 1, y1 - y0 + 1)
+
+        # Straight section between the corners: the whole width when filled, otherwise the two vertical edges.
+        # `FrameBuffer` fills whole byte masks per page in C.
         if fill:
-            for yi in range(y0 + radius, y1 - radius + 1):
-                for xi in range(x0 + 1, x1):
-                    self.pixel(xi, yi, 1)
-            for yi in range(y0 + 1, y0 + radius):
-                for xi in range(x0 + radius, x1 - radius + 1):
-                    self.pixel(xi, yi, 1)
-            for yi in range(y1 - radius + 1, y1):
-                for xi in range(x0 + radius, x1 - radius + 1):
-                    self.pixel(xi, yi, 1)
-
-        # Horizontal edges
-        for xi in range(x0 + radius, x1 - radius + 1):
-            self.pixel(xi, y0, 1)
-            self.pixel(xi, y1, 1)
-
-        # Vertical edges
-        for yi in range(y0 + radius, y1 - radius + 1):
-            self.pixel(x0, yi, 1)
-            self.pixel(x1, yi, 1)
-
-        # Quarter-circle corners
-        steps = radius * 2
-        for i in range(steps + 1):
-            theta = (math.pi / 2) * (i / steps)
-            dx = int(round(radius * math.cos(theta)))
-            dy = int(round(radius * math.sin(theta)))
-
-            # Top-left
-            px = x0 + radius - dx
-            py = y0 + radius - dy
-            self.pixel(px, py, 1)
-            if fill:
-                for fy in range(py + 1, y0 + radius):
-                    self.pixel(px, fy, 1)
-
-            # Top-right
-            px = x1 - radius + dx
-            py = y0 + radius - dy
-            self.pixel(px, py, 1)
-            if fill:
-                for fy in range(py + 1, y0 + radius):
-                    self.pixel(px, fy, 1)
-
-            # Bottom-left
-            px = x0 + radius - dx
-            py = y1 - radius + dy
-            self.pixel(px, py, 1)
-            if fill:
-                for fy in range(y1 - radius + 1, py):
-                    self.pixel(px, fy, 1)
-
-            # Bottom-right
-            px = x1 - radius + dx
-            py = y1 - radius + dy
-            self.pixel(px, py, 1)
-            if fill:
-                for fy in range(y1 - radius + 1, py):
-                    self.pixel(px, fy, 1)
+            self.fill_rect(x0, y0 + radius, x1 - x0 + 1, y1 - y0 - 2 * radius + 1, 1)
+        else:
+            self.vline(x0, y0 + radius, y1 - y0 - 2 * radius + 1, 1)
+            self.vline(x1, y0 + radius, y1 - y0 - 2 * radius + 1, 1)
+
+        # Corner rows from the cached quarter-circle profile, mirrored to the top and bottom. The outermost row
+        # also carries the horizontal edge, so it's one span across.
+        outer, inner = corner_profile(radius)
+        for b in range(1, radius + 1):
+            left = x0 + radius - outer[b]
+            right = x1 - radius + outer[b]
+            for row in (y0 + radius - b, y1 - radius + b):
+                if fill or b == radius:
+                    self.hline(left, row, right - left + 1, 1)
+                else:
+                    self.hline(left, row, outer[b] - inner[b] + 1, 1)
+                    self.hline(x1 - radius + inner[b], row, outer[b] - inner[b] + 1, 1)
 
     @micropython.native
     def draw_bitmap_array(self, bitmap: list[list[int]], x_offset: int = 0, y_offset: int = 0) -> None:
@@ -698,6 +901,8 @@ class LM19264(FrameBuffer):
         height = len(bitmap)
         width = len(bitmap[0]) if height > 0 else 0
 
+        self.mark_dirty(x_offset, y_offset, width, height)
+
         for row in range(height):
             for col in range(width):
                 pixel = bitmap[row][col]
@@ -802,18 +1007,33 @@ class LM19264(FrameBuffer):
         """
         Draw a full-screen bitmap to the display.
 
-        :param bitmap: Bytearray of 1536 bytes (192×64 bitmap).
-        :type bitmap: bytearray
+        The whole panel is rewritten, so a start line left by `scroll_vertical()` is reset to 0 first. The bytes,
+        commands, chip-select switches, pin direction changes, time and heap used are stored in `last_flush`.
+
+        :param bitmap: Bytearray of 1536 bytes (192×64 bitmap), or a `Canvas`.
+        :type bitmap: bytearray | Canvas
         """
+        if isinstance(bitmap, Canvas):
+            bitmap = bitmap.buffer
+
         if len(bitmap) != self.width * 8:
             raise ValueError(f"Bitmap must be 1536 bytes (192×64 bitmap), received width {len(bitmap)}")
 
+        self.last_flush.begin(self.bus)
+        if self._start:
+            for region in range(3):
+                self.set_start_line(region, 0)
+            self._start = 0
+
         for page in range(8):
             for region in range(3):
-                self.do_select_chip(region)
-                self.set_page(page)
-                # Iterates columns; sends bitmap data to selected chip
-                for col in range(self.height):
-                    index = (region * self.height) + col + (page * self.width)
-                    self.set_column(col)
-                    self.send_data(bitmap[index])
+                self._write_run(region, page, 0, bitmap, (page * self.width) + (region * 64), 64)
+
+        # The panel now shows the bitmap rather than the framebuffer: the next diff flush compares against it, and the
+        # next dirty flush has to send everything to bring the framebuffer back
+        if self._shadow is not None:
+            self._shadow[:] = bitmap
+            self._shadow_valid = True
+        else:
+            self.mark_dirty(0, 0, self.width, self.height)
+        self.last_flush.end(self.bus)
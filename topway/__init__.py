@@ -1 +1,2 @@
 from .LM19264 import LM19264
+from .canvas import Canvas
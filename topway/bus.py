@@ -0,0 +1,382 @@
+from array import array
+from machine import Pin
+import machine
+import micropython
+import os
+import time
+
+
+# GPIO output set/clear and input registers for bank 0 (GPIO 0–31), keyed by chip name. Only chips listed here get a
+# register bus; newer variants (ESP32-C2, -C5, -C6, -H2, -P4, RP2350, ...) have other register maps.
+REGISTERS = (
+    ("ESP32S2", (0x3F404008, 0x3F40400C, 0x3F40403C)),  # GPIO_OUT_W1TS, GPIO_OUT_W1TC, GPIO_IN
+    ("ESP32S3", (0x60004008, 0x6000400C, 0x6000403C)),
+    ("ESP32C3", (0x60004008, 0x6000400C, 0x6000403C)),
+    ("ESP32", (0x3FF44008, 0x3FF4400C, 0x3FF4403C)),
+    ("RP2040", (0xD0000014, 0xD0000018, 0xD0000004)),  # SIO GPIO_OUT_SET, GPIO_OUT_CLR, GPIO_IN
+)
+
+
+def chip_name(machine: str) -> str:
+    """
+    Get the chip name from `os.uname().machine`, e.g. "ESP32S2" from "ESP32-S2 module with ESP32S2" or "RP2040"
+    from "Raspberry Pi Pico with RP2040".
+
+    :param machine: Machine description.
+    :type machine: str
+    :return: Chip name in upper case, without dashes.
+    :rtype: str
+    """
+    name = machine.upper().replace("-", "")
+    words = name.rpartition(" WITH ")[2].split()
+    return words[-1] if words else ""
+
+
+def detect_registers() -> tuple[int, int, int] | None:
+    """
+    Look up the GPIO set/clear/input register addresses for the running chip.
+
+    The chip name must match exactly, so an unknown variant such as the ESP32-C6 is not taken for a classic ESP32.
+
+    :return: Tuple of (set register, clear register, input register), or None if the chip is not known.
+    :rtype: tuple | None
+    """
+    name = chip_name(os.uname().machine)
+    for chip, registers in REGISTERS:
+        if chip == name:
+            return registers
+    return None
+
+
+class PinBus:
+    def __init__(self, data: tuple | list, rs: Pin, rw: Pin, e: Pin, csa: Pin, csb: Pin):
+        """
+        Parallel bus that drives every data line through its own `Pin` object.
+
+        This works on any port and is the fallback when a register-level bus is not available.
+
+        :param data: Pins for DB0–DB7, in bit order.
+        :type data: tuple | list
+        :param rs: Pin for RS (Register Select).
+        :type rs: Pin
+        :param rw: Pin for RW (Read/Write).
+        :type rw: Pin
+        :param e: Pin for E (Enable).
+        :type e: Pin
+        :param csa: Pin for CSA (Chip Select A).
+        :type csa: Pin
+        :param csb: Pin for CSB (Chip Select B).
+        :type csb: Pin
+        """
+        self.data = tuple(data)
+        self.rs = rs
+        self.rw = rw
+        self.e = e
+        self.csa = csa
+        self.csb = csb
+
+        # Running totals of bytes latched into the controllers, split by RS level.
+        self.bytes_sent = 0
+        self.commands_sent = 0
+
+        # Running totals of chip-select changes and data pin direction switches.
+        self.cs_switches = 0
+        self.direction_changes = 0
+
+        # Running totals of control pin (CSA/CSB/RS/RW) writes made and skipped because the level was already set.
+        self.control_writes = 0
+        self.control_writes_skipped = 0
+
+        # Last levels driven onto the control pins; -1 means unknown, so the next write always goes out.
+        self._region = -1
+        self._rs = -1
+        self._rw = -1
+
+    @micropython.native
+    def invalidate(self) -> None:
+        """
+        Forget the cached CS, RS and RW levels so the next access drives them again.
+
+        Call this after anything that touches the control pins behind the bus's back, such as a reset or a status read.
+        """
+        self._region = -1
+        self._rs = -1
+        self._rw = -1
+
+    @micropython.native
+    def set_data(self, value: int) -> None:
+        """
+        Drive DB0–DB7 to the bits of a byte.
+
+        :param value: 8-bit value.
+        :type value: int
+        """
+        db0, db1, db2, db3, db4, db5, db6, db7 = self.data
+        db0.value((value >> 0) & 1)
+        db1.value((value >> 1) & 1)
+        db2.value((value >> 2) & 1)
+        db3.value((value >> 3) & 1)
+        db4.value((value >> 4) & 1)
+        db5.value((value >> 5) & 1)
+        db6.value((value >> 6) & 1)
+        db7.value((value >> 7) & 1)
+
+    @micropython.native
+    def get_data(self) -> int:
+        """
+        Sample DB0–DB7 into a byte.
+
+        :return: 8-bit value.
+        :rtype: int
+        """
+        value = 0
+        bit = 1
+        for pin in self.data:
+            if pin.value():
+                value |= bit
+            bit <<= 1
+        return value
+
+    @micropython.native
+    def set_outputs(self) -> None:
+        """Configure DB0–DB7 pins as outputs (for writing commands/data)."""
+        for pin in self.data:
+            pin.init(Pin.OUT)
+        self.direction_changes += 1
+
+    @micropython.native
+    def set_inputs(self) -> None:
+        """Configure DB0–DB7 pins as inputs (for reading data)."""
+        for pin in self.data:
+            pin.init(Pin.IN, Pin.PULL_DOWN)
+        self.direction_changes += 1
+
+    @micropython.native
+    def select(self, region: int) -> None:
+        """
+        Select one of the three chip regions.
+
+        :param region: Region index (0 = left, 1 = middle, 2 = right).
+        :type region: int
+        """
+        if region == self._region:
+            self.control_writes_skipped += 3 if region else 2
+            return
+
+        self.csa.off()
+        self.csb.off()
+        if region == 1:
+            self.csa.on()
+        elif region == 2:
+            self.csb.on()
+        self._region = region
+        self.control_writes += 3 if region else 2
+        self.cs_switches += 1
+
+    @micropython.native
+    def set_mode(self, rs: int, rw: int) -> None:
+        """
+        Drive RS and RW, skipping either pin if it is already at the requested level.
+
+        :param rs: RS level, 0 for an instruction or status or 1 for display data.
+        :type rs: int
+        :param rw: RW level, 0 to write or 1 to read.
+        :type rw: int
+        """
+        if rs == self._rs:
+            self.control_writes_skipped += 1
+        else:
+            self.rs.value(rs)
+            self._rs = rs
+            self.control_writes += 1
+
+        if rw == self._rw:
+            self.control_writes_skipped += 1
+        else:
+            self.rw.value(rw)
+            self._rw = rw
+            self.control_writes += 1
+
+    @micropython.native
+    def write(self, value: int, rs: int) -> None:
+        """
+        Latch one byte into the selected controller.
+
+        :param value: 8-bit value.
+        :type value: int
+        :param rs: RS level, 0 for an instruction or 1 for display data.
+        :type rs: int
+        """
+        self.set_mode(rs, 0)
+        self.set_data(value)
+        self.e.on()
+        self.e.off()
+        if rs:
+            self.bytes_sent += 1
+        else:
+            self.commands_sent += 1
+
+    @micropython.native
+    def write_data(self, buf: bytes | bytearray | memoryview, start: int, length: int) -> None:
+        """
+        Latch a run of display data bytes into the selected controller.
+
+        :param buf: Buffer holding the bytes to send.
+        :type buf: bytes | bytearray | memoryview
+        :param start: Index of the first byte in `buf` to send.
+        :type start: int
+        :param length: Number of bytes to send.
+        :type length: int
+        """
+        self.set_mode(1, 0)
+        set_data = self.set_data
+        e = self.e
+        for index in range(start, start + length):
+            set_data(buf[index])
+            e.on()
+            e.off()
+        self.bytes_sent += length
+
+    @micropython.native
+    def read(self) -> int:
+        """
+        Read one display data byte from the selected controller; DB0–DB7 must already be inputs.
+
+        :return: 8-bit value.
+        :rtype: int
+        """
+        self.set_mode(1, 1)  # RS = 1 (data), RW = 1 (read)
+        self.e.on()  # Pulse E high
+        time.sleep_us(1)
+        value = self.get_data()
+        self.e.off()  # Pulse E low
+        return value
+
+
+class RegisterBus(PinBus):
+    def __init__(self, data: tuple | list, rs: Pin, rw: Pin, e: Pin, csa: Pin, csb: Pin,
+                 registers: tuple[int, int, int] | None = None, mem: object = None):
+        """
+        Parallel bus that drives DB0–DB7 with one set and one clear register write per byte.
+
+        Set/clear masks for all 256 byte values are computed once from the GPIO numbers, so a write is two table
+        lookups and two `machine.mem32` stores instead of eight `Pin.value()` calls.
+
+        :param data: GPIO numbers (0–31) for DB0–DB7, in bit order.
+        :type data: tuple | list
+        :param rs: Pin for RS (Register Select).
+        :type rs: Pin
+        :param rw: Pin for RW (Read/Write).
+        :type rw: Pin
+        :param e: Pin for E (Enable).
+        :type e: Pin
+        :param csa: Pin for CSA (Chip Select A).
+        :type csa: Pin
+        :param csb: Pin for CSB (Chip Select B).
+        :type csb: Pin
+        :param registers: (set register, clear register, input register) addresses; detected from the chip if None.
+        :type registers: tuple | None
+        :param mem: Object indexed by register address; `machine.mem32` if None.
+        :type mem: object
+        :raises ValueError: If the pins are not GPIO numbers in bank 0 or the chip's registers are not known.
+        """
+        if len(data) != 8:
+            raise ValueError("Data bus needs exactly 8 pins.")
+        for gpio in data:
+            if not isinstance(gpio, int):
+                raise ValueError("Register bus needs GPIO numbers, not Pin objects.")
+            if not 0 <= gpio < 32:
+                raise ValueError(f"GPIO {gpio} is outside register bank 0 (GPIO 0–31).")
+
+        if registers is None:
+            registers = detect_registers()
+            if registers is None:
+                raise ValueError(f"No GPIO registers known for {os.uname().machine}.")
+
+        super().__init__(data=[Pin(gpio, Pin.OUT) for gpio in data], rs=rs, rw=rw, e=e, csa=csa, csb=csb)
+
+        self.gpios = tuple(data)
+        self.reg_set, self.reg_clr, self.reg_in = registers
+        self.mem = mem if mem is not None else machine.mem32
+        self.set_masks, self.clr_masks = self.build_masks(self.gpios)
+
+    @staticmethod
+    def build_masks(gpios: tuple | list) -> tuple[array, array]:
+        """
+        Build the 256-entry set and clear mask tables, indexed by data byte.
+
+        :param gpios: GPIO numbers for DB0–DB7, in bit order.
+        :type gpios: tuple | list
+        :return: Tuple of (set masks, clear masks).
+        :rtype: tuple
+        """
+        bus_mask = 0
+        for gpio in gpios:
+            bus_mask |= 1 << gpio
+
+        set_masks = array("I", [0] * 256)
+        clr_masks = array("I", [0] * 256)
+        for value in range(256):
+            mask = 0
+            for bit in range(8):
+                if value & (1 << bit):
+                    mask |= 1 << gpios[bit]
+            set_masks[value] = mask
+            clr_masks[value] = bus_mask & ~mask
+        return set_masks, clr_masks
+
+    @micropython.native
+    def set_data(self, value: int) -> None:
+        """
+        Drive DB0–DB7 to the bits of a byte.
+
+        :param value: 8-bit value.
+        :type value: int
+        """
+        mem = self.mem
+        mem[self.reg_set] = self.set_masks[value]
+        mem[self.reg_clr] = self.clr_masks[value]
+
+    @micropython.native
+    def get_data(self) -> int:
+        """
+        Sample DB0–DB7 into a byte with a single register read.
+
+        :return: 8-bit value.
+        :rtype: int
+        """
+        levels = self.mem[self.reg_in]
+        value = 0
+        bit = 1
+        for gpio in self.gpios:
+            if levels & (1 << gpio):
+                value |= bit
+            bit <<= 1
+        return value
+
+    @micropython.native
+    def write_data(self, buf: bytes | bytearray | memoryview, start: int, length: int) -> None:
+        """
+        Latch a run of display data bytes into the selected controller.
+
+        :param buf: Buffer holding the bytes to send.
+        :type buf: bytes | bytearray | memoryview
+        :param start: Index of the first byte in `buf` to send.
+        :type start: int
+        :param length: Number of bytes to send.
+        :type length: int
+        """
+        self.set_mode(1, 0)
+        mem = self.mem
+        reg_set = self.reg_set
+        reg_clr = self.reg_clr
+        set_masks = self.set_masks
+        clr_masks = self.clr_masks
+        e = self.e
+        for index in range(start, start + length):
+            value = buf[index]
+            mem[reg_set] = set_masks[value]
+            mem[reg_clr] = clr_masks[value]
+            e.on()
+            e.off()
+        self.bytes_sent += length
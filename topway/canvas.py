@@ -0,0 +1,358 @@
+from .raster import blit_glyph, blit_vlsb, circle_half_heights, corner_profile, fill_rect, line, line_end
+from .rle import blit_rle
+import micropython
+
+
+class Canvas:
+    width = 192
+    height = 64
+
+    def __init__(self, buffer: bytearray | None = None):
+        """
+        192x64 drawing surface backed by a packed 1536-byte buffer in the display's page layout (MONO_VLSB).
+
+        Byte `page * 192 + x` holds rows `page * 8` to `page * 8 + 7` of column `x`, least significant bit on top,
+        which is exactly what the controllers expect, so the buffer can be sent without packing. The drawing
+        methods match the bitmap driver's but modify the canvas in place.
+
+        :param buffer: Existing 1536-byte buffer to draw into; a new blank one is allocated if None.
+        :type buffer: bytearray | None
+        """
+        if buffer is None:
+            buffer = bytearray(self.width * self.height // 8)
+        elif len(buffer) != self.width * self.height // 8:
+            raise ValueError(f"Buffer must be 1536 bytes (192×64 bitmap), received {len(buffer)}")
+        self.buffer = buffer
+
+    @classmethod
+    def from_bitmap(cls, bitmap: list | tuple[list | tuple[int]]) -> "Canvas":
+        """
+        Create a canvas from a legacy 2D pixel array.
+
+        :param bitmap: List of 64 rows, each containing 192 binary pixel values (0 or 1).
+        :type bitmap: list | tuple
+        :return: New canvas holding the same pixels.
+        :rtype: Canvas
+        """
+        if len(bitmap) != cls.height or any(len(row) != cls.width for row in bitmap):
+            raise ValueError("Input must be 64 rows of 192 columns each.")
+
+        canvas = cls()
+        canvas.overlay_bitmap(bitmap, x=0, y=0, mode="replace")
+        return canvas
+
+    @micropython.native
+    def to_bitmap(self) -> list[list[int]]:
+        """
+        Unpack the canvas into a legacy 2D pixel array.
+
+        :return: List of 64 rows, each containing 192 binary pixel values (0 or 1).
+        :rtype: list
+        """
+        buf = self.buffer
+        bitmap = []
+        for y in range(self.height):
+            offset = (y >> 3) * self.width
+            mask = 1 << (y & 7)
+            bitmap.append([1 if buf[offset + x] & mask else 0 for x in range(self.width)])
+        return bitmap
+
+    @micropython.native
+    def clear(self) -> None:
+        """Clear every pixel without reallocating the buffer."""
+        buf = self.buffer
+        for index in range(len(buf)):
+            buf[index] = 0
+
+    @micropython.native
+    def pixel(self, x: int, y: int, color: int | None = None) -> int | None:
+        """
+        Get or set a single pixel; coordinates outside the canvas are ignored.
+
+        :param x: Horizontal pixel position.
+        :type x: int
+        :param y: Vertical pixel position.
+        :type y: int
+        :param color: 1 to set, 0 to clear, or None to read the pixel.
+        :type color: int | None
+        :return: The pixel value when reading, otherwise None.
+        :rtype: int | None
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return 0 if color is None else None
+
+        index = (y >> 3) * self.width + x
+        mask = 1 << (y & 7)
+        if color is None:
+            return 1 if self.buffer[index] & mask else 0
+        if color:
+            self.buffer[index] |= mask
+        else:
+            self.buffer[index] &= ~mask
+
+    @micropython.native
+    def overlay_bitmap(self, overlay_bitmap: list | tuple[list | tuple[int]], x: int, y: int,
+                       mode: str = "or") -> None:
+        """
+        Overlay a 2D pixel array onto the canvas at a given (x, y) position.
+
+        The overlay is packed a column at a time into page bytes, so the canvas is updated one byte per page rather
+        than one pixel at a time.
+
+        :param overlay_bitmap: 2D list of rows × columns (0 or 1), the overlay image.
+        :type overlay_bitmap: list | tuple
+        :param x: Horizontal offset (0–191) where overlay starts.
+        :type x: int
+        :param y: Vertical offset (0–63) where overlay starts.
+        :type y: int
+        :param mode: Bitwise mode: "or", "and", "xor", or "replace".
+        :type mode: str
+        """
+        if mode not in ("or", "and", "xor", "replace"):
+            raise ValueError(f"Unknown mode: {mode}")
+
+        height = len(overlay_bitmap)
+        width = len(overlay_bitmap[0]) if height > 0 else 0
+
+        buf = self.buffer
+        row_first = max(0, -y)
+        row_last = min(height, self.height - y)
+        for col in range(max(0, -x), min(width, self.width - x)):
+            tx = x + col
+            row = row_first
+            while row < row_last:
+                ty = y + row
+                page = ty >> 3
+                # Collect the overlay rows that fall into this page
+                bits = 0
+                mask = 0
+                while row < row_last and (y + row) >> 3 == page:
+                    bit = 1 << ((y + row) & 7)
+                    mask |= bit
+                    if overlay_bitmap[row][col]:
+                        bits |= bit
+                    row += 1
+
+                index = page * self.width + tx
+                if mode == "or":
+                    buf[index] |= bits
+                elif mode == "and":
+                    buf[index] &= bits | (~mask & 0xFF)
+                elif mode == "xor":
+                    buf[index] ^= bits
+                else:
+                    buf[index] = (buf[index] & ~mask) | bits
+
+    @micropython.native
+    def blit(self, image: bytes | bytearray | memoryview, width: int, height: int, x: int, y: int,
+             mode: str = "or") -> None:
+        """
+        Draw a page-packed (MONO_VLSB) image, such as an icon from `load_icon()`, onto the canvas.
+
+        :param image: Page-packed image bytes.
+        :type image: bytes | bytearray | memoryview
+        :param width: Image width in pixels.
+        :type width: int
+        :param height: Image height in pixels.
+        :type height: int
+        :param x: Horizontal offset where the image starts.
+        :type x: int
+        :param y: Vertical offset where the image starts.
+        :type y: int
+        :param mode: "or" to set the image's pixels, "xor" to invert them or "replace" to copy the whole image area.
+        :type mode: str
+        """
+        blit_vlsb(self.buffer, self.width, self.height, image, width, height, x, y, mode)
+
+    def blit_rle(self, source: object, width: int, height: int, x: int, y: int, mode: str = "or") -> None:
+        """
+        Decompress a run-length compressed page-packed image (see `topway/rle.py`) straight onto the canvas, a page
+        of the image at a time.
+
+        :param source: Compressed bytes, or an open binary file positioned at the start of the image.
+        :type source: object
+        :param width: Image width in pixels.
+        :type width: int
+        :param height: Image height in pixels.
+        :type height: int
+        :param x: Horizontal offset where the image starts.
+        :type x: int
+        :param y: Vertical offset where the image starts.
+        :type y: int
+        :param mode: "or" to set the image's pixels, "xor" to invert them or "replace" to copy the whole image area.
+        :type mode: str
+        """
+        blit_rle(self.buffer, self.width, self.height, source, width, height, x, y, mode)
+
+    @micropython.native
+    def draw_text(self, text: str, x: int, y: int, font_map: object, spacing: int = 1, invert: bool = False) -> None:
+        """
+        Render a string of text onto the canvas.
+
+        :param text: String to render.
+        :type text: str
+        :param x: Horizontal pixel offset (starting column).
+        :type x: int
+        :param y: Vertical pixel offset (starting row).
+        :type y: int
+        :param font_map: Font module with `get_ch(char)` function.
+        :type font_map: object
+        :param spacing: Horizontal space between characters (default: 1).
+        :type spacing: int
+        :param invert: If True, invert glyph pixels (1 → 0, 0 → 1).
+        :type invert: bool
+        """
+        for char in text:
+            glyph, glyph_height, glyph_width = font_map.get_ch(char)
+            if glyph is None:
+                x += spacing  # Skip unknown characters
+                continue
+
+            blit_glyph(self.buffer, self.width, self.height, glyph, glyph_width, glyph_height, x, y, invert)
+
+            x += glyph_width + spacing
+
+    @micropython.native
+    def draw_graphic_lines(self, lines: list | tuple[list | tuple[int]]) -> None:
+        """
+        Draws lines based on [x, y, angle_deg, length] specs onto the canvas.
+
+        * - **IMPORTANT:**
+        * - Degrees are measured counter-clockwise from the positive x-axis. This means 90 degrees from left to right is actually 0 and 180 degrees top to bottom is actually 270.
+
+        :param lines: A list or tuple of lines, each defined as [x0, y0, angle_deg, length].
+        :type lines: list | tuple
+        """
+        for x0, y0, angle_deg, length in lines:
+            if length <= 0:
+                continue
+            x1, y1 = line_end(x0, y0, angle_deg, length)
+            line(self.buffer, self.width, self.height, x0, y0, x1, y1)
+
+    @micropython.native
+    def draw_graphic_circle(self, cx: int, cy: int, radius: int) -> None:
+        """
+        Draw a circle onto the canvas using the midpoint circle algorithm.
+
+        :param cx: Integer coordinate for the x-center of the circle.
+        :type cx: int
+        :param cy: Integer coordinate for the y-center of the circle.
+        :type cy: int
+        :param radius: Radius of the circle, specified as an integer.
+        :type radius: int
+        """
+        x = radius
+        y = 0
+        d = 1 - radius
+
+        while x >= y:
+            # Plot all 8 symmetrical points around the center
+            self.pixel(cx + x, cy + y, 1)
+            self.pixel(cx + y, cy + x, 1)
+            self.pixel(cx - y, cy + x, 1)
+            self.pixel(cx - x, cy + y, 1)
+            self.pixel(cx - x, cy - y, 1)
+            self.pixel(cx - y, cy - x, 1)
+            self.pixel(cx + y, cy - x, 1)
+            self.pixel(cx + x, cy - y, 1)
+
+            y += 1
+            if d < 0:
+                d += 2 * y + 1
+            else:
+                x -= 1
+                d += 2 * (y - x) + 1
+
+    @micropython.native
+    def fill_span_rect(self, x0: int, y0: int, x1: int, y1: int, mode: str = "or") -> None:
+        """
+        Set, clear or invert a rectangle from (x0, y0) to (x1, y1) inclusive, a byte mask per page at a time. It takes
+        the two corners, unlike `FrameBuffer.fill_rect(x, y, w, h, c)`.
+
+        :param x0: First column.
+        :type x0: int
+        :param y0: First row.
+        :type y0: int
+        :param x1: Last column.
+        :type x1: int
+        :param y1: Last row.
+        :type y1: int
+        :param mode: "or" to set the pixels, "and" to clear them or "xor" to invert them.
+        :type mode: str
+        """
+        fill_rect(self.buffer, self.width, self.height, x0, y0, x1, y1, mode)
+
+    @micropython.native
+    def draw_graphic_circle_filled(self, cx: int, cy: int, radius: int) -> None:
+        """
+        Draw a filled circle onto the canvas using the midpoint circle algorithm.
+
+        :param cx: Integer coordinate for the x-center of the circle.
+        :type cx: int
+        :param cy: Integer coordinate for the y-center of the circle.
+        :type cy: int
+        :param radius: Radius of the circle, specified as an integer.
+        :type radius: int
+        """
+        # Fill a column at a time, so each column is one byte mask per page
+        buf = self.buffer
+        heights = circle_half_heights(radius)
+        for a in range(radius + 1):
+            h = heights[a]
+            fill_rect(buf, self.width, self.height, cx - a, cy - h, cx - a, cy + h)
+            if a:
+                fill_rect(buf, self.width, self.height, cx + a, cy - h, cx + a, cy + h)
+
+    @micropython.native
+    def draw_graphic_circles(self, circles: list | tuple[list | tuple[int]]) -> None:
+        """
+        Draw one or more circles onto the canvas.
+
+        Each circle is defined as a tuple: (cx, cy, radius, filled).
+
+        :param circles: A list or tuple containing the definitions of circles.
+        :type circles: list | tuple
+        """
+        for cx, cy, radius, filled in circles:
+            if filled:
+                self.draw_graphic_circle_filled(cx, cy, radius)
+            else:
+                self.draw_graphic_circle(cx, cy, radius)
+
+    @micropython.native
+    def draw_graphic_box(self, x: int, y: int, width: int, height: int, radius: int = 0, fill: bool = False) -> None:
+        """
+        Draws a box with quarter-circle rounded corners onto the canvas.
+
+        :param x: Top-left x-coordinate.
+        :param y: Top-left y-coordinate.
+        :param width: Width of the box.
+        :param height: Height of the box.
+        :param radius: Radius of the rounded corners.
+        :param fill: Whether to fill the interior of the box.
+        """
+        x0 = max(0, min(x, self.width - 1))
+        x1 = max(0, min(x + width - 1, self.width - 1))
+        y0 = max(0, min(y, self.height - 1))
+        y1 = max(0, min(y + height - 1, self.height - 1))
+        radius = max(1, min(radius, min((x1 - x0) // 2, (y1 - y0) // 2)))
+
+        # Straight section between the corners: the whole width when filled, otherwise the two vertical edges
+        if fill:
+            self.fill_span_rect(x0, y0 + radius, x1, y1 - radius)
+        else:
+            self.fill_span_rect(x0, y0 + radius, x0, y1 - radius)
+            self.fill_span_rect(x1, y0 + radius, x1, y1 - radius)
+
+        # Corner rows from the cached quarter-circle profile, mirrored to the top and bottom. The outermost row
+        # also carries the horizontal edge, so it's one span across.
+        outer, inner = corner_profile(radius)
+        for b in range(1, radius + 1):
+            left = x0 + radius - outer[b]
+            right = x1 - radius + outer[b]
+            for row in (y0 + radius - b, y1 - radius + b):
+                if fill or b == radius:
+                    self.fill_span_rect(left, row, right, row)
+                else:
+                    self.fill_span_rect(left, row, x0 + radius - inner[b], row)
+                    self.fill_span_rect(x1 - radius + inner[b], row, right, row)
@@ -0,0 +1,123 @@
+import micropython
+
+
+# The three controllers keep their own page (X) and column (Y) address registers, so switching chip select does not
+# lose another controller's position, and the column wraps from 63 back to 0 after a data write. Depending on which
+# runs are dirty, a different visiting order needs fewer chip-select switches and address commands.
+
+# Above this many runs the greedy order is skipped; it is quadratic in the number of runs.
+GREEDY_LIMIT = 48
+
+UNKNOWN = 0xFF
+
+
+@micropython.native
+def run_cost(runs: list, selected: int, pages: bytes | bytearray, columns: bytes | bytearray) -> int:
+    """
+    Count the chip-select switches and page/column commands needed to send runs in the given order.
+
+    :param runs: List of (region, page, start column, length) tuples, in send order.
+    :type runs: list
+    :param selected: Currently selected region, or -1 if not known.
+    :type selected: int
+    :param pages: Current page address of each region, `UNKNOWN` if not known.
+    :type pages: bytes | bytearray
+    :param columns: Current column address of each region, `UNKNOWN` if not known.
+    :type columns: bytes | bytearray
+    :return: Total number of chip-select switches plus address commands.
+    :rtype: int
+    """
+    page_at = bytearray(pages)
+    column_at = bytearray(columns)
+    cost = 0
+    for region, page, col, length in runs:
+        if region != selected:
+            selected = region
+            cost += 1
+        if page_at[region] != page:
+            page_at[region] = page
+            cost += 1
+        if column_at[region] != col:
+            cost += 1
+        column_at[region] = (col + length) & 63
+    return cost
+
+
+@micropython.native
+def greedy_order(runs: list, selected: int, pages: bytes | bytearray, columns: bytes | bytearray) -> list:
+    """
+    Order runs by always sending next the run that is cheapest to reach from the current controller state.
+
+    Ties go to the run that comes first in `runs`.
+
+    :param runs: List of (region, page, start column, length) tuples.
+    :type runs: list
+    :param selected: Currently selected region, or -1 if not known.
+    :type selected: int
+    :param pages: Current page address of each region, `UNKNOWN` if not known.
+    :type pages: bytes | bytearray
+    :param columns: Current column address of each region, `UNKNOWN` if not known.
+    :type columns: bytes | bytearray
+    :return: The runs in send order.
+    :rtype: list
+    """
+    page_at = bytearray(pages)
+    column_at = bytearray(columns)
+    pending = list(runs)
+    ordered = []
+    while pending:
+        best = 0
+        best_cost = 4
+        for index in range(len(pending)):
+            region, page, col, _ = pending[index]
+            cost = (region != selected) + (page_at[region] != page) + (column_at[region] != col)
+            if cost < best_cost:
+                best = index
+                best_cost = cost
+                if cost == 0:
+                    break
+        region, page, col, length = pending.pop(best)
+        selected = region
+        page_at[region] = page
+        column_at[region] = (col + length) & 63
+        ordered.append((region, page, col, length))
+    return ordered
+
+
+@micropython.native
+def plan_flush(runs: list, selected: int = -1, pages: bytes | bytearray = b"\xff\xff\xff",
+               columns: bytes | bytearray = b"\xff\xff\xff") -> dict:
+    """
+    Pick the order to send runs in with the fewest chip-select switches plus page/column commands.
+
+    Page-major (all regions of a page, then the next page), region-major (all pages of one controller, then the next
+    controller) and, for small sets, a greedy nearest-next order are costed and the cheapest wins.
+
+    :param runs: List of (region, page, start column, length) tuples, page-major.
+    :type runs: list
+    :param selected: Currently selected region, or -1 if not known.
+    :type selected: int
+    :param pages: Current page address of each region, `UNKNOWN` if not known.
+    :type pages: bytes | bytearray
+    :param columns: Current column address of each region, `UNKNOWN` if not known.
+    :type columns: bytes | bytearray
+    :return: Dictionary with the chosen "order" name, the "runs" in send order, its "cost" and the "costs" of every
+        order considered.
+    :rtype: dict
+    """
+    candidates = [
+        ("page-major", sorted(runs, key=lambda run: (run[1], run[0], run[2]))),
+        ("region-major", sorted(runs, key=lambda run: (run[0], run[1], run[2]))),
+    ]
+    if len(runs) <= GREEDY_LIMIT:
+        candidates.append(("greedy", greedy_order(runs, selected, pages, columns)))
+
+    costs = {}
+    best = None
+    for name, ordered in candidates:
+        cost = run_cost(ordered, selected, pages, columns)
+        costs[name] = cost
+        if best is None or cost < best[2]:
+            best = (name, ordered, cost)
+
+    return {"order": best[0], "runs": best[1], "cost": best[2], "costs": costs}
@@ -1,3 +1,8 @@
+from collections import OrderedDict
+from .text import _INDEXED, forget_font, indexed_font
+import gc
+import sys
+
 # Yoinked from https://github.com/Emantor/mensactrl/blob/master/python/bitmapfont.py
 # which was yoinked from http://www.hwsw.no/snippets/5x7_LCD_font.php
 FONT_5x7 = {
@@ -117,3 +122,165 @@ FONT_5x7 = {
     u"☐": [0xff, 0x41, 0x41, 0x41, 0xff],
     u"ø": [0x0C, 0x12, 0x12, 0x0C, 0x00],
 }
+
+
+class FontRegistry:
+    def __init__(self, budget: int | None = None, package: str = "topway.font", indexed: bool = False,
+                 glyph_cache: object = None, debug: bool = False):
+        """
+        Maps font family and size to a font module and imports each font the first time it's asked for, instead of
+        every font an app might use being imported (and held in memory) at startup.
+
+        Fonts are named `{package}.{family}_size{size}` unless registered otherwise with `register()`. When the
+        loaded fonts take more than `budget` bytes, the least recently used ones are unloaded: removed from
+        `sys.modules` and their package, and garbage collected. A font can only be freed once nothing else refers to
+        it, so get fonts from the registry when drawing rather than keeping them in variables.
+
+        :param budget: Maximum bytes of loaded fonts, or None for no limit.
+        :type budget: int | None
+        :param package: Package the font modules are in.
+        :type package: str
+        :param indexed: Hand out fonts wrapped by `indexed_font()`.
+        :type indexed: bool
+        :param glyph_cache: `GlyphCache` (e.g. `lcd.glyph_cache` of the FrameBuffer driver) to drop a font's glyphs
+            from when it's unloaded.
+        :type glyph_cache: GlyphCache
+        :param debug: True to print each font loaded and unloaded.
+        :type debug: bool
+        """
+        self.budget = budget
+        self.package = package
+        self.indexed = indexed
+        self.glyph_cache = glyph_cache
+        self.debug = debug
+        self.size = 0
+        self.loads = 0
+        self.evictions = 0
+        self._names = {}
+        # (family, size) -> (module, footprint), least recently used first
+        self._loaded = OrderedDict()
+
+    def register(self, family: str, size: int, module: str) -> None:
+        """
+        Map a family and size to a module name that doesn't follow the `{family}_size{size}` naming.
+
+        :param family: Font family, e.g. "Aclonica".
+        :type family: str
+        :param size: Font size in pixels.
+        :type size: int
+        :param module: Full module name, e.g. "fonts.aclonica_big".
+        :type module: str
+        """
+        self._names[(family, size)] = module
+
+    def module_name(self, family: str, size: int) -> str:
+        """
+        Get the name of the module a family and size are loaded from.
+
+        :param family: Font family.
+        :type family: str
+        :param size: Font size in pixels.
+        :type size: int
+        :return: Full module name.
+        :rtype: str
+        """
+        return self._names.get((family, size)) or f"{self.package}.{family}_size{size}"
+
+    def get(self, family: str, size: int) -> object:
+        """
+        Get a font, importing it on first use and unloading cold fonts if that goes over the budget. The font asked
+        for is kept even if it's larger than the whole budget.
+
+        :param family: Font family, e.g. "Aclonica".
+        :type family: str
+        :param size: Font size in pixels.
+        :type size: int
+        :return: Font module, or its `IndexedFont` wrapper if the registry is `indexed`.
+        :rtype: object
+        :raises ImportError: If there's no such font module.
+        """
+        key = (family, size)
+        entry = self._loaded.pop(key, None)
+        if entry is None:
+            entry = self._load(self.module_name(family, size))
+            self.loads += 1
+            self.size += entry[1]
+            if self.budget is not None:
+                while self._loaded and self.size > self.budget:
+                    self.evict(*next(iter(self._loaded)))
+        # Re-inserting moves the font to the most recently used end
+        self._loaded[key] = entry
+        return indexed_font(entry[0]) if self.indexed else entry[0]
+
+    def _load(self, name: str) -> tuple[object, int]:
+        """Import a font module and measure how much heap it took."""
+        gc.collect()
+        before = gc.mem_alloc() if hasattr(gc, "mem_alloc") else None
+        module = __import__(name, None, None, ("get_ch",))
+        if before is not None:
+            gc.collect()
+            footprint = gc.mem_alloc() - before
+        else:
+            # No heap counter (e.g. CPython): count the glyph data
+            footprint = len(getattr(module, "_font", b"")) + len(getattr(module, "_sparse", b""))
+        if self.debug:
+            print(f"[DEBUG] loaded font {name}: {footprint} bytes")
+        return module, max(0, footprint)
+
+    def evict(self, family: str, size: int) -> bool:
+        """
+        Unload a font: drop it from the registry, `sys.modules`, its package and the text and glyph caches, then
+        collect garbage.
+
+        :param family: Font family.
+        :type family: str
+        :param size: Font size in pixels.
+        :type size: int
+        :return: True if the font was loaded.
+        :rtype: bool
+        """
+        entry = self._loaded.pop((family, size), None)
+        if entry is None:
+            return False
+        module = entry[0]
+        self.size -= entry[1]
+        self.evictions += 1
+
+        if self.glyph_cache is not None:
+            self.glyph_cache.discard_font(module)
+            wrapper = _INDEXED.get(module)
+            if wrapper is not None:
+                self.glyph_cache.discard_font(wrapper)
+            del wrapper
+        forget_font(module)
+
+        name = module.__name__
+        if self.debug:
+            print(f"[DEBUG] unloaded font {name}: {entry[1]} bytes")
+        sys.modules.pop(name, None)
+        parent, _, leaf = name.rpartition(".")
+        package = sys.modules.get(parent)
+        if package is not None and getattr(package, leaf, None) is module:
+            delattr(package, leaf)
+        del module, entry
+        gc.collect()
+        return True
+
+    def footprint(self) -> dict:
+        """
+        Report the memory each loaded font took when it was imported (heap bytes where `gc.mem_alloc()` exists,
+        otherwise glyph data bytes).
+
+        :return: Mapping of (family, size) to bytes, least recently used first.
+        :rtype: dict
+        """
+        return {key: entry[1] for key, entry in self._loaded.items()}
+
+    def loaded(self) -> list[tuple[str, int]]:
+        """
+        List the loaded fonts.
+
+        :return: (family, size) tuples, least recently used first.
+        :rtype: list
+        """
+        return list(self._loaded)
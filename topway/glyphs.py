@@ -0,0 +1,82 @@
+from collections import OrderedDict
+from framebuf import FrameBuffer, MONO_VLSB
+import micropython
+
+
+class GlyphCache:
+    def __init__(self, budget: int = 4096):
+        """
+        Least-recently-used cache of glyphs wrapped in `FrameBuffer` objects, so text can be drawn with `blit()`.
+
+        `font_to_py -y` glyphs are stored a column at a time (all bytes of column 0, then column 1, ...), while a
+        MONO_VLSB `FrameBuffer` wants a row of page bytes at a time, so glyphs taller than 8 pixels are transposed
+        once when they are cached. Inverted glyphs are cached separately with their bits flipped.
+
+        :param budget: Maximum number of glyph bytes to keep; the least recently used glyphs are dropped to stay under
+            it.
+        :type budget: int
+        """
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self._glyphs = OrderedDict()
+
+    @micropython.native
+    def get(self, font_map: object, char: str, invert: bool = False) -> tuple[FrameBuffer | None, int, int]:
+        """
+        Get a glyph as a `FrameBuffer`, building and caching it if needed.
+
+        :param font_map: Font module with `get_ch(char)` function.
+        :type font_map: object
+        :param char: Character to look up.
+        :type char: str
+        :param invert: True for the inverted glyph (background set, glyph pixels clear).
+        :type invert: bool
+        :return: Tuple of (glyph frame buffer or None if the font has no glyph, height, width).
+        :rtype: tuple
+        """
+        key = (font_map, char, invert)
+        entry = self._glyphs.pop(key, None)
+        if entry is not None:
+            # Re-inserting moves the glyph to the most recently used end
+            self._glyphs[key] = entry
+            self.hits += 1
+            return entry[0], entry[1], entry[2]
+
+        self.misses += 1
+        glyph, glyph_height, glyph_width = font_map.get_ch(char)
+        if glyph is None:
+            return None, glyph_height, glyph_width
+
+        pages = (glyph_height + 7) >> 3
+        buf = bytearray(glyph_width * pages)
+        flip = 0xFF if invert else 0
+        for col in range(glyph_width):
+            src = col * pages
+            for page in range(pages):
+                buf[page * glyph_width + col] = glyph[src + page] ^ flip
+        fb = FrameBuffer(buf, glyph_width, glyph_height, MONO_VLSB)
+
+        size = len(buf)
+        if size <= self.budget:
+            while self.size + size > self.budget:
+                self.size -= self._glyphs.pop(next(iter(self._glyphs)))[3]
+            self._glyphs[key] = (fb, glyph_height, glyph_width, size)
+            self.size += size
+        return fb, glyph_height, glyph_width
+
+    def discard_font(self, font_map: object) -> None:
+        """
+        Drop every cached glyph of a font.
+
+        :param font_map: Font module (or wrapper) the glyphs were drawn with.
+        :type font_map: object
+        """
+        for key in [key for key in self._glyphs if key[0] is font_map]:
+            self.size -= self._glyphs.pop(key)[3]
+
+    def clear(self) -> None:
+        """Drop every cached glyph."""
+        self._glyphs = OrderedDict()
+        self.size = 0
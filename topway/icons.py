@@ -0,0 +1,279 @@
+from .raster import blit_vlsb
+from .rle import RleDecoder, blit_rle
+import micropython
+import struct
+
+
+# Icons are stored as raw page-packed (MONO_VLSB) bytes, the same layout as the display and `framebuf.MONO_VLSB`:
+# byte `page * width + x` holds rows `page * 8` to `page * 8 + 7` of column `x`, least significant bit on top. There is
+# no header; a 64×64 icon is exactly 512 bytes and the size is known from where it lives (e.g. `/weather/64`).
+# `tools/img2vlsb.py` converts the JSON / list-of-lists images into this format.
+#
+# An icon atlas packs a whole set of icons into one file, so swapping icons is a seek and a `readinto()` on a file that
+# stays open instead of opening a file per icon (slow on the ESP32 filesystem, and every open allocates). Layout, all
+# little-endian:
+#
+#   header  8 bytes             magic b"VLA1", icon count (uint16), reserved (uint16)
+#   index   16 bytes per icon   FNV-1a hash of the name (uint32), data offset from the start of the file (uint32),
+#                               width (uint16), height (uint16), format (uint8), 3 padding bytes
+#   data                        icon data, one block per index entry
+#
+# The index is sorted by hash so a lookup is a binary search; names aren't stored, and `tools/build_atlas.py` refuses
+# to build an atlas with two names that hash the same. Format 0 is raw page-packed data as above, format 1 the same
+# data run-length compressed as described in `topway/rle.py`.
+
+ATLAS_MAGIC = b"VLA1"
+ATLAS_HEADER = "<4sHH"
+ATLAS_ENTRY = "<IIHHB3x"
+ATLAS_HEADER_SIZE = 8
+ATLAS_ENTRY_SIZE = 16
+FORMAT_VLSB = 0
+FORMAT_RLE = 1
+
+
+@micropython.native
+def fnv1a(name: str | bytes) -> int:
+    """
+    32-bit FNV-1a hash of an icon name, the key of the atlas index.
+
+    :param name: Icon name.
+    :type name: str | bytes
+    :return: Hash value.
+    :rtype: int
+    """
+    if isinstance(name, str):
+        name = name.encode()
+    h = 0x811C9DC5
+    for b in name:
+        h = ((h ^ b) * 0x01000193) & 0xFFFFFFFF
+    return h
+
+
+def icon_size(width: int, height: int) -> int:
+    """
+    Number of bytes a page-packed image of the given size takes.
+
+    :param width: Image width in pixels.
+    :type width: int
+    :param height: Image height in pixels.
+    :type height: int
+    :return: Size in bytes.
+    :rtype: int
+    """
+    return width * ((height + 7) // 8)
+
+
+@micropython.native
+def pack_vlsb(bitmap: list | tuple[list | tuple[int]]) -> bytearray:
+    """
+    Pack a 2D pixel array (rows of 0/1) into page-packed bytes.
+
+    :param bitmap: List of rows, each a list of binary pixel values.
+    :type bitmap: list | tuple
+    :return: Page-packed image, `icon_size(width, height)` bytes.
+    :rtype: bytearray
+    """
+    height = len(bitmap)
+    width = len(bitmap[0]) if height else 0
+    packed = bytearray(icon_size(width, height))
+    for y in range(height):
+        row = bitmap[y]
+        offset = (y >> 3) * width
+        bit = 1 << (y & 7)
+        for x in range(width):
+            if row[x]:
+                packed[offset + x] |= bit
+    return packed
+
+
+def load_icon(path: str, buf: bytearray | None = None, width: int = 64, height: int = 64) -> bytearray:
+    """
+    Read a page-packed icon file into a buffer with `readinto()`, so no intermediate objects are allocated.
+
+    Keep one buffer per icon slot and pass it back in to swap icons without touching the heap.
+
+    :param path: Path of the icon file.
+    :type path: str
+    :param buf: Buffer to read into, at least `icon_size(width, height)` bytes; allocated if None.
+    :type buf: bytearray | None
+    :param width: Icon width in pixels.
+    :type width: int
+    :param height: Icon height in pixels.
+    :type height: int
+    :return: The buffer holding the icon.
+    :rtype: bytearray
+    :raises ValueError: If the buffer is too small or the file doesn't hold a whole icon.
+    """
+    size = icon_size(width, height)
+    if buf is None:
+        buf = bytearray(size)
+    elif len(buf) < size:
+        raise ValueError(f"Buffer holds {len(buf)} bytes, a {width}x{height} icon needs {size}")
+
+    with open(path, "rb") as f:
+        read = f.readinto(memoryview(buf)[:size])
+    if read != size:
+        raise ValueError(f"{path}: expected {size} bytes for a {width}x{height} icon, read {read}")
+    return buf
+
+
+class IconAtlas:
+    def __init__(self, path: str):
+        """
+        Icons packed into a single atlas file built by `tools/build_atlas.py`.
+
+        The file is opened once and the index is read into memory (16 bytes per icon); loading an icon is then a
+        binary search, a `seek()` and a `readinto()` of a buffer you own, or `blit()` to draw an icon without holding
+        it in memory at all. Call `close()` (or use `with`) when done.
+
+        :param path: Path of the atlas file.
+        :type path: str
+        :raises ValueError: If the file isn't an icon atlas.
+        """
+        self.path = path
+        self._file = open(path, "rb")
+        header = self._file.read(ATLAS_HEADER_SIZE)
+        if len(header) != ATLAS_HEADER_SIZE or header[:4] != ATLAS_MAGIC:
+            self._file.close()
+            raise ValueError(f"{path}: not an icon atlas")
+        self.count = struct.unpack(ATLAS_HEADER, header)[1]
+        self._row = bytearray(0)
+        self._index = self._file.read(self.count * ATLAS_ENTRY_SIZE)
+        if len(self._index) != self.count * ATLAS_ENTRY_SIZE:
+            self._file.close()
+            raise ValueError(f"{path}: index is truncated")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, name: str) -> bool:
+        return self.find(name) is not None
+
+    def __enter__(self) -> "IconAtlas":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the atlas file."""
+        self._file.close()
+
+    @micropython.native
+    def find(self, name: str) -> tuple[int, int, int, int] | None:
+        """
+        Look an icon up in the index.
+
+        :param name: Icon name.
+        :type name: str
+        :return: Tuple of (data offset, width, height, format), or None if the atlas has no such icon.
+        :rtype: tuple | None
+        """
+        key = fnv1a(name)
+        index = self._index
+        lo = 0
+        hi = self.count
+        while lo < hi:
+            mid = (lo + hi) >> 1
+            h = struct.unpack_from("<I", index, mid * ATLAS_ENTRY_SIZE)[0]
+            if h < key:
+                lo = mid + 1
+            elif h > key:
+                hi = mid
+            else:
+                return struct.unpack_from(ATLAS_ENTRY, index, mid * ATLAS_ENTRY_SIZE)[1:]
+        return None
+
+    def size(self, name: str) -> tuple[int, int]:
+        """
+        Get the dimensions of an icon without reading it.
+
+        :param name: Icon name.
+        :type name: str
+        :return: Tuple of (width, height).
+        :rtype: tuple
+        :raises KeyError: If the atlas has no such icon.
+        """
+        entry = self.find(name)
+        if entry is None:
+            raise KeyError(name)
+        return entry[1], entry[2]
+
+    def load(self, name: str, buf: bytearray | None = None) -> tuple[bytearray, int, int]:
+        """
+        Read an icon into a buffer with `seek()` and `readinto()`, decompressing it if it's stored compressed.
+
+        :param name: Icon name.
+        :type name: str
+        :param buf: Buffer to read into, at least `icon_size(width, height)` bytes; allocated if None.
+        :type buf: bytearray | None
+        :return: Tuple of (buffer holding the icon, width, height).
+        :rtype: tuple
+        :raises KeyError: If the atlas has no such icon.
+        :raises ValueError: If the buffer is too small, the format is unknown or the data is truncated.
+        """
+        entry = self.find(name)
+        if entry is None:
+            raise KeyError(name)
+        offset, width, height, fmt = entry
+        if fmt not in (FORMAT_VLSB, FORMAT_RLE):
+            raise ValueError(f"{name}: unsupported icon format {fmt}")
+
+        size = icon_size(width, height)
+        if buf is None:
+            buf = bytearray(size)
+        elif len(buf) < size:
+            raise ValueError(f"Buffer holds {len(buf)} bytes, {name} ({width}x{height}) needs {size}")
+
+        self._file.seek(offset)
+        if fmt == FORMAT_RLE:
+            RleDecoder(self._file).read_into(buf, size)
+            return buf, width, height
+
+        read = self._file.readinto(memoryview(buf)[:size])
+        if read != size:
+            raise ValueError(f"{self.path}: expected {size} bytes for {name}, read {read}")
+        return buf, width, height
+
+    def blit(self, name: str, canvas: object, x: int, y: int, mode: str = "or") -> tuple[int, int]:
+        """
+        Draw an icon straight from the file onto a canvas, a page (8 rows) at a time, without reading the whole icon
+        into memory.
+
+        :param name: Icon name.
+        :type name: str
+        :param canvas: Target `Canvas` (anything with a page-packed `buffer`, `width` and `height`).
+        :type canvas: Canvas
+        :param x: Horizontal offset where the icon starts.
+        :type x: int
+        :param y: Vertical offset where the icon starts.
+        :type y: int
+        :param mode: "or" to set the icon's pixels, "xor" to invert them or "replace" to copy the whole icon area.
+        :type mode: str
+        :return: Tuple of (width, height) of the icon.
+        :rtype: tuple
+        :raises KeyError: If the atlas has no such icon.
+        :raises ValueError: If the format is unknown or the data is truncated.
+        """
+        entry = self.find(name)
+        if entry is None:
+            raise KeyError(name)
+        offset, width, height, fmt = entry
+        if fmt not in (FORMAT_VLSB, FORMAT_RLE):
+            raise ValueError(f"{name}: unsupported icon format {fmt}")
+
+        if len(self._row) < width:
+            self._row = bytearray(width)
+        row = self._row
+        self._file.seek(offset)
+        if fmt == FORMAT_RLE:
+            blit_rle(canvas.buffer, canvas.width, canvas.height, self._file, width, height, x, y, mode, row)
+            return width, height
+
+        view = memoryview(row)[:width]
+        for page in range((height + 7) >> 3):
+            if self._file.readinto(view) != width:
+                raise ValueError(f"{self.path}: data for {name} is truncated")
+            blit_vlsb(canvas.buffer, canvas.width, canvas.height, row, width, min(8, height - page * 8), x,
+                      y + page * 8, mode)
+        return width, height
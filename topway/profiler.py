@@ -0,0 +1,111 @@
+import time
+
+
+# Upper bounds (µs) of the latency histogram buckets; one more bucket counts everything slower than the last bound.
+BUCKETS_US = (100, 250, 500, 1000, 2500, 5000, 10000, 25000, 50000)
+
+
+class Profiler:
+    def __init__(self, buckets: tuple = BUCKETS_US):
+        """
+        Per-method call counts, cumulative and maximum time, and latency histograms for a driver.
+
+        `instrument()` replaces methods on one instance with timing wrappers stored as instance attributes, so the
+        class and any other instance are untouched: a driver created without `profile=True` calls its methods
+        directly, with no wrapper in the way. Times are inclusive, so a method that calls other instrumented
+        methods (`display()` calling `_write_run()`) counts their time too.
+
+        :param buckets: Ascending upper bounds of the histogram buckets, in µs.
+        :type buckets: tuple
+        """
+        self.buckets = tuple(buckets)
+        # Per method: [calls, total µs, max µs, bucket counts...]
+        self.records = {}
+
+    def wrap(self, name: str, func: object) -> object:
+        """
+        Get a function that calls `func` and records its time under `name`.
+
+        :param name: Name to report the calls under.
+        :type name: str
+        :param func: Function or bound method to time.
+        :type func: callable
+        :return: Timing wrapper.
+        :rtype: callable
+        """
+        record = self.records.get(name)
+        if record is None:
+            record = [0] * (4 + len(self.buckets))
+            self.records[name] = record
+        buckets = self.buckets
+        ticks_us = time.ticks_us
+        ticks_diff = time.ticks_diff
+
+        def timed(*args, **kwargs):
+            start = ticks_us()
+            result = func(*args, **kwargs)
+            elapsed = ticks_diff(ticks_us(), start)
+            record[0] += 1
+            record[1] += elapsed
+            if elapsed > record[2]:
+                record[2] = elapsed
+            bucket = 3
+            for bound in buckets:
+                if elapsed < bound:
+                    break
+                bucket += 1
+            record[bucket] += 1
+            return result
+
+        return timed
+
+    def instrument(self, obj: object, names: tuple | list) -> None:
+        """
+        Time calls to some of an object's methods.
+
+        :param obj: Object whose methods to time, e.g. a driver.
+        :type obj: object
+        :param names: Method names.
+        :type names: tuple | list
+        :raises AttributeError: If the object has no such method.
+        """
+        for name in names:
+            setattr(obj, name, self.wrap(name, getattr(obj, name)))
+
+    def reset(self) -> None:
+        """Zero every counter, e.g. between two runs of a benchmark."""
+        for record in self.records.values():
+            for index in range(len(record)):
+                record[index] = 0
+
+    def stats(self) -> dict:
+        """
+        Get the recorded values.
+
+        :return: Mapping of method name to a dict with `calls`, `total_us`, `max_us` and `histogram` (counts per
+            bucket, the last one for calls slower than every bound).
+        :rtype: dict
+        """
+        result = {}
+        for name, record in self.records.items():
+            result[name] = {"calls": record[0], "total_us": record[1], "max_us": record[2],
+                            "histogram": record[3:]}
+        return result
+
+    def report(self) -> None:
+        """Print a table of the called methods, the one that took the most time in total first."""
+        rows = [(record[1], name, record) for name, record in self.records.items() if record[0]]
+        rows.sort(reverse=True)
+
+        labels = ["<" + self._format_us(bound) for bound in self.buckets]
+        labels.append(">=" + self._format_us(self.buckets[-1]))
+        print(f"{'method':<28}{'calls':>8}{'total ms':>11}{'mean us':>10}{'max us':>9}  " +
+              " ".join(f"{label:>7}" for label in labels))
+        for total, name, record in rows:
+            print(f"{name:<28}{record[0]:>8}{total / 1000:>11.1f}{total // record[0]:>10}{record[2]:>9}  " +
+                  " ".join(f"{count:>7}" for count in record[3:]))
+
+    @staticmethod
+    def _format_us(value: int) -> str:
+        """Format a bucket bound, in ms from 1 ms up."""
+        return f"{value // 1000}ms" if value >= 1000 and value % 1000 == 0 else f"{value}us"
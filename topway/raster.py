@@ -0,0 +1,450 @@
+from array import array
+import micropython
+import math
+
+
+# Drawing primitives that work directly on page-packed (MONO_VLSB) buffers: byte `page * width + x` holds rows
+# `page * 8` to `page * 8 + 7` of column `x`, least significant bit on top. Shared by `Canvas` and the framebuf driver.
+
+
+@micropython.native
+def blit_glyph(buf: bytearray, buf_width: int, buf_height: int, glyph: bytes | memoryview, glyph_width: int,
+               glyph_height: int, x: int, y: int, invert: bool = False) -> None:
+    """
+    Draw a vertically mapped glyph (`font_to_py -y`) into a page buffer a byte at a time.
+
+    Each glyph column is `(glyph_height + 7) // 8` bytes, top byte first, the same layout as the display pages. When
+    `y` is a multiple of 8 the bytes are OR'd straight into the pages; otherwise each byte is shifted and split across
+    two pages with a mask.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels (a multiple of 8).
+    :type buf_height: int
+    :param glyph: Glyph column bytes.
+    :type glyph: bytes | memoryview
+    :param glyph_width: Glyph width in pixels.
+    :type glyph_width: int
+    :param glyph_height: Glyph height in pixels.
+    :type glyph_height: int
+    :param x: Horizontal pixel offset of the glyph's left edge.
+    :type x: int
+    :param y: Vertical pixel offset of the glyph's top edge.
+    :type y: int
+    :param invert: If True, clear the glyph's pixels and set its background instead of OR'ing the glyph in.
+    :type invert: bool
+    """
+    bytes_per_column = (glyph_height + 7) >> 3
+    last_mask = (1 << (glyph_height - (bytes_per_column - 1) * 8)) - 1
+    glyph_len = len(glyph)
+    pages = buf_height >> 3
+    first_page = y >> 3
+    shift = y & 7
+
+    for col in range(glyph_width):
+        bx = x + col
+        if bx < 0 or bx >= buf_width:
+            continue
+
+        src = col * bytes_per_column
+        for k in range(bytes_per_column):
+            if src + k >= glyph_len:
+                break
+            mask = 0xFF if k < bytes_per_column - 1 else last_mask
+            bits = glyph[src + k] & mask
+            if invert:
+                bits = ~bits & mask
+
+            page = first_page + k
+            if shift == 0:
+                if 0 <= page < pages:
+                    index = page * buf_width + bx
+                    if invert:
+                        buf[index] = (buf[index] & ~mask) | bits
+                    else:
+                        buf[index] |= bits
+                continue
+
+            bits <<= shift
+            mask <<= shift
+            # Lower part of the byte lands in `page`, the spill-over in `page + 1`
+            if 0 <= page < pages:
+                index = page * buf_width + bx
+                if invert:
+                    buf[index] = (buf[index] & ~(mask & 0xFF)) | (bits & 0xFF)
+                else:
+                    buf[index] |= bits & 0xFF
+            page += 1
+            if mask >> 8 and 0 <= page < pages:
+                index = page * buf_width + bx
+                if invert:
+                    buf[index] = (buf[index] & ~(mask >> 8)) | (bits >> 8)
+                else:
+                    buf[index] |= bits >> 8
+
+
+@micropython.native
+def blit_vlsb(buf: bytearray, buf_width: int, buf_height: int, src: bytes | bytearray | memoryview, src_width: int,
+              src_height: int, x: int, y: int, mode: str = "or") -> None:
+    """
+    Draw a page-packed (MONO_VLSB) image into a page buffer a byte at a time, clipped.
+
+    Source byte `page * src_width + col` holds rows `page * 8` to `page * 8 + 7` of column `col`, the same layout as
+    the target, so with `y` a multiple of 8 every source byte lands on one target byte; otherwise it is shifted and
+    split across two pages.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels (a multiple of 8).
+    :type buf_height: int
+    :param src: Source image bytes.
+    :type src: bytes | bytearray | memoryview
+    :param src_width: Source width in pixels.
+    :type src_width: int
+    :param src_height: Source height in pixels.
+    :type src_height: int
+    :param x: Horizontal pixel offset of the image's left edge.
+    :type x: int
+    :param y: Vertical pixel offset of the image's top edge.
+    :type y: int
+    :param mode: "or" to set the image's pixels, "xor" to invert them or "replace" to copy the whole image area.
+    :type mode: str
+    """
+    if mode not in ("or", "xor", "replace"):
+        raise ValueError(f"Unknown mode: {mode}")
+
+    src_pages = (src_height + 7) >> 3
+    last_mask = (1 << (src_height - (src_pages - 1) * 8)) - 1
+    pages = buf_height >> 3
+    first_page = y >> 3
+    shift = y & 7
+    col_first = max(0, -x)
+    col_last = min(src_width, buf_width - x)
+
+    for k in range(src_pages):
+        mask = 0xFF if k < src_pages - 1 else last_mask
+        row = k * src_width
+        # The lower part of each shifted byte lands in page `first_page + k`, the spill-over in the next one
+        for part in (0, 1):
+            if part and not shift:
+                break
+            target_page = first_page + k + part
+            if not 0 <= target_page < pages:
+                continue
+            part_mask = ((mask << shift) >> (8 * part)) & 0xFF
+            if not part_mask:
+                continue
+            offset = target_page * buf_width + x
+            for col in range(col_first, col_last):
+                bits = (((src[row + col] & mask) << shift) >> (8 * part)) & 0xFF
+                index = offset + col
+                if mode == "or":
+                    buf[index] |= bits
+                elif mode == "xor":
+                    buf[index] ^= bits
+                else:
+                    buf[index] = (buf[index] & ~part_mask) | bits
+
+
+# sin(0°)..sin(90°) in Q14 fixed point (16384 = 1.0); the other quadrants are mirrored from it.
+SIN_Q14 = array("h", [int(round(math.sin(math.radians(deg)) * 16384)) for deg in range(91)])
+
+
+@micropython.native
+def _sin_q14(deg: int) -> int:
+    """Sine of a whole number of degrees in Q14 fixed point."""
+    deg %= 360
+    if deg <= 90:
+        return SIN_Q14[deg]
+    if deg <= 180:
+        return SIN_Q14[180 - deg]
+    if deg <= 270:
+        return -SIN_Q14[deg - 180]
+    return -SIN_Q14[360 - deg]
+
+
+@micropython.native
+def sin_cos_q14(angle_deg: int | float) -> tuple[int, int]:
+    """
+    Look up sine and cosine of an angle in Q14 fixed point (16384 = 1.0).
+
+    Whole degrees come straight from the table; fractional angles are interpolated between the two nearest entries.
+
+    :param angle_deg: Angle in degrees.
+    :type angle_deg: int | float
+    :return: Tuple of (sine, cosine).
+    :rtype: tuple
+    """
+    whole = int(angle_deg // 1)
+    sin = _sin_q14(whole)
+    cos = _sin_q14(whole + 90)
+    if angle_deg != whole:
+        frac = int((angle_deg - whole) * 256)
+        sin += ((_sin_q14(whole + 1) - sin) * frac) >> 8
+        cos += ((_sin_q14(whole + 91) - cos) * frac) >> 8
+    return sin, cos
+
+
+@micropython.native
+def line_end(x0: int, y0: int, angle_deg: int | float, length: int) -> tuple[int, int]:
+    """
+    End point of an `[x, y, angle_deg, length]` line: `length` pixels from (x0, y0), the angle measured
+    counter-clockwise from the positive x-axis.
+
+    :param x0: Start x-coordinate.
+    :type x0: int
+    :param y0: Start y-coordinate.
+    :type y0: int
+    :param angle_deg: Angle in degrees.
+    :type angle_deg: int | float
+    :param length: Line length in pixels, including the start pixel.
+    :type length: int
+    :return: Tuple of (x1, y1).
+    :rtype: tuple
+    """
+    sin, cos = sin_cos_q14(angle_deg)
+    steps = length - 1
+    # + 8192 rounds to nearest; y is negated because it increases downward
+    return x0 + ((cos * steps + 8192) >> 14), y0 - ((sin * steps + 8192) >> 14)
+
+
+@micropython.native
+def fill_rect(buf: bytearray, buf_width: int, buf_height: int, x0: int, y0: int, x1: int, y1: int,
+              mode: str = "or") -> None:
+    """
+    Set, clear or invert the rectangle from (x0, y0) to (x1, y1) inclusive, clipped to the buffer. Nothing is drawn
+    if x1 < x0 or y1 < y0.
+
+    Each page the rectangle touches gets one byte mask (partial at the top and bottom pages, 0xFF in between), so
+    every column costs one byte operation per page instead of one per pixel.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels.
+    :type buf_height: int
+    :param x0: First column.
+    :type x0: int
+    :param y0: First row.
+    :type y0: int
+    :param x1: Last column.
+    :type x1: int
+    :param y1: Last row.
+    :type y1: int
+    :param mode: "or" to set the pixels, "and" to clear them (AND with the inverted mask) or "xor" to invert them.
+    :type mode: str
+    """
+    x0 = max(x0, 0)
+    x1 = min(x1, buf_width - 1)
+    y0 = max(y0, 0)
+    y1 = min(y1, buf_height - 1)
+    if x0 > x1 or y0 > y1:
+        return
+
+    first_page = y0 >> 3
+    last_page = y1 >> 3
+    for page in range(first_page, last_page + 1):
+        mask = 0xFF
+        if page == first_page:
+            mask &= (0xFF << (y0 & 7)) & 0xFF
+        if page == last_page:
+            mask &= 0xFF >> (7 - (y1 & 7))
+
+        offset = page * buf_width
+        if mode == "or":
+            for index in range(offset + x0, offset + x1 + 1):
+                buf[index] |= mask
+        elif mode == "and":
+            keep = ~mask & 0xFF
+            for index in range(offset + x0, offset + x1 + 1):
+                buf[index] &= keep
+        elif mode == "xor":
+            for index in range(offset + x0, offset + x1 + 1):
+                buf[index] ^= mask
+        else:
+            raise ValueError(f"Unknown mode: {mode}")
+
+
+@micropython.native
+def hline(buf: bytearray, buf_width: int, buf_height: int, x0: int, x1: int, y: int) -> None:
+    """
+    Set the pixels of row `y` from `x0` to `x1` inclusive, clipped.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels.
+    :type buf_height: int
+    :param x0: First column.
+    :type x0: int
+    :param x1: Last column.
+    :type x1: int
+    :param y: Row.
+    :type y: int
+    """
+    if x0 > x1:
+        x0, x1 = x1, x0
+    fill_rect(buf, buf_width, buf_height, x0, y, x1, y)
+
+
+@micropython.native
+def vline(buf: bytearray, buf_width: int, buf_height: int, x: int, y0: int, y1: int) -> None:
+    """
+    Set the pixels of column `x` from `y0` to `y1` inclusive, clipped; one byte mask per page.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels.
+    :type buf_height: int
+    :param x: Column.
+    :type x: int
+    :param y0: First row.
+    :type y0: int
+    :param y1: Last row.
+    :type y1: int
+    """
+    if y0 > y1:
+        y0, y1 = y1, y0
+    fill_rect(buf, buf_width, buf_height, x, y0, x, y1)
+
+
+@micropython.native
+def circle_half_heights(radius: int) -> array:
+    """
+    Half-height of a filled midpoint circle at each column offset from its center.
+
+    Column `cx ± a` of the circle covers rows `cy - h[a]` to `cy + h[a]`. By symmetry, row `cy ± b` also covers
+    columns `cx - h[b]` to `cx + h[b]`, so the same table drives vertical or horizontal spans.
+
+    :param radius: Circle radius.
+    :type radius: int
+    :return: Array of `radius + 1` half-heights.
+    :rtype: array
+    """
+    heights = array("H", [0] * (radius + 1))
+    x = radius
+    y = 0
+    d = 1 - radius
+    while x >= y:
+        # Columns out to x reach row y, columns out to y reach row x
+        if y > heights[x]:
+            heights[x] = y
+        if x > heights[y]:
+            heights[y] = x
+
+        y += 1
+        if d < 0:
+            d += 2 * y + 1
+        else:
+            x -= 1
+            d += 2 * (y - x) + 1
+
+    for a in range(radius - 1, -1, -1):
+        if heights[a + 1] > heights[a]:
+            heights[a] = heights[a + 1]
+    return heights
+
+
+@micropython.native
+def line(buf: bytearray, buf_width: int, buf_height: int, x0: int, y0: int, x1: int, y1: int) -> None:
+    """
+    Draw a line between two points with integer Bresenham steps, one pixel per step along the major axis.
+
+    Horizontal and vertical lines go through `hline()` / `vline()`.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels.
+    :type buf_height: int
+    :param x0: Start x-coordinate.
+    :type x0: int
+    :param y0: Start y-coordinate.
+    :type y0: int
+    :param x1: End x-coordinate.
+    :type x1: int
+    :param y1: End y-coordinate.
+    :type y1: int
+    """
+    if y0 == y1:
+        hline(buf, buf_width, buf_height, x0, x1, y0)
+        return
+    if x0 == x1:
+        vline(buf, buf_width, buf_height, x0, y0, y1)
+        return
+
+    dx = abs(x1 - x0)
+    dy = -abs(y1 - y0)
+    sx = 1 if x0 < x1 else -1
+    sy = 1 if y0 < y1 else -1
+    err = dx + dy
+    while True:
+        if 0 <= x0 < buf_width and 0 <= y0 < buf_height:
+            buf[(y0 >> 3) * buf_width + x0] |= 1 << (y0 & 7)
+        if x0 == x1 and y0 == y1:
+            return
+        e2 = 2 * err
+        if e2 >= dy:
+            err += dy
+            x0 += sx
+        if e2 <= dx:
+            err += dx
+            y0 += sy
+
+
+# Corner profiles by radius, shared by every rounded box drawn with that radius.
+_CORNER_PROFILES = {}
+
+
+@micropython.native
+def corner_profile(radius: int) -> tuple[bytearray, bytearray]:
+    """
+    Outline of a midpoint quarter circle as a span per row, computed once per radius and cached.
+
+    Row `b` (0 at the arc's center row, `radius` at its outermost row) of the quarter circle is drawn from `inner[b]`
+    to `outer[b]` pixels away from the center column; a filled corner covers 0 to `outer[b]`.
+
+    :param radius: Corner radius (0–255).
+    :type radius: int
+    :return: Tuple of (outer, inner) offsets, `radius + 1` entries each.
+    :rtype: tuple
+    """
+    profile = _CORNER_PROFILES.get(radius)
+    if profile is not None:
+        return profile
+
+    outer = bytearray(radius + 1)
+    inner = bytearray(b"\xff" * (radius + 1))
+    x = radius
+    y = 0
+    d = 1 - radius
+    while x >= y:
+        # Each step gives a point in both octants of the quadrant
+        if x > outer[y]:
+            outer[y] = x
+        if x < inner[y]:
+            inner[y] = x
+        if y > outer[x]:
+            outer[x] = y
+        if y < inner[x]:
+            inner[x] = y
+
+        y += 1
+        if d < 0:
+            d += 2 * y + 1
+        else:
+            x -= 1
+            d += 2 * (y - x) + 1
+
+    profile = (outer, inner)
+    _CORNER_PROFILES[radius] = profile
+    return profile
@@ -0,0 +1,211 @@
+from .raster import blit_vlsb
+import micropython
+
+
+# Run-length compressed page-packed images. The page-packed (MONO_VLSB) bytes, in their usual order, are split into
+# packets that each start with a control byte `n`:
+#
+#   n < 128     the next n + 1 bytes are copied as they are (1 to 128 literal bytes)
+#   n >= 128    the next byte is repeated n - 126 times (2 to 129 copies)
+#
+# The stream has no header or terminator; it ends once width * pages bytes have been produced, so the size is known
+# from where it lives (a file name or an atlas entry). Blank areas, the bulk of most icons, shrink to 2 bytes per 129.
+
+RLE_CHUNK = 64
+
+
+@micropython.native
+def encode_rle(data: bytes | bytearray | memoryview) -> bytearray:
+    """
+    Compress page-packed bytes.
+
+    Runs of 3 or more bytes become a repeat packet; a run of 2 only does when it doesn't interrupt a literal packet,
+    where it would cost a byte more than leaving it in.
+
+    :param data: Page-packed image bytes.
+    :type data: bytes | bytearray | memoryview
+    :return: Compressed bytes.
+    :rtype: bytearray
+    """
+    out = bytearray()
+    size = len(data)
+    start = 0  # start of the pending literal bytes
+    i = 0
+    while i < size:
+        value = data[i]
+        run = 1
+        while i + run < size and run < 129 and data[i + run] == value:
+            run += 1
+
+        if run >= 3 or (run == 2 and start == i):
+            while start < i:
+                count = min(128, i - start)
+                out.append(count - 1)
+                out.extend(data[start:start + count])
+                start += count
+            out.append(run + 126)
+            out.append(value)
+            i += run
+            start = i
+        else:
+            i += run
+            while i - start >= 128:
+                out.append(127)
+                out.extend(data[start:start + 128])
+                start += 128
+
+    while start < size:
+        count = min(128, size - start)
+        out.append(count - 1)
+        out.extend(data[start:start + count])
+        start += count
+    return out
+
+
+class RleReader:
+    def __init__(self, source: object, chunk: int = RLE_CHUNK):
+        """
+        Hands out compressed bytes one at a time from a bytes-like object or from a stream, which is read a small
+        chunk at a time with `readinto()` so a file is never loaded whole.
+
+        :param source: Compressed bytes, or an open binary file (or anything else with `readinto()`).
+        :type source: object
+        :param chunk: Size of the read buffer used for streams.
+        :type chunk: int
+        """
+        if hasattr(source, "readinto"):
+            self._stream = source
+            self._buf = bytearray(chunk)
+            self._len = 0
+        else:
+            self._stream = None
+            self._buf = source
+            self._len = len(source)
+        self._pos = 0
+
+    @micropython.native
+    def next(self) -> int:
+        """
+        Get the next compressed byte.
+
+        :return: Byte value.
+        :rtype: int
+        :raises ValueError: If the data ends before the image is complete.
+        """
+        if self._pos >= self._len:
+            if self._stream is not None:
+                self._len = self._stream.readinto(self._buf) or 0
+                self._pos = 0
+            if self._pos >= self._len:
+                raise ValueError("Compressed image data is truncated")
+        value = self._buf[self._pos]
+        self._pos += 1
+        return value
+
+
+class RleDecoder:
+    def __init__(self, source: object):
+        """
+        Decompresses a stream into consecutive slices of the page-packed image, keeping only the state of the packet
+        in progress.
+
+        :param source: Compressed bytes or an open binary file, see `RleReader`.
+        :type source: object
+        """
+        self._reader = source if isinstance(source, RleReader) else RleReader(source)
+        self._literal = 0
+        self._repeat = 0
+        self._value = 0
+
+    @micropython.native
+    def read_into(self, out: bytearray | memoryview, count: int) -> None:
+        """
+        Decompress the next `count` image bytes into the start of `out`.
+
+        :param out: Buffer to fill.
+        :type out: bytearray | memoryview
+        :param count: Number of bytes to produce.
+        :type count: int
+        """
+        reader = self._reader
+        i = 0
+        while i < count:
+            if self._repeat:
+                n = min(self._repeat, count - i)
+                value = self._value
+                for j in range(i, i + n):
+                    out[j] = value
+                i += n
+                self._repeat -= n
+            elif self._literal:
+                n = min(self._literal, count - i)
+                for j in range(i, i + n):
+                    out[j] = reader.next()
+                i += n
+                self._literal -= n
+            else:
+                control = reader.next()
+                if control < 128:
+                    self._literal = control + 1
+                else:
+                    self._repeat = control - 126
+                    self._value = reader.next()
+
+
+def decode_rle(source: object, buf: bytearray | memoryview, size: int) -> bytearray | memoryview:
+    """
+    Decompress a whole image into a buffer.
+
+    :param source: Compressed bytes or an open binary file.
+    :type source: object
+    :param buf: Buffer to decompress into, at least `size` bytes.
+    :type buf: bytearray | memoryview
+    :param size: Size of the page-packed image, `icon_size(width, height)`.
+    :type size: int
+    :return: The buffer.
+    :rtype: bytearray | memoryview
+    """
+    RleDecoder(source).read_into(buf, size)
+    return buf
+
+
+@micropython.native
+def blit_rle(buf: bytearray, buf_width: int, buf_height: int, source: object, src_width: int, src_height: int,
+             x: int, y: int, mode: str = "or", row: bytearray | None = None) -> None:
+    """
+    Decompress an image straight into a page buffer, one source page (8 rows) at a time, so only `src_width` bytes
+    of it are held in memory at once.
+
+    :param buf: Target page buffer.
+    :type buf: bytearray
+    :param buf_width: Width of the target in pixels.
+    :type buf_width: int
+    :param buf_height: Height of the target in pixels (a multiple of 8).
+    :type buf_height: int
+    :param source: Compressed bytes or an open binary file positioned at the start of the image.
+    :type source: object
+    :param src_width: Image width in pixels.
+    :type src_width: int
+    :param src_height: Image height in pixels.
+    :type src_height: int
+    :param x: Horizontal pixel offset of the image's left edge.
+    :type x: int
+    :param y: Vertical pixel offset of the image's top edge.
+    :type y: int
+    :param mode: "or" to set the image's pixels, "xor" to invert them or "replace" to copy the whole image area.
+    :type mode: str
+    :param row: Scratch buffer of at least `src_width` bytes; allocated if None.
+    :type row: bytearray | None
+    """
+    if mode not in ("or", "xor", "replace"):
+        raise ValueError(f"Unknown mode: {mode}")
+    if row is None:
+        row = bytearray(src_width)
+
+    decoder = RleDecoder(source)
+    for page in range((src_height + 7) >> 3):
+        top = y + page * 8
+        if top >= buf_height:
+            break  # The rest of the image is below the target, no need to decompress it
+        decoder.read_into(row, src_width)
+        blit_vlsb(buf, buf_width, buf_height, row, src_width, min(8, src_height - page * 8), x, top, mode)
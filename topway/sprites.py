@@ -0,0 +1,126 @@
+from collections import OrderedDict
+import micropython
+
+
+def sprite_size(sprite: object) -> int:
+    """
+    Approximate heap bytes a sprite takes, used to keep a `SpriteCache` under its budget.
+
+    Packed buffers count their length; a `Canvas` counts its buffer; a tuple such as `IconAtlas.load()`'s
+    (buffer, width, height) counts its buffers; a list of rows counts one 4-byte slot per pixel and per row, which is
+    what a list takes on a 32-bit port.
+
+    :param sprite: Packed buffer, `Canvas`, tuple holding buffers, or list of rows.
+    :type sprite: object
+    :return: Size in bytes.
+    :rtype: int
+    """
+    if isinstance(sprite, (bytes, bytearray, memoryview)):
+        return len(sprite)
+    if isinstance(sprite, tuple):
+        return sum(sprite_size(item) for item in sprite if not isinstance(item, int))
+    if isinstance(sprite, list):
+        return 4 * (len(sprite) + sum(len(row) for row in sprite))
+    buffer = getattr(sprite, "buffer", None)
+    if buffer is not None:
+        return len(buffer)
+    raise TypeError(f"Can't size a sprite of type {type(sprite).__name__}")
+
+
+class SpriteCache:
+    def __init__(self, budget: int = 4096, loader: object = None):
+        """
+        Least-recently-used cache of sprites (icons, images, pre-rendered screens) keyed by name, so switching back
+        and forth between a handful of assets doesn't go back to the filesystem every time.
+
+        Sprites can be packed buffers, `(buffer, width, height)` tuples as returned by `IconAtlas.load()`, `Canvas`
+        objects or lists of rows; see `sprite_size()` for how each one is counted against the budget.
+
+        :param budget: Maximum number of sprite bytes to keep; the least recently used sprites are evicted to stay
+            under it.
+        :type budget: int
+        :param loader: Default function called as `loader(name)` to load a sprite that isn't cached, e.g.
+            `IconAtlas("/weather/64.atlas").load`. It must return a new object for every call, not a shared buffer.
+        :type loader: callable
+        """
+        self.budget = budget
+        self.loader = loader
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._sprites = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._sprites
+
+    @micropython.native
+    def get(self, name: str, loader: object = None) -> object:
+        """
+        Get a sprite, loading and caching it if needed.
+
+        :param name: Sprite name.
+        :type name: str
+        :param loader: Function to load the sprite with instead of the cache's default loader.
+        :type loader: callable
+        :return: The sprite, or None if it isn't cached and there's no loader.
+        :rtype: object
+        """
+        entry = self._sprites.pop(name, None)
+        if entry is not None:
+            # Re-inserting moves the sprite to the most recently used end
+            self._sprites[name] = entry
+            self.hits += 1
+            return entry[0]
+
+        self.misses += 1
+        if loader is None:
+            loader = self.loader
+        if loader is None:
+            return None
+        sprite = loader(name)
+        self.put(name, sprite)
+        return sprite
+
+    def put(self, name: str, sprite: object, size: int | None = None) -> None:
+        """
+        Add or replace a sprite, evicting the least recently used ones to make room. Sprites larger than the whole
+        budget are not cached.
+
+        :param name: Sprite name.
+        :type name: str
+        :param sprite: The sprite.
+        :type sprite: object
+        :param size: Size to count against the budget; worked out with `sprite_size()` if None.
+        :type size: int | None
+        """
+        self.discard(name)
+        if size is None:
+            size = sprite_size(sprite)
+        if size > self.budget:
+            return
+
+        while self.size + size > self.budget:
+            self.size -= self._sprites.pop(next(iter(self._sprites)))[1]
+            self.evictions += 1
+        self._sprites[name] = (sprite, size)
+        self.size += size
+
+    def discard(self, name: str) -> None:
+        """
+        Drop a sprite if it's cached.
+
+        :param name: Sprite name.
+        :type name: str
+        """
+        entry = self._sprites.pop(name, None)
+        if entry is not None:
+            self.size -= entry[1]
+
+    def clear(self) -> None:
+        """Drop every cached sprite."""
+        self._sprites = OrderedDict()
+        self.size = 0
@@ -0,0 +1,90 @@
+import gc
+import micropython
+import time
+
+
+class FlushStats:
+    # Per-frame values, in the order `as_dict()` and `repr()` list them.
+    FIELDS = ("bytes", "commands", "cs_switches", "direction_changes", "elapsed_us", "allocated")
+
+    def __init__(self):
+        """
+        Bus traffic, time and heap used by the last flush (`display()` or `display_bitmap()`).
+
+        The driver calls `begin()` and `end()` around every flush, which only read the bus's running counters,
+        `time.ticks_us()` and `gc.mem_alloc()`, so it can stay on in production. The values are replaced by each
+        flush; `frames` counts the flushes measured so far. Values can be read as attributes or by key, e.g.
+        `lcd.last_flush.bytes` or `lcd.last_flush["bytes"]`.
+
+        `allocated` is the change in `gc.mem_alloc()` and is negative if a garbage collection ran during the flush;
+        it stays 0 where `gc.mem_alloc()` does not exist (CPython).
+        """
+        self.frames = 0
+        self.bytes = 0
+        self.commands = 0
+        self.cs_switches = 0
+        self.direction_changes = 0
+        self.elapsed_us = 0
+        self.allocated = 0
+
+        self._mem_alloc = getattr(gc, "mem_alloc", None)
+        self._bytes = 0
+        self._commands = 0
+        self._cs_switches = 0
+        self._direction_changes = 0
+        self._start = 0
+        self._heap = 0
+
+    @micropython.native
+    def begin(self, bus: object) -> None:
+        """
+        Take a snapshot of the bus counters, the time and the heap before a flush.
+
+        :param bus: Bus the flush goes through.
+        :type bus: object
+        """
+        self._bytes = bus.bytes_sent
+        self._commands = bus.commands_sent
+        self._cs_switches = bus.cs_switches
+        self._direction_changes = bus.direction_changes
+        if self._mem_alloc is not None:
+            self._heap = self._mem_alloc()
+        self._start = time.ticks_us()
+
+    @micropython.native
+    def end(self, bus: object) -> None:
+        """
+        Store what changed since `begin()`.
+
+        :param bus: Bus the flush went through.
+        :type bus: object
+        """
+        self.elapsed_us = time.ticks_diff(time.ticks_us(), self._start)
+        if self._mem_alloc is not None:
+            self.allocated = self._mem_alloc() - self._heap
+        self.bytes = bus.bytes_sent - self._bytes
+        self.commands = bus.commands_sent - self._commands
+        self.cs_switches = bus.cs_switches - self._cs_switches
+        self.direction_changes = bus.direction_changes - self._direction_changes
+        self.frames += 1
+
+    def __getitem__(self, key: str) -> int:
+        if key not in self.FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def as_dict(self) -> dict:
+        """
+        Get the values of the last flush, e.g. to send to a monitoring system.
+
+        :return: Mapping of field name to value, plus `frames`.
+        :rtype: dict
+        """
+        result = {"frames": self.frames}
+        for name in self.FIELDS:
+            result[name] = getattr(self, name)
+        return result
+
+    def __repr__(self) -> str:
+        values = ", ".join("{}={}".format(name, getattr(self, name)) for name in self.FIELDS)
+        return f"FlushStats({values})"
@@ -0,0 +1,211 @@
+from array import array
+import micropython
+
+# Printable ASCII, the range most labels stay in; it gets a flat width table per font.
+DENSE_FIRST = 32
+DENSE_LAST = 126
+
+# font module -> (first code point, array of advance widths, dict of widths outside the array)
+_ADVANCES = {}
+
+# font module -> IndexedFont
+_INDEXED = {}
+
+
+class IndexedFont:
+    def __init__(self, font_map: object):
+        """
+        Wraps a `font_to_py` font module with a flat glyph index, so `get_ch()` doesn't binary search the font's
+        `_sparse` table (slicing memoryviews at every step) for every character drawn.
+
+        The printable ASCII range gets an `array('H')` of glyph offsets, read once from `_sparse`, and each glyph's
+        (memoryview, height, width) tuple is cached the first time it's drawn. Other code points go through the
+        module's own `get_ch()` and are cached too. Fonts without a `_sparse` table just get the caching. Every other
+        attribute (`height()`, `baseline()`, ...) comes from the module, so the wrapper can be passed anywhere a font
+        module is expected.
+
+        :param font_map: Font module generated by `font_to_py`.
+        :type font_map: object
+        """
+        self.font = font_map
+        self._first = max(DENSE_FIRST, font_map.min_ch()) if hasattr(font_map, "min_ch") else DENSE_FIRST
+        last = min(DENSE_LAST, font_map.max_ch()) if hasattr(font_map, "max_ch") else DENSE_LAST
+        self._count = max(0, last - self._first + 1)
+        self._glyphs = [None] * self._count
+        self._extra = {}
+        self._height = font_map.height()
+        self._mvfont = getattr(font_map, "_mvfont", None)
+        sparse = getattr(font_map, "_sparse", None)
+        self._index = None
+        if self._mvfont is not None and sparse is not None:
+            self._index = self._build_index(sparse)
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.font, name)
+
+    def _build_index(self, sparse: bytes) -> array:
+        """
+        Read the offsets of the dense range from the `_sparse` table of (code point, offset / 8) uint16 pairs.
+        Characters the font doesn't have keep offset 0, the font's default glyph, as the module's search returns.
+        """
+        index = array("H", bytes(2 * self._count))
+        first = self._first
+        count = self._count
+        for i in range(0, len(sparse), 4):
+            code = sparse[i] | (sparse[i + 1] << 8)
+            if first <= code < first + count:
+                index[code - first] = sparse[i + 2] | (sparse[i + 3] << 8)
+        return index
+
+    @micropython.native
+    def get_ch(self, ch: str) -> tuple[memoryview, int, int]:
+        """
+        Look up a glyph, same as the font module's `get_ch()`.
+
+        :param ch: Character to look up.
+        :type ch: str
+        :return: Tuple of (glyph data, height, width).
+        :rtype: tuple
+        """
+        i = ord(ch) - self._first
+        if 0 <= i < self._count:
+            glyph = self._glyphs[i]
+            if glyph is None:
+                if self._index is None:
+                    glyph = self.font.get_ch(ch)
+                else:
+                    mvfont = self._mvfont
+                    doff = self._index[i] << 3
+                    width = mvfont[doff] | (mvfont[doff + 1] << 8)
+                    size = ((self._height - 1) // 8 + 1) * width
+                    glyph = (mvfont[doff + 2:doff + 2 + size], self._height, width)
+                self._glyphs[i] = glyph
+            return glyph
+
+        glyph = self._extra.get(ch)
+        if glyph is None:
+            glyph = self.font.get_ch(ch)
+            self._extra[ch] = glyph
+        return glyph
+
+
+def indexed_font(font_map: object) -> IndexedFont:
+    """
+    Get the `IndexedFont` wrapper of a font module, creating it on first use so every caller shares one index.
+
+    :param font_map: Font module generated by `font_to_py`, or an `IndexedFont` (returned as is).
+    :type font_map: object
+    :return: The wrapper.
+    :rtype: IndexedFont
+    """
+    if isinstance(font_map, IndexedFont):
+        return font_map
+    font = _INDEXED.get(font_map)
+    if font is None:
+        font = IndexedFont(font_map)
+        _INDEXED[font_map] = font
+    return font
+
+
+def forget_font(font_map: object) -> None:
+    """
+    Drop the index and width table kept for a font, so an unloaded font module can be garbage collected.
+
+    :param font_map: Font module or its `IndexedFont` wrapper.
+    :type font_map: object
+    """
+    if isinstance(font_map, IndexedFont):
+        font_map = font_map.font
+    wrapper = _INDEXED.pop(font_map, None)
+    _ADVANCES.pop(font_map, None)
+    if wrapper is not None:
+        _ADVANCES.pop(wrapper, None)
+
+
+def advance_widths(font_map: object) -> tuple[int, array, dict]:
+    """
+    Get a font's advance-width table, building it the first time the font is measured.
+
+    Widths of the font's printable ASCII characters are looked up once with `get_ch()` and kept in an `array('B')`;
+    other characters are looked up when first measured and kept in a dict next to it.
+
+    :param font_map: Font module with `get_ch(char)` function.
+    :type font_map: object
+    :return: Tuple of (code point of the first array entry, widths array, dict of other widths by code point).
+    :rtype: tuple
+    """
+    table = _ADVANCES.get(font_map)
+    if table is None:
+        first = max(DENSE_FIRST, font_map.min_ch()) if hasattr(font_map, "min_ch") else DENSE_FIRST
+        last = min(DENSE_LAST, font_map.max_ch()) if hasattr(font_map, "max_ch") else DENSE_LAST
+        widths = array("B", (font_map.get_ch(chr(code))[2] for code in range(first, last + 1)))
+        table = (first, widths, {})
+        _ADVANCES[font_map] = table
+    return table
+
+
+@micropython.native
+def text_width(font_map: object, text: str, spacing: int = 1) -> int:
+    """
+    Measure how far `draw_text()` moves the cursor for a string: the sum of the glyph widths plus `spacing` after
+    every character, so the next string drawn at `x + text_width(...)` lines up exactly.
+
+    Costs one array lookup per character once the font's table is built.
+
+    :param font_map: Font module with `get_ch(char)` function.
+    :type font_map: object
+    :param text: String to measure.
+    :type text: str
+    :param spacing: Horizontal space between characters, as passed to `draw_text()` (default: 1).
+    :type spacing: int
+    :return: Advance in pixels.
+    :rtype: int
+    """
+    first, widths, extra = advance_widths(font_map)
+    count = len(widths)
+    width = 0
+    for char in text:
+        code = ord(char)
+        i = code - first
+        if 0 <= i < count:
+            width += widths[i]
+        else:
+            w = extra.get(code)
+            if w is None:
+                w = font_map.get_ch(char)[2]
+                extra[code] = w
+            width += w
+        width += spacing
+    return width
+
+
+def text_bbox(font_map: object, text: str, x: int = 0, y: int = 0, spacing: int = 1,
+              align: str = "left") -> tuple[int, int, int, int]:
+    """
+    Get the box a string covers when drawn, for placing right-aligned and centred labels.
+
+    The width leaves out the spacing after the last character, unlike `text_width()`.
+
+    :param font_map: Font module with `get_ch(char)` and `height()` functions.
+    :type font_map: object
+    :param text: String to measure.
+    :type text: str
+    :param x: Left edge for "left", centre for "center" or right edge for "right" alignment.
+    :type x: int
+    :param y: Top edge.
+    :type y: int
+    :param spacing: Horizontal space between characters, as passed to `draw_text()` (default: 1).
+    :type spacing: int
+    :param align: "left", "center" or "right".
+    :type align: str
+    :return: Tuple of (left, top, width, height); pass left and top to `draw_text()`.
+    :rtype: tuple
+    """
+    width = text_width(font_map, text, spacing) - spacing if text else 0
+    if align == "right":
+        x -= width
+    elif align == "center":
+        x -= width // 2
+    elif align != "left":
+        raise ValueError(f"Unknown alignment: {align}")
+    return x, y, width, font_map.height()
@@ -0,0 +1,284 @@
+from array import array
+import micropython
+import struct
+import time
+
+
+# Trace entries are 16 bits: the event kind in the high byte and its value in the low byte.
+CMD = 0  # instruction byte written (RS low)
+DATA = 1  # display data byte written (RS high)
+CS = 2  # chip select changed, value is the region
+DIR = 3  # data pins switched, value 1 for inputs and 0 for outputs
+READ = 4  # display data byte read
+STATUS = 5  # status byte read
+FRAME = 6  # frame boundary marked by the application, value is the frame number modulo 256
+
+KIND_NAMES = ("cmd", "data", "cs", "dir", "read", "status", "frame")
+
+# File layout: magic, flags (bit 0: timestamps follow the entries), entry count, then the entries as uint16 and, with
+# timestamps, as many uint32 `ticks_us()` values. The arrays are written as they are in memory, so all the supported
+# chips (little-endian) read each other's traces.
+TRACE_MAGIC = b"TWBT"
+TRACE_HEADER = "<4sHI"
+TRACE_HEADER_SIZE = 10
+
+
+class RecordingBus:
+    def __init__(self, bus: object, capacity: int = 8192, timestamps: bool = False):
+        """
+        Bus wrapper that records every command and data byte, chip-select change, data pin direction switch and read
+        into a ring buffer while passing them on to the wrapped bus, so a sequence of frames can be measured exactly
+        and replayed later with `replay()`.
+
+        Each event takes 2 bytes (6 with timestamps); once `capacity` events are recorded the oldest are overwritten
+        and counted in `dropped`. Everything else (`bytes_sent`, `invalidate()`, the pins, ...) goes to the wrapped
+        bus, so it can replace a driver's bus as is: `lcd.bus = RecordingBus(lcd.bus)`.
+
+        :param bus: `PinBus` or `RegisterBus` to record.
+        :type bus: object
+        :param capacity: Number of events kept.
+        :type capacity: int
+        :param timestamps: True to record `time.ticks_us()` with every event.
+        :type timestamps: bool
+        """
+        self.bus = bus
+        self.capacity = capacity
+        self.entries = array("H", bytes(2 * capacity))
+        self.stamps = array("I", bytes(4 * capacity)) if timestamps else None
+        self.recorded = 0
+        self.dropped = 0
+        self.frames = 0
+        self._region = -1
+
+    def __getattr__(self, name: str) -> object:
+        return getattr(self.bus, name)
+
+    @micropython.native
+    def record(self, kind: int, value: int) -> None:
+        """
+        Append an event to the ring buffer.
+
+        :param kind: Event kind (`CMD`, `DATA`, ...).
+        :type kind: int
+        :param value: Byte value.
+        :type value: int
+        """
+        index = self.recorded % self.capacity
+        self.entries[index] = (kind << 8) | (value & 0xFF)
+        if self.stamps is not None:
+            self.stamps[index] = time.ticks_us() & 0xFFFFFFFF
+        self.recorded += 1
+        if self.recorded > self.capacity:
+            self.dropped += 1
+
+    def clear(self) -> None:
+        """Drop every recorded event."""
+        self.recorded = 0
+        self.dropped = 0
+        self.frames = 0
+        self._region = -1
+
+    def mark_frame(self) -> None:
+        """Record a frame boundary, e.g. after each `display()`, so traffic can be split per frame."""
+        self.record(FRAME, self.frames)
+        self.frames += 1
+
+    def select(self, region: int) -> None:
+        if region != self._region:
+            self.record(CS, region)
+            self._region = region
+        self.bus.select(region)
+
+    def invalidate(self) -> None:
+        self._region = -1
+        self.bus.invalidate()
+
+    def write(self, value: int, rs: int) -> None:
+        self.record(DATA if rs else CMD, value)
+        self.bus.write(value, rs)
+
+    @micropython.native
+    def write_data(self, buf: bytes | bytearray | memoryview, start: int, length: int) -> None:
+        for index in range(start, start + length):
+            self.record(DATA, buf[index])
+        self.bus.write_data(buf, start, length)
+
+    def read(self) -> int:
+        value = self.bus.read()
+        self.record(READ, value)
+        return value
+
+    def get_data(self) -> int:
+        # Only status reads sample the pins directly, data reads go through read()
+        value = self.bus.get_data()
+        self.record(STATUS, value)
+        return value
+
+    def set_inputs(self) -> None:
+        self.record(DIR, 1)
+        self.bus.set_inputs()
+
+    def set_outputs(self) -> None:
+        self.record(DIR, 0)
+        self.bus.set_outputs()
+
+    def events(self) -> tuple[array, array | None]:
+        """
+        Get the recorded events oldest first.
+
+        :return: Tuple of (entries, timestamps or None).
+        :rtype: tuple
+        """
+        count = min(self.recorded, self.capacity)
+        start = self.recorded % self.capacity if self.recorded > self.capacity else 0
+        entries = array("H", bytes(2 * count))
+        stamps = array("I", bytes(4 * count)) if self.stamps is not None else None
+        for i in range(count):
+            entries[i] = self.entries[(start + i) % self.capacity]
+            if stamps is not None:
+                stamps[i] = self.stamps[(start + i) % self.capacity]
+        return entries, stamps
+
+    def export(self, path: str) -> int:
+        """
+        Write the recorded events to a file for `load()` and `replay()`.
+
+        :param path: File to write.
+        :type path: str
+        :return: Number of events written.
+        :rtype: int
+        """
+        count = min(self.recorded, self.capacity)
+        # Oldest first straight from the ring buffer: the part after the write position, then the part before it
+        split = self.recorded % self.capacity if self.recorded > self.capacity else 0
+        with open(path, "wb") as f:
+            f.write(struct.pack(TRACE_HEADER, TRACE_MAGIC, 1 if self.stamps is not None else 0, count))
+            for ring in (self.entries, self.stamps):
+                if ring is None:
+                    continue
+                view = memoryview(ring)
+                f.write(view[split:count])
+                f.write(view[:split])
+        return count
+
+
+def load(path: str) -> tuple[array, array | None]:
+    """
+    Read a trace written by `RecordingBus.export()`.
+
+    :param path: Trace file.
+    :type path: str
+    :return: Tuple of (entries, timestamps or None).
+    :rtype: tuple
+    :raises ValueError: If the file isn't a trace or is truncated.
+    """
+    with open(path, "rb") as f:
+        header = f.read(TRACE_HEADER_SIZE)
+        if len(header) != TRACE_HEADER_SIZE or header[:4] != TRACE_MAGIC:
+            raise ValueError(f"{path}: not a bus trace")
+        _, flags, count = struct.unpack(TRACE_HEADER, header)
+        entries = array("H", bytes(2 * count))
+        if f.readinto(entries) != 2 * count:
+            raise ValueError(f"{path}: trace is truncated")
+        stamps = None
+        if flags & 1:
+            stamps = array("I", bytes(4 * count))
+            if f.readinto(stamps) != 4 * count:
+                raise ValueError(f"{path}: timestamps are truncated")
+    return entries, stamps
+
+
+def summarize(entries: array) -> list[dict]:
+    """
+    Count the bus traffic between frame markers.
+
+    :param entries: Trace entries, oldest first.
+    :type entries: array
+    :return: One dict per frame (and one for anything after the last marker) with a count per event kind.
+    :rtype: list
+    """
+    frames = []
+    counts = dict.fromkeys(KIND_NAMES[:FRAME], 0)
+    for entry in entries:
+        kind = entry >> 8
+        if kind == FRAME:
+            frames.append(counts)
+            counts = dict.fromkeys(KIND_NAMES[:FRAME], 0)
+        else:
+            counts[KIND_NAMES[kind]] += 1
+    if any(counts.values()):
+        frames.append(counts)
+    return frames
+
+
+def replay(entries: array, bus: object, stamps: array | None = None, on_frame: object = None) -> dict:
+    """
+    Send a recorded trace to a bus: a real panel, or the emulator on the host.
+
+    Runs of data bytes are sent with one `write_data()` call. Reads are repeated (their values are not compared) so
+    the bus sees the same traffic. With timestamps, the gaps between frames are reproduced with `time.sleep_us()`.
+
+    :param entries: Trace entries, oldest first.
+    :type entries: array
+    :param bus: Bus to replay on, e.g. `lcd.bus`.
+    :type bus: object
+    :param stamps: Timestamps to pace the replay with, or None to replay as fast as possible.
+    :type stamps: array | None
+    :param on_frame: Function called with the frame number at every frame marker.
+    :type on_frame: callable
+    :return: Count per event kind.
+    :rtype: dict
+    """
+    counts = dict.fromkeys(KIND_NAMES, 0)
+    run = bytearray(64)
+    length = 0
+    last_frame_stamp = None
+    bus.invalidate()
+
+    for i in range(len(entries) + 1):
+        entry = entries[i] if i < len(entries) else 0xFFFF
+        kind = entry >> 8
+        value = entry & 0xFF
+        if kind == DATA:
+            if length == len(run):
+                bus.write_data(run, 0, length)
+                length = 0
+            run[length] = value
+            length += 1
+            counts["data"] += 1
+            continue
+        if length:
+            bus.write_data(run, 0, length)
+            length = 0
+        if i == len(entries):
+            break
+
+        counts[KIND_NAMES[kind]] += 1
+        if kind == CMD:
+            bus.write(value, 0)
+        elif kind == CS:
+            bus.select(value)
+        elif kind == DIR:
+            if value:
+                bus.set_inputs()
+            else:
+                bus.set_outputs()
+        elif kind == READ:
+            bus.read()
+        elif kind == STATUS:
+            bus.set_mode(0, 1)
+            bus.e.on()
+            bus.get_data()
+            bus.e.off()
+        elif kind == FRAME:
+            if stamps is not None:
+                if last_frame_stamp is not None:
+                    gap = time.ticks_diff(stamps[i], last_frame_stamp)
+                    if gap > 0:
+                        time.sleep_us(gap)
+                last_frame_stamp = stamps[i]
+            if on_frame is not None:
+                on_frame(value)
+
+    bus.invalidate()
+    return counts